@@ -0,0 +1,28 @@
+"""add mock response variants
+
+Revision ID: 0a7c4e9b2d18
+Revises: f3b9d7c2a586
+Create Date: 2026-10-18 21:37:58.240915
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0a7c4e9b2d18'
+down_revision = 'f3b9d7c2a586'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('mock_apis', sa.Column('response_variants', sa.JSON(), nullable=True, comment='加权响应变体'))
+    op.add_column('mock_apis', sa.Column('variant_seed', sa.Integer(), nullable=True, comment='变体选择的随机种子，为空表示不固定'))
+    op.add_column('request_logs', sa.Column('variant', sa.String(length=100), nullable=True, comment='命中的响应变体'))
+
+
+def downgrade() -> None:
+    op.drop_column('request_logs', 'variant')
+    op.drop_column('mock_apis', 'variant_seed')
+    op.drop_column('mock_apis', 'response_variants')
@@ -0,0 +1,24 @@
+"""add category record mode
+
+Revision ID: 2c8f4a6d1e39
+Revises: 6d1b9e3f5a72
+Create Date: 2026-10-18 23:02:41.703158
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2c8f4a6d1e39'
+down_revision = '6d1b9e3f5a72'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('categories', sa.Column('record_mode', sa.Boolean(), server_default=sa.false(), nullable=True, comment='是否录制上游的完整响应'))
+
+
+def downgrade() -> None:
+    op.drop_column('categories', 'record_mode')
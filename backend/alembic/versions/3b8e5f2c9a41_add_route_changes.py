@@ -0,0 +1,33 @@
+"""add route changes
+
+Revision ID: 3b8e5f2c9a41
+Revises: 7015c4db4275
+Create Date: 2026-10-18 10:12:31.482913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b8e5f2c9a41'
+down_revision = '7015c4db4275'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('route_changes',
+    sa.Column('mock_api_id', sa.Integer(), nullable=False, comment='变更的Mock接口ID'),
+    sa.Column('version', sa.Integer(), nullable=True, comment='变更后的版本号，删除时为空'),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_route_changes_id'), 'route_changes', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_route_changes_id'), table_name='route_changes')
+    op.drop_table('route_changes')
@@ -0,0 +1,24 @@
+"""add request log created_at index
+
+Revision ID: 47c257d514e4
+Revises: 2c8f4a6d1e39
+Create Date: 2026-10-19 00:14:27.381905
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '47c257d514e4'
+down_revision = '2c8f4a6d1e39'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_request_logs_created_at_id', 'request_logs', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_request_logs_created_at_id', table_name='request_logs')
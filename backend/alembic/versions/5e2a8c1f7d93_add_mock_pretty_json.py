@@ -0,0 +1,24 @@
+"""add mock pretty json
+
+Revision ID: 5e2a8c1f7d93
+Revises: 9c4d1e7a2b60
+Create Date: 2026-10-18 14:21:09.318256
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e2a8c1f7d93'
+down_revision = '9c4d1e7a2b60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('mock_apis', sa.Column('pretty_json', sa.Boolean(), server_default=sa.false(), nullable=True, comment='响应体是否格式化输出'))
+
+
+def downgrade() -> None:
+    op.drop_column('mock_apis', 'pretty_json')
@@ -0,0 +1,26 @@
+"""add category upstream
+
+Revision ID: 6d1b9e3f5a72
+Revises: 0a7c4e9b2d18
+Create Date: 2026-10-18 22:14:06.518327
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6d1b9e3f5a72'
+down_revision = '0a7c4e9b2d18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('categories', sa.Column('upstream_url', sa.String(length=500), nullable=True, comment='上游服务地址'))
+    op.add_column('categories', sa.Column('path_prefix', sa.String(length=500), nullable=True, comment='转发到上游的请求路径前缀'))
+
+
+def downgrade() -> None:
+    op.drop_column('categories', 'path_prefix')
+    op.drop_column('categories', 'upstream_url')
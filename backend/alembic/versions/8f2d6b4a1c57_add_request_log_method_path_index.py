@@ -0,0 +1,24 @@
+"""add request log method path index
+
+Revision ID: 8f2d6b4a1c57
+Revises: 47c257d514e4
+Create Date: 2026-10-19 09:42:11.508214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8f2d6b4a1c57'
+down_revision = '47c257d514e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_request_logs_method_path', 'request_logs', ['request_method', 'request_path'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_request_logs_method_path', table_name='request_logs')
@@ -0,0 +1,28 @@
+"""add mock log capture policy
+
+Revision ID: 9c4d1e7a2b60
+Revises: 3b8e5f2c9a41
+Create Date: 2026-10-18 11:03:47.120584
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4d1e7a2b60'
+down_revision = '3b8e5f2c9a41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('mock_apis', sa.Column('log_level', sa.Enum('OFF', 'METADATA', 'HEADERS', 'FULL', name='logcapturelevel'), server_default='FULL', nullable=False, comment='日志采集级别'))
+    op.add_column('mock_apis', sa.Column('log_sample_rate', sa.Integer(), server_default='1', nullable=True, comment='日志采样率（每N次请求记录1次）'))
+    op.add_column('mock_apis', sa.Column('log_errors_always', sa.Boolean(), server_default=sa.true(), nullable=True, comment='非2xx响应是否始终记录'))
+
+
+def downgrade() -> None:
+    op.drop_column('mock_apis', 'log_errors_always')
+    op.drop_column('mock_apis', 'log_sample_rate')
+    op.drop_column('mock_apis', 'log_level')
@@ -0,0 +1,32 @@
+"""add mock network simulation
+
+Revision ID: b71f3d9e4c25
+Revises: 5e2a8c1f7d93
+Create Date: 2026-10-18 17:05:32.604117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b71f3d9e4c25'
+down_revision = '5e2a8c1f7d93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('mock_apis', sa.Column('latency_profile', sa.Enum('NONE', 'FIXED', 'UNIFORM', 'NORMAL', 'EMPIRICAL', name='latencyprofile'), server_default='NONE', nullable=False, comment='延迟模拟方式'))
+    op.add_column('mock_apis', sa.Column('latency_ms', sa.Integer(), nullable=True, comment='延迟（毫秒）：固定值/均匀分布下限/正态分布均值'))
+    op.add_column('mock_apis', sa.Column('latency_max_ms', sa.Integer(), nullable=True, comment='延迟上限（毫秒）'))
+    op.add_column('mock_apis', sa.Column('latency_stddev_ms', sa.Integer(), nullable=True, comment='正态分布延迟的标准差（毫秒）'))
+    op.add_column('mock_apis', sa.Column('throttle_bytes_per_sec', sa.Integer(), nullable=True, comment='响应体传输限速（字节/秒）'))
+
+
+def downgrade() -> None:
+    op.drop_column('mock_apis', 'throttle_bytes_per_sec')
+    op.drop_column('mock_apis', 'latency_stddev_ms')
+    op.drop_column('mock_apis', 'latency_max_ms')
+    op.drop_column('mock_apis', 'latency_ms')
+    op.drop_column('mock_apis', 'latency_profile')
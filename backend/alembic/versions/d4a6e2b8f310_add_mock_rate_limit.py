@@ -0,0 +1,28 @@
+"""add mock rate limit
+
+Revision ID: d4a6e2b8f310
+Revises: b71f3d9e4c25
+Create Date: 2026-10-18 18:12:45.902731
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4a6e2b8f310'
+down_revision = 'b71f3d9e4c25'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('mock_apis', sa.Column('rate_limit_capacity', sa.Integer(), nullable=True, comment='令牌桶容量（突发请求数），为空表示不限流'))
+    op.add_column('mock_apis', sa.Column('rate_limit_refill_per_sec', sa.Float(), nullable=True, comment='令牌补充速率（个/秒）'))
+    op.add_column('mock_apis', sa.Column('rate_limit_scope', sa.Enum('MOCK', 'CLIENT_IP', name='ratelimitscope'), server_default='MOCK', nullable=False, comment='限流维度'))
+
+
+def downgrade() -> None:
+    op.drop_column('mock_apis', 'rate_limit_scope')
+    op.drop_column('mock_apis', 'rate_limit_refill_per_sec')
+    op.drop_column('mock_apis', 'rate_limit_capacity')
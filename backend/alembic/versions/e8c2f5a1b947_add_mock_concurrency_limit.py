@@ -0,0 +1,28 @@
+"""add mock concurrency limit
+
+Revision ID: e8c2f5a1b947
+Revises: d4a6e2b8f310
+Create Date: 2026-10-18 19:26:14.551803
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8c2f5a1b947'
+down_revision = 'd4a6e2b8f310'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('mock_apis', sa.Column('max_concurrency', sa.Integer(), nullable=True, comment='最大并发处理数，为空表示不限制'))
+    op.add_column('mock_apis', sa.Column('max_queue_depth', sa.Integer(), server_default='0', nullable=True, comment='并发占满时的最大排队数'))
+    op.add_column('request_logs', sa.Column('queue_wait_ms', sa.Integer(), nullable=True, comment='并发排队等待时间(毫秒)'))
+
+
+def downgrade() -> None:
+    op.drop_column('request_logs', 'queue_wait_ms')
+    op.drop_column('mock_apis', 'max_queue_depth')
+    op.drop_column('mock_apis', 'max_concurrency')
@@ -0,0 +1,24 @@
+"""add mock response rules
+
+Revision ID: f3b9d7c2a586
+Revises: e8c2f5a1b947
+Create Date: 2026-10-18 20:41:03.117492
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b9d7c2a586'
+down_revision = 'e8c2f5a1b947'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('mock_apis', sa.Column('response_rules', sa.JSON(), nullable=True, comment='条件响应规则'))
+
+
+def downgrade() -> None:
+    op.drop_column('mock_apis', 'response_rules')
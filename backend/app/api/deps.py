@@ -2,11 +2,12 @@
 API依赖注入
 """
 
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ..core.database import SessionLocal
+from ..core.database import AsyncSessionLocal, SessionLocal
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -16,3 +17,9 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """获取异步数据库会话依赖"""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -5,8 +5,10 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from ...api.deps import get_db
-from ...schemas.dashboard import DashboardData, DashboardStats
+from ...schemas.dashboard import DashboardData, DashboardStats, RuntimeStats
 from ...services.dashboard_service import DashboardService
+from ...utils.fake_pool import fake_pool
+from ...utils.template_cache import template_cache
 
 router = APIRouter()
 
@@ -41,4 +43,18 @@ async def get_dashboard_stats(
     - avg_response_time: 平均响应时间
     """
     service = DashboardService(db)
-    return service.get_dashboard_stats()
\ No newline at end of file
+    return service.get_dashboard_stats()
+
+
+@router.get("/runtime", response_model=RuntimeStats)
+async def get_runtime_stats() -> RuntimeStats:
+    """
+    获取当前进程的运行时缓存统计
+
+    返回：
+    - template_cache: 模板编译缓存的容量与命中情况
+    - faker_pool: Faker预生成数据池的余量与命中情况
+    """
+    return RuntimeStats(
+        template_cache=template_cache.stats(), faker_pool=fake_pool.stats()
+    )
@@ -2,7 +2,6 @@
 请求日志API路由
 """
 
-import math
 from datetime import datetime
 from typing import Optional
 
@@ -10,16 +9,30 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from ...api.deps import get_db
-from ...schemas.log import LogStatsResponse, RequestLogList, RequestLogResponse
+from ...schemas.log import (
+    LogPromoteRequest,
+    LogPromoteResult,
+    LogStatsResponse,
+    LogWriterStats,
+    RequestLogList,
+    RequestLogResponse,
+)
 from ...services.log_service import LogService
+from ...services.log_writer import log_writer
+from ...services.promotion_service import LogPromotionService
+from ...utils.pagination import CountMode, page_count
 
 router = APIRouter()
 
 
 @router.get("/", response_model=RequestLogList, summary="获取请求日志列表")
 def get_logs(
-    page: int = Query(1, ge=1, description="页码"),
+    page: int = Query(1, ge=1, description="页码（传入 cursor 时忽略）"),
     size: int = Query(20, ge=1, le=100, description="每页大小"),
+    cursor: Optional[str] = Query(None, description="上一页返回的 next_cursor"),
+    count: CountMode = Query(
+        "exact", description="总数统计方式：exact 精确 / estimated 估算 / none 不统计"
+    ),
     mock_api_id: Optional[int] = Query(None, description="Mock接口ID"),
     method: Optional[str] = Query(None, description="请求方法"),
     status_code: Optional[int] = Query(None, description="响应状态码"),
@@ -27,22 +40,57 @@ def get_logs(
     end_date: Optional[datetime] = Query(None, description="结束时间"),
     db: Session = Depends(get_db),
 ):
-    """获取请求日志列表"""
+    """
+    获取请求日志列表
+
+    深度翻页请使用 next_cursor 游标（按 created_at, id 定位），每页的代价
+    与页码无关；日志量很大时可以配合 count=estimated 或 count=none。
+    """
     skip = (page - 1) * size
-    logs, total = LogService.get_logs(
-        db,
-        skip=skip,
-        limit=size,
-        mock_api_id=mock_api_id,
-        method=method,
-        status_code=status_code,
-        start_date=start_date,
-        end_date=end_date,
+    try:
+        result = LogService.get_logs(
+            db,
+            skip=skip,
+            limit=size,
+            mock_api_id=mock_api_id,
+            method=method,
+            status_code=status_code,
+            start_date=start_date,
+            end_date=end_date,
+            cursor=cursor,
+            count=count,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return RequestLogList(
+        items=result.items,
+        total=result.total,
+        total_estimated=result.total_estimated,
+        page=None if cursor else page,
+        size=size,
+        pages=page_count(result.total, size),
+        next_cursor=result.next_cursor,
     )
 
-    pages = math.ceil(total / size) if total > 0 else 1
 
-    return RequestLogList(items=logs, total=total, page=page, size=size, pages=pages)
+@router.get(
+    "/stats/writer", response_model=LogWriterStats, summary="获取日志写入器统计"
+)
+def get_log_writer_stats():
+    """获取当前进程日志写入队列的入队、写入与丢弃计数"""
+    return LogWriterStats(**log_writer.stats())
+
+
+@router.post("/promote", response_model=LogPromoteResult, summary="日志批量转换为Mock接口")
+def promote_logs(options: LogPromoteRequest, db: Session = Depends(get_db)):
+    """
+    把录制的请求日志批量转换为Mock接口
+
+    按 (方法, 规范化路径, 关键查询参数) 去重，分批扫描日志并批量插入接口，
+    已存在同方法同路径的接口不会被覆盖。
+    """
+    return LogPromotionService.promote(db, options)
 
 
 @router.get("/{log_id}", response_model=RequestLogResponse, summary="获取请求日志详情")
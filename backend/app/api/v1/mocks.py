@@ -2,15 +2,41 @@
 Mock接口API路由
 """
 
-import math
-from typing import Optional
+from datetime import datetime
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from ...api.deps import get_db
-from ...schemas.mock import MockAPICreate, MockAPIList, MockAPIResponse, MockAPIUpdate
+from ...core.config import settings
+from ...core.database import SessionLocal
+from ...core.json_codec import json_codec
+from ...schemas.mock import (
+    MockAPICreate,
+    MockAPIList,
+    MockAPIResponse,
+    MockAPIUpdate,
+    MockBatchDelete,
+    MockBatchResult,
+    MockBatchUpdateItem,
+    MockImportOptions,
+    OpenAPIImportOptions,
+)
 from ...services.mock_service import MockService
+from ...services.openapi_import_service import OpenAPIImportService
+from ...services.transfer_service import MockTransferService, iter_ndjson
+from ...utils.openapi import OpenAPIDocument
+from ...utils.pagination import CountMode, page_count
 
 router = APIRouter()
 
@@ -27,23 +53,206 @@ def create_mock(mock_data: MockAPICreate, db: Session = Depends(get_db)):
 
 @router.get("/", response_model=MockAPIList, summary="获取Mock接口列表")
 def get_mocks(
-    page: int = Query(1, ge=1, description="页码"),
+    page: int = Query(1, ge=1, description="页码（传入 cursor 时忽略）"),
     size: int = Query(20, ge=1, le=100, description="每页大小"),
+    cursor: Optional[str] = Query(None, description="上一页返回的 next_cursor"),
+    count: CountMode = Query(
+        "exact", description="总数统计方式：exact 精确 / estimated 估算 / none 不统计"
+    ),
     is_active: Optional[bool] = Query(None, description="是否启用"),
     method: Optional[str] = Query(None, description="HTTP方法"),
     search: Optional[str] = Query(None, description="搜索关键词"),
     category_id: Optional[int] = Query(None, description="分类ID"),
     db: Session = Depends(get_db),
 ):
-    """获取Mock接口列表"""
+    """获取Mock接口列表（按ID升序，深度翻页请使用 next_cursor 游标）"""
     skip = (page - 1) * size
-    mocks, total = MockService.get_mocks(
-        db, skip=skip, limit=size, is_active=is_active, method=method, search=search, category_id=category_id
+    try:
+        result = MockService.get_mocks(
+            db,
+            skip=skip,
+            limit=size,
+            is_active=is_active,
+            method=method,
+            search=search,
+            category_id=category_id,
+            cursor=cursor,
+            count=count,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return MockAPIList(
+        items=result.items,
+        total=result.total,
+        total_estimated=result.total_estimated,
+        page=None if cursor else page,
+        size=size,
+        pages=page_count(result.total, size),
+        next_cursor=result.next_cursor,
+    )
+
+
+@router.post("/import/openapi", summary="导入OpenAPI文档")
+def import_openapi(
+    file: UploadFile = File(..., description="OpenAPI 3 / Swagger 2.0 文档（JSON或YAML）"),
+    path_prefix: Optional[str] = Query(None, description="拼接在文档路径前的前缀"),
+    on_conflict: Literal["skip", "update"] = Query(
+        "skip", description="已存在同方法同路径的接口时：skip 跳过 / update 覆盖响应配置"
+    ),
+    categories_from_tags: bool = Query(True, description="按第一个 tag 归入同名分类"),
+    category_id: Optional[int] = Query(None, description="没有 tag 时使用的分类ID"),
+    dynamic_examples: bool = Query(True, description="常见格式字段生成动态占位符"),
+):
+    """
+    批量导入OpenAPI文档中的接口
+
+    响应为 NDJSON 进度流：每写入一批输出一行 progress，最后输出一行 done。
+    """
+    max_bytes = settings.IMPORT_MAX_UPLOAD_MB * 1024 * 1024
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(status_code=413, detail="文档大小超过限制")
+
+    options = OpenAPIImportOptions(
+        path_prefix=path_prefix,
+        on_conflict=on_conflict,
+        categories_from_tags=categories_from_tags,
+        category_id=category_id,
+        dynamic_examples=dynamic_examples,
     )
+    try:
+        document = OpenAPIDocument(file.file)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"文档解析失败: {e}")
+
+    def progress():
+        # 流式响应在请求处理函数返回后才迭代，使用独立会话
+        db = SessionLocal()
+        try:
+            for event in OpenAPIImportService.run(db, document, options):
+                yield json_codec.dumps(event) + b"\n"
+        except Exception as e:
+            yield json_codec.dumps({"event": "error", "message": str(e)}) + b"\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(progress(), media_type="application/x-ndjson")
+
+
+@router.get("/export", summary="导出Mock接口与分类")
+def export_mocks():
+    """
+    导出全部分类与Mock接口
 
-    pages = math.ceil(total / size) if total > 0 else 1
+    响应为 NDJSON：第一行为 meta，随后按层级输出分类（父分类在前），
+    最后输出接口。数据通过服务端游标分批读取。
+    """
 
-    return MockAPIList(items=mocks, total=total, page=page, size=size, pages=pages)
+    def lines():
+        # 流式响应在请求处理函数返回后才迭代，使用独立会话
+        db = SessionLocal()
+        try:
+            yield from MockTransferService.export(db)
+        finally:
+            db.close()
+
+    filename = f"mocker-export-{datetime.utcnow():%Y%m%d%H%M%S}.ndjson"
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post("/import", summary="导入Mock接口与分类")
+def import_mocks(
+    file: UploadFile = File(..., description="导出接口生成的NDJSON文件"),
+    on_conflict: Literal["skip", "update"] = Query(
+        "update", description="已存在同名分类或同方法同路径的接口时：skip 跳过 / update 覆盖"
+    ),
+):
+    """
+    导入导出接口生成的NDJSON文件
+
+    分类与接口分批写入，文件中的 parent_id / category_id 按新建或匹配到的
+    分类重新映射。响应为 NDJSON 进度流，最后一行为 done。
+    """
+    max_bytes = settings.IMPORT_MAX_UPLOAD_MB * 1024 * 1024
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(status_code=413, detail="文件大小超过限制")
+
+    options = MockImportOptions(on_conflict=on_conflict)
+
+    def progress():
+        db = SessionLocal()
+        try:
+            for event in MockTransferService.run_import(
+                db, iter_ndjson(file.file), options
+            ):
+                yield json_codec.dumps(event) + b"\n"
+        except Exception as e:
+            yield json_codec.dumps({"event": "error", "message": str(e)}) + b"\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(progress(), media_type="application/x-ndjson")
+
+
+def _check_batch_size(size: int) -> None:
+    if size == 0:
+        raise HTTPException(status_code=400, detail="批量请求不能为空")
+    if size > settings.MOCK_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"单次批量请求最多 {settings.MOCK_BATCH_MAX_ITEMS} 条",
+        )
+
+
+def _batch_response(result: MockBatchResult, response: Response) -> MockBatchResult:
+    if not result.committed:
+        response.status_code = 422
+    return result
+
+
+@router.post("/batch", response_model=MockBatchResult, summary="批量创建Mock接口")
+def batch_create_mocks(
+    items: List[MockAPICreate],
+    response: Response,
+    atomic: bool = Query(True, description="任一条目失败时整批不写入"),
+    db: Session = Depends(get_db),
+):
+    """
+    批量创建Mock接口
+
+    整批在一个事务中以多行INSERT写入，提交后一次性更新路由表；
+    结果按请求数组顺序逐条返回。
+    """
+    _check_batch_size(len(items))
+    return _batch_response(MockService.batch_create(db, items, atomic), response)
+
+
+@router.put("/batch", response_model=MockBatchResult, summary="批量更新Mock接口")
+def batch_update_mocks(
+    items: List[MockBatchUpdateItem],
+    response: Response,
+    atomic: bool = Query(True, description="任一条目失败时整批不写入"),
+    db: Session = Depends(get_db),
+):
+    """批量更新Mock接口，每个条目只修改传入的字段"""
+    _check_batch_size(len(items))
+    return _batch_response(MockService.batch_update(db, items, atomic), response)
+
+
+@router.delete("/batch", response_model=MockBatchResult, summary="批量删除Mock接口")
+def batch_delete_mocks(
+    data: MockBatchDelete,
+    response: Response,
+    atomic: bool = Query(True, description="任一接口不存在时整批不删除"),
+    db: Session = Depends(get_db),
+):
+    """批量删除Mock接口"""
+    _check_batch_size(len(data.ids))
+    return _batch_response(MockService.batch_delete(db, data.ids, atomic), response)
 
 
 @router.get("/{mock_id}", response_model=MockAPIResponse, summary="获取Mock接口详情")
@@ -3,23 +3,100 @@ Mock代理服务API路由
 """
 
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import APIRouter, Depends, Request, Response
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...api.deps import get_db
+from ...api.deps import get_async_db
+from ...core.config import settings
+from ...core.json_codec import json_codec
+from ...models.mock import LogCaptureLevel
+from ...services.concurrency_service import ConcurrencyService, concurrency_limits
+from ...services.latency_service import LatencyService
 from ...services.log_service import LogService
-from ...services.mock_service import MockService
-from ...utils.response_generator import ResponseGenerator
+from ...services.log_writer import log_writer
+from ...services.rate_limit_service import RateLimitService
+from ...services.route_sync import ensure_route_table_loaded
+from ...services.route_table import route_table
+from ...services.upstream_service import UpstreamService
+from ...utils.compression import compress, negotiate_encoding
+from ...utils.request_body import LazyRequestBody
+from ...utils.response_generator import ResponseGenerator, StaticResponse
+from ...utils.response_rules import get_rule_set
+from ...utils.response_variants import get_variant_set
 
 router = APIRouter()
 
+# 304响应中不应携带的实体相关响应头
+ENTITY_HEADERS = ("content-type", "content-length", "content-encoding")
+
+
+def _build_response(
+    mock_api, source, request: Request, request_data: Dict[str, Any]
+) -> Tuple[Optional[StaticResponse], Optional[bytes], Any, Dict[str, str], int]:
+    """
+    生成Mock响应
+
+    Args:
+        mock_api: 匹配到的Mock接口
+        source: 响应配置，为Mock接口本身或命中的条件响应规则
+
+    Returns:
+        tuple: (静态响应, 预序列化内容, 响应体, 响应头, 状态码)
+    """
+    # 静态Mock直接使用预序列化的响应字节
+    static_response = ResponseGenerator.get_static_response(source)
+    if static_response is not None:
+        status_code = source.status_code
+        # 客户端缓存仍然有效时直接返回304（条件GET，其他方法忽略该请求头）
+        if (
+            request.method in ("GET", "HEAD")
+            and 200 <= status_code < 300
+            and static_response.etag_matches(request.headers.get("if-none-match"))
+        ):
+            status_code = 304
+        return (
+            static_response,
+            static_response.content,
+            static_response.body,
+            static_response.render_headers(),
+            status_code,
+        )
+
+    if request.method == "HEAD":
+        # HEAD只需要响应头，不渲染响应体
+        return (
+            None,
+            None,
+            None,
+            ResponseGenerator.build_headers(source),
+            source.status_code,
+        )
+
+    try:
+        response_body, response_headers = ResponseGenerator.generate_response(
+            source, request_data
+        )
+        return None, None, response_body, response_headers, source.status_code
+
+    except Exception as e:
+        # 响应生成失败
+        response_body = {
+            "error": "Response generation failed",
+            "message": str(e),
+            "mock_id": mock_api.id,
+        }
+        return None, None, response_body, {"Content-Type": "application/json"}, 500
+
 
 @router.api_route(
     "/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"]
 )
-async def mock_proxy(request: Request, path: str, db: Session = Depends(get_db)):
+async def mock_proxy(
+    request: Request, path: str, db: AsyncSession = Depends(get_async_db)
+):
     """Mock代理服务 - 处理所有Mock请求"""
     start_time = time.time()
 
@@ -30,37 +107,36 @@ async def mock_proxy(request: Request, path: str, db: Session = Depends(get_db))
     # 获取请求数据
     request_headers = dict(request.headers)
     request_params = dict(request.query_params)
+    client_ip = request.client.host if request.client else None
+
+    # 请求体按需读取：只有Mock接口引用请求体时才完整解析
+    lazy_body = LazyRequestBody(request)
+
+    # 查找匹配的Mock接口（进程内路由表，命中时不访问数据库）
+    await ensure_route_table_loaded(db)
+    matched = route_table.match(method, full_path)
+    if not matched and method == "HEAD":
+        # 未单独配置HEAD时复用同路径的GET Mock
+        matched = route_table.match("GET", full_path)
+
+    if not matched:
+        # 没有找到匹配的Mock接口：配置了上游时透传，否则记录日志并返回404
+        upstream = await UpstreamService.resolve(full_path)
+        if upstream is not None:
+            # 透传可能持续较长时间，先归还会话占用的数据库连接
+            await db.close()
+            return await UpstreamService.forward(
+                request, upstream, full_path, lazy_body.may_have_body, start_time
+            )
 
-    # 获取请求体
-    request_body = None
-    try:
-        if request.method in ["POST", "PUT", "PATCH"]:
-            content_type = request.headers.get("content-type", "")
-            if "application/json" in content_type:
-                request_body = await request.json()
-            elif "application/x-www-form-urlencoded" in content_type:
-                form_data = await request.form()
-                request_body = dict(form_data)
-            else:
-                body_bytes = await request.body()
-                request_body = {"raw": body_bytes.decode("utf-8", errors="ignore")}
-    except Exception:
-        request_body = None
-
-    # 查找匹配的Mock接口
-    mock_api = MockService.find_matching_mock(db, method, full_path)
-
-    if not mock_api:
-        # 没有找到匹配的Mock接口，记录日志并返回404
         response_time_ms = int((time.time() - start_time) * 1000)
 
-        LogService.create_log(
-            db=db,
+        await log_writer.submit(
             mock_api_id=None,
             request_method=method,
             request_path=full_path,
             request_headers=request_headers,
-            request_body=request_body,
+            request_body=await lazy_body.preview(settings.LOG_BODY_MAX_BYTES),
             request_params=request_params,
             response_status_code=404,
             response_headers={"Content-Type": "application/json"},
@@ -70,7 +146,7 @@ async def mock_proxy(request: Request, path: str, db: Session = Depends(get_db))
                 "method": method,
             },
             response_time_ms=response_time_ms,
-            client_ip=request.client.host if request.client else None,
+            client_ip=client_ip,
             user_agent=request.headers.get("user-agent"),
         )
 
@@ -80,56 +156,177 @@ async def mock_proxy(request: Request, path: str, db: Session = Depends(get_db))
             headers={"Content-Type": "application/json"},
         )
 
+    mock_api, path_params = matched
+
+    # 条件响应规则与加权变体（均按版本预先编译）
+    rule_set = get_rule_set(mock_api)
+    variant_set = get_variant_set(mock_api)
+
+    request_body = None
+    if (
+        ResponseGenerator.uses_request_body(mock_api)
+        or (rule_set is not None and rule_set.uses_body)
+        or (variant_set is not None and variant_set.uses_body)
+    ):
+        request_body = await lazy_body.parsed()
+
     # 生成响应
     request_data = {
         "method": method,
         "path": full_path,
+        "path_params": path_params,
         "headers": request_headers,
         "params": request_params,
         "body": request_body,
     }
 
-    try:
-        response_body, response_headers = ResponseGenerator.generate_response(
-            mock_api, request_data
+    # 令牌桶限流模拟：桶空时直接返回429，不生成响应
+    retry_after = await RateLimitService.check(mock_api, client_ip)
+
+    static_response = None
+    content = None
+    queue_wait_ms = None
+    variant = None
+
+    if retry_after is not None:
+        response_body, response_headers, status_code = (
+            RateLimitService.too_many_requests(mock_api, retry_after)
         )
-        status_code = mock_api.status_code
+    else:
+        # 并发容量模拟：占满时排队等待，队列也满时返回503
+        limiter = concurrency_limits.get(mock_api)
+        admitted = True
+        if limiter is not None:
+            admitted, queue_wait_ms = await limiter.acquire()
 
-    except Exception as e:
-        # 响应生成失败
-        response_body = {
-            "error": "Response generation failed",
-            "message": str(e),
-            "mock_id": mock_api.id,
-        }
-        response_headers = {"Content-Type": "application/json"}
-        status_code = 500
+        if not admitted:
+            response_body, response_headers, status_code = (
+                ConcurrencyService.service_unavailable(mock_api)
+            )
+        else:
+            # 按条件响应规则选择响应配置，没有规则命中时按权重选择变体
+            source = mock_api
+            if rule_set is not None:
+                source = rule_set.select(request_data) or mock_api
+            if source is mock_api and variant_set is not None:
+                source = variant = variant_set.select()
+
+            try:
+                (
+                    static_response,
+                    content,
+                    response_body,
+                    response_headers,
+                    status_code,
+                ) = _build_response(mock_api, source, request, request_data)
+
+                # 模拟网络延迟（asyncio定时器，等待期间不占用worker）
+                if variant is not None and variant.latency_ms is not None:
+                    delay_ms = min(variant.latency_ms, settings.LATENCY_MAX_MS)
+                else:
+                    delay_ms = await LatencyService.sample_delay_ms(mock_api)
+                await LatencyService.delay(delay_ms)
+            finally:
+                if limiter is not None:
+                    limiter.release()
+
+    # 304与HEAD不发送响应体
+    sends_body = status_code != 304 and method != "HEAD"
 
     # 计算响应时间
     response_time_ms = int((time.time() - start_time) * 1000)
 
-    # 记录请求日志
-    LogService.create_log(
-        db=db,
-        mock_api_id=mock_api.id,
-        request_method=method,
-        request_path=full_path,
-        request_headers=request_headers,
-        request_body=request_body,
-        request_params=request_params,
-        response_status_code=status_code,
-        response_headers=response_headers,
-        response_body=response_body,
-        response_time_ms=response_time_ms,
-        client_ip=request.client.host if request.client else None,
-        user_agent=request.headers.get("user-agent"),
-    )
+    # 记录请求日志（按Mock接口的采集策略采样裁剪，放入队列由后台任务批量写入）
+    if LogService.should_capture(mock_api, status_code):
+        # 日志只保存有限长度的原始请求体，且仅在完整采集级别下读取
+        logged_body = None
+        if (mock_api.log_level or LogCaptureLevel.FULL) == LogCaptureLevel.FULL:
+            logged_body = await lazy_body.preview(settings.LOG_BODY_MAX_BYTES)
+
+        log_data = LogService.apply_capture_level(
+            mock_api.log_level,
+            {
+                "mock_api_id": mock_api.id,
+                "request_method": method,
+                "request_path": full_path,
+                "request_headers": request_headers,
+                "request_body": logged_body,
+                "request_params": request_params,
+                "response_status_code": status_code,
+                "response_headers": response_headers,
+                "response_body": response_body if sends_body else None,
+                "response_time_ms": response_time_ms,
+                "queue_wait_ms": queue_wait_ms,
+                "variant": variant.label if variant is not None else None,
+                "client_ip": client_ip,
+                "user_agent": request.headers.get("user-agent"),
+            },
+        )
+        await log_writer.submit(**log_data)
 
     # 返回响应
-    import json
+    if content is None and response_body is not None:
+        content = json_codec.dumps(response_body, pretty=bool(mock_api.pretty_json))
+
+    # 按 Accept-Encoding 压缩达到大小阈值的响应，静态响应复用缓存的压缩结果
+    encoding = None
+    if (
+        content is not None
+        and settings.COMPRESSION_ENABLED
+        and len(content) >= settings.COMPRESSION_MIN_SIZE
+        and not any(name.lower() == "content-encoding" for name in response_headers)
+    ):
+        vary = response_headers.get("Vary")
+        response_headers = {
+            **response_headers,
+            "Vary": f"{vary}, Accept-Encoding" if vary else "Accept-Encoding",
+        }
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+
+    if static_response is not None:
+        response_headers = {
+            **response_headers,
+            "ETag": static_response.etag_header(encoding),
+        }
+        if status_code == 304:
+            return Response(
+                status_code=304,
+                headers={
+                    name: value
+                    for name, value in response_headers.items()
+                    if name.lower() not in ENTITY_HEADERS
+                },
+            )
+
+    if encoding is not None:
+        if static_response is not None:
+            content = static_response.encoded(encoding)
+        else:
+            content = compress(content, encoding)
+        response_headers["Content-Encoding"] = encoding
+
+    if method == "HEAD":
+        # 静态Mock给出与GET一致的 Content-Length，动态Mock不渲染响应体故不提供
+        if content is not None:
+            response_headers = {
+                **response_headers,
+                "Content-Length": str(len(content)),
+            }
+        response = Response(status_code=status_code, headers=response_headers)
+        if content is None:
+            del response.headers["content-length"]
+        return response
+
+    if mock_api.throttle_bytes_per_sec and content:
+        # 按配置的字节速率分片发送响应体（没有响应体时无需限速）
+        return StreamingResponse(
+            LatencyService.throttle(content, mock_api.throttle_bytes_per_sec),
+            status_code=status_code,
+            headers={**response_headers, "Content-Length": str(len(content))},
+        )
 
     return Response(
-        content=json.dumps(response_body, ensure_ascii=False, indent=2),
+        content=content,
         status_code=status_code,
         headers=response_headers,
     )
@@ -0,0 +1,135 @@
+"""
+命令行工具
+
+用法（在 backend 目录下）::
+
+    python -m app.cli import-openapi openapi.json --on-conflict update
+    python -m app.cli export -o mocker.ndjson
+    python -m app.cli import mocker.ndjson --on-conflict skip
+"""
+
+import argparse
+import sys
+
+from .core.database import SessionLocal
+from .core.json_codec import json_codec
+from .schemas.mock import MockImportOptions, OpenAPIImportOptions
+from .services.openapi_import_service import OpenAPIImportService
+from .services.transfer_service import MockTransferService, iter_ndjson
+from .utils.openapi import OpenAPIDocument
+
+
+def import_openapi(args: argparse.Namespace) -> int:
+    """导入OpenAPI文档，进度输出到 stderr，最终统计以JSON输出到 stdout"""
+    options = OpenAPIImportOptions(
+        path_prefix=args.path_prefix,
+        on_conflict=args.on_conflict,
+        categories_from_tags=not args.no_tag_categories,
+        category_id=args.category_id,
+        dynamic_examples=not args.static_examples,
+    )
+
+    with open(args.file, "rb") as fileobj:
+        try:
+            document = OpenAPIDocument(fileobj)
+        except Exception as e:
+            print(f"文档解析失败: {e}", file=sys.stderr)
+            return 1
+
+        db = SessionLocal()
+        try:
+            for event in OpenAPIImportService.run(db, document, options):
+                if event["event"] == "progress":
+                    print(
+                        "已处理 {operations} 个接口：新建 {created}，更新 {updated}，"
+                        "跳过 {skipped}，失败 {failed}".format(**event),
+                        file=sys.stderr,
+                    )
+                else:
+                    print(json_codec.dumps(event, pretty=True).decode("utf-8"))
+        finally:
+            db.close()
+    return 0
+
+
+def export_mocks(args: argparse.Namespace) -> int:
+    """导出分类与Mock接口为NDJSON，默认输出到 stdout"""
+    output = open(args.output, "wb") if args.output else sys.stdout.buffer
+    db = SessionLocal()
+    try:
+        for line in MockTransferService.export(db):
+            output.write(line)
+    finally:
+        db.close()
+        if args.output:
+            output.close()
+    return 0
+
+
+def import_mocks(args: argparse.Namespace) -> int:
+    """导入NDJSON文件，进度输出到 stderr，最终统计以JSON输出到 stdout"""
+    options = MockImportOptions(on_conflict=args.on_conflict)
+    with open(args.file, "rb") as fileobj:
+        db = SessionLocal()
+        try:
+            for event in MockTransferService.run_import(
+                db, iter_ndjson(fileobj), options
+            ):
+                if event["event"] == "progress":
+                    print(
+                        "分类：新建 {categories_created}，更新 {categories_updated}；"
+                        "接口：新建 {created}，更新 {updated}，跳过 {skipped}，"
+                        "失败 {failed}".format(**event),
+                        file=sys.stderr,
+                    )
+                else:
+                    print(json_codec.dumps(event, pretty=True).decode("utf-8"))
+        finally:
+            db.close()
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli", description="Mocker 命令行工具"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    openapi = subparsers.add_parser("import-openapi", help="导入OpenAPI / Swagger文档")
+    openapi.add_argument("file", help="文档路径（JSON或YAML）")
+    openapi.add_argument("--path-prefix", help="拼接在文档路径前的前缀")
+    openapi.add_argument(
+        "--on-conflict",
+        choices=("skip", "update"),
+        default="skip",
+        help="已存在同方法同路径的接口时跳过或覆盖响应配置",
+    )
+    openapi.add_argument("--category-id", type=int, help="没有 tag 时使用的分类ID")
+    openapi.add_argument(
+        "--no-tag-categories", action="store_true", help="不按 tag 创建与归入分类"
+    )
+    openapi.add_argument(
+        "--static-examples", action="store_true", help="只生成静态示例，不使用动态占位符"
+    )
+    openapi.set_defaults(handler=import_openapi)
+
+    export = subparsers.add_parser("export", help="导出分类与Mock接口（NDJSON）")
+    export.add_argument("-o", "--output", help="输出文件路径，默认输出到 stdout")
+    export.set_defaults(handler=export_mocks)
+
+    ndjson = subparsers.add_parser("import", help="导入 export 生成的NDJSON文件")
+    ndjson.add_argument("file", help="NDJSON文件路径")
+    ndjson.add_argument(
+        "--on-conflict",
+        choices=("skip", "update"),
+        default="update",
+        help="已存在同名分类或同方法同路径的接口时跳过或覆盖",
+    )
+    ndjson.set_defaults(handler=import_mocks)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
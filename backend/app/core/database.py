@@ -3,10 +3,30 @@
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from .config import settings
+from .json_codec import json_codec
+
+# 同步驱动到异步驱动的映射
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def get_async_database_url(url: str) -> str:
+    """根据同步数据库URL推导异步驱动URL"""
+    url = make_url(url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        return url.render_as_string(hide_password=False)
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
 
 # 创建数据库引擎
 engine = create_engine(
@@ -14,11 +34,30 @@ engine = create_engine(
     echo=settings.DATABASE_ECHO,
     pool_pre_ping=True,
     pool_recycle=300,
+    json_serializer=json_codec.dumps_str,
+    json_deserializer=json_codec.loads,
 )
 
 # 创建会话工厂
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 创建异步数据库引擎（Mock代理等热路径使用，避免阻塞事件循环）
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL or get_async_database_url(settings.DATABASE_URL),
+    echo=settings.DATABASE_ECHO,
+    pool_pre_ping=True,
+    pool_recycle=300,
+    pool_size=settings.ASYNC_DATABASE_POOL_SIZE,
+    max_overflow=settings.ASYNC_DATABASE_MAX_OVERFLOW,
+    json_serializer=json_codec.dumps_str,
+    json_deserializer=json_codec.loads,
+)
+
+# 创建异步会话工厂
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 # 创建基础模型类
 Base = declarative_base()
 
@@ -0,0 +1,103 @@
+"""
+JSON编解码器
+
+Mock代理输出、模板结果解析、数据库JSON列以及管理接口的默认响应统一
+通过这里的编解码器完成。默认使用 orjson，未安装时退回标准库 json，
+也可以通过 JSON_CODEC 配置显式指定。
+"""
+
+import json
+import logging
+import re
+from typing import Any, Union
+
+from fastapi.responses import JSONResponse
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson 只支持64位整数：解析时会把更大的整数静默转成浮点数，
+# 输入中出现19位以上的连续数字时交给标准库解析
+_LONG_DIGITS = re.compile(r"\d{19,}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19,}")
+
+
+class JSONCodec:
+    """基于标准库 json 的编解码器"""
+
+    name = "json"
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        """序列化为UTF-8字节，默认紧凑格式，pretty 为真时缩进2格"""
+        if pretty:
+            text = json.dumps(obj, ensure_ascii=False, indent=2)
+        else:
+            text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+        return text.encode("utf-8")
+
+    def dumps_str(self, obj: Any) -> str:
+        """序列化为字符串（SQLAlchemy JSON列使用）"""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        """反序列化，格式错误时抛出 ValueError"""
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """基于 orjson 的编解码器"""
+
+    name = "orjson"
+
+    def __init__(self):
+        self._compact = orjson.OPT_NON_STR_KEYS
+        self._pretty = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        try:
+            return orjson.dumps(obj, option=self._pretty if pretty else self._compact)
+        except TypeError:
+            # 超出64位的整数等 orjson 不支持的值
+            return super().dumps(obj, pretty)
+
+    def dumps_str(self, obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=self._compact).decode("utf-8")
+        except TypeError:
+            return super().dumps_str(obj)
+
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        pattern = _LONG_DIGITS if isinstance(data, str) else _LONG_DIGITS_BYTES
+        if pattern.search(data):
+            return super().loads(data)
+        # orjson.JSONDecodeError 是 ValueError 的子类
+        return orjson.loads(data)
+
+
+def get_codec(name: str) -> JSONCodec:
+    """按名称创建编解码器，orjson 不可用时退回标准库实现"""
+    if name == "orjson":
+        if orjson is not None:
+            return OrjsonCodec()
+        logger.warning("未安装 orjson，JSON编解码退回标准库实现")
+        return JSONCodec()
+    if name == "json":
+        return JSONCodec()
+    raise ValueError(f"不支持的JSON编解码器: {name}")
+
+
+# 全局JSON编解码器实例
+json_codec = get_codec(settings.JSON_CODEC)
+
+
+class CodecJSONResponse(JSONResponse):
+    """使用全局编解码器序列化的JSON响应（管理接口的默认响应类）"""
+
+    def render(self, content: Any) -> bytes:
+        return json_codec.dumps(content)
@@ -2,6 +2,10 @@
 FastAPI主应用
 """
 
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
@@ -9,6 +13,55 @@ from fastapi.staticfiles import StaticFiles
 
 from .api.api import api_router, proxy_router
 from .core.config import settings
+from .core.database import AsyncSessionLocal, async_engine
+from .core.json_codec import CodecJSONResponse
+from .services.log_writer import log_writer
+from .services.rate_limit_service import rate_limiter
+from .services.route_sync import load_route_table, run_route_sync
+from .services.upstream_service import upstream_client
+from .utils.fake_pool import fake_pool
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """应用生命周期管理"""
+    # 启动时预热路由表；数据库暂不可用时由首个Mock请求延迟加载
+    try:
+        async with AsyncSessionLocal() as db:
+            count = await load_route_table(db)
+        logger.info("Mock路由表已加载 %d 条接口", count)
+    except Exception as e:
+        logger.warning("Mock路由表预热失败，将在首次请求时加载: %s", e)
+
+    # 启动请求日志批量写入任务与Faker数据池补充线程
+    await log_writer.start()
+    fake_pool.start()
+
+    # 上游透传共用的连接池客户端
+    upstream_client.start()
+
+    # 多worker部署时轮询其他进程产生的路由变更
+    sync_task = None
+    if settings.ROUTE_SYNC_INTERVAL > 0:
+        sync_task = asyncio.create_task(run_route_sync())
+
+    yield
+
+    if sync_task is not None:
+        sync_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await sync_task
+
+    # 优雅关闭：写完队列中剩余的请求日志
+    await log_writer.stop(settings.LOG_SHUTDOWN_TIMEOUT)
+    fake_pool.stop()
+    await rate_limiter.close()
+    await upstream_client.close()
+
+    await async_engine.dispose()
+
 
 # 创建FastAPI应用
 app = FastAPI(
@@ -18,6 +71,8 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url=f"{settings.API_V1_STR}/docs",
     redoc_url=f"{settings.API_V1_STR}/redoc",
+    lifespan=lifespan,
+    default_response_class=CodecJSONResponse,
 )
 
 # 配置CORS
@@ -6,5 +6,6 @@ from .base import Base
 from .category import Category
 from .log import RequestLog
 from .mock import MockAPI
+from .route_change import RouteChange
 
-__all__ = ["Base", "Category", "MockAPI", "RequestLog"]
+__all__ = ["Base", "Category", "MockAPI", "RequestLog", "RouteChange"]
@@ -20,6 +20,11 @@ class Category(BaseModel):
     # 层级关系
     parent_id = Column(Integer, ForeignKey("categories.id"), comment="父分类ID")
     sort_order = Column(Integer, default=0, comment="排序权重")
+
+    # 上游透传：未匹配Mock的请求按路径前缀转发到真实后端
+    upstream_url = Column(String(500), comment="上游服务地址")
+    path_prefix = Column(String(500), comment="转发到上游的请求路径前缀")
+    record_mode = Column(Boolean, default=False, comment="是否录制上游的完整响应")
     
     # 状态管理
     is_active = Column(Boolean, default=True, comment="是否启用")
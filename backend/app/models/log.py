@@ -2,7 +2,16 @@
 请求日志数据模型
 """
 
-from sqlalchemy import JSON, BigInteger, Column, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import relationship
 
 from .base import BaseModel
@@ -12,6 +21,12 @@ class RequestLog(BaseModel):
     """请求日志模型"""
 
     __tablename__ = "request_logs"
+    __table_args__ = (
+        # 日志列表按 (created_at, id) 倒序排列与游标翻页
+        Index("ix_request_logs_created_at_id", "created_at", "id"),
+        # 经验延迟分布按 (方法, 路径) 查找透传到上游的请求
+        Index("ix_request_logs_method_path", "request_method", "request_path"),
+    )
 
     # 关联的Mock接口
     mock_api_id = Column(
@@ -30,6 +45,8 @@ class RequestLog(BaseModel):
     response_headers = Column(JSON, comment="响应头")
     response_body = Column(JSON, comment="响应体")
     response_time_ms = Column(Integer, comment="响应时间(毫秒)")
+    queue_wait_ms = Column(Integer, comment="并发排队等待时间(毫秒)")
+    variant = Column(String(100), comment="命中的响应变体")
 
     # 客户端信息
     client_ip = Column(String(45), comment="客户端IP")
@@ -4,7 +4,17 @@ Mock接口数据模型
 
 import enum
 
-from sqlalchemy import JSON, Boolean, Column, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    Enum,
+    Float,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import relationship
 
 from .base import BaseModel
@@ -22,6 +32,32 @@ class HTTPMethod(str, enum.Enum):
     OPTIONS = "OPTIONS"
 
 
+class LogCaptureLevel(str, enum.Enum):
+    """请求日志采集级别枚举"""
+
+    OFF = "off"  # 不记录
+    METADATA = "metadata"  # 仅记录方法、路径、参数、状态码、耗时等元数据
+    HEADERS = "headers"  # 元数据 + 请求/响应头
+    FULL = "full"  # 元数据 + 请求/响应头 + 请求/响应体
+
+
+class LatencyProfile(str, enum.Enum):
+    """响应延迟模拟方式枚举"""
+
+    NONE = "none"  # 不模拟延迟
+    FIXED = "fixed"  # 固定延迟 latency_ms
+    UNIFORM = "uniform"  # latency_ms ~ latency_max_ms 之间均匀分布
+    NORMAL = "normal"  # 均值 latency_ms、标准差 latency_stddev_ms 的正态分布
+    EMPIRICAL = "empirical"  # 回放同一路由透传到上游时记录的响应时间分布
+
+
+class RateLimitScope(str, enum.Enum):
+    """限流维度枚举"""
+
+    MOCK = "mock"  # 整个Mock接口共用一个令牌桶
+    CLIENT_IP = "client_ip"  # 每个客户端IP一个令牌桶
+
+
 class MockAPI(BaseModel):
     """Mock接口模型"""
 
@@ -40,11 +76,55 @@ class MockAPI(BaseModel):
     response_headers = Column(JSON, comment="响应头配置")
     response_body = Column(JSON, comment="响应体配置")
     response_template = Column(Text, comment="响应模板")
+    pretty_json = Column(Boolean, default=False, comment="响应体是否格式化输出")
+    response_rules = Column(JSON, comment="条件响应规则")
+    response_variants = Column(JSON, comment="加权响应变体")
+    variant_seed = Column(Integer, comment="变体选择的随机种子，为空表示不固定")
 
     # 状态管理
     is_active = Column(Boolean, default=True, comment="是否启用")
     version = Column(Integer, default=1, comment="版本号")
+
+    # 日志采集策略
+    log_level = Column(
+        Enum(LogCaptureLevel),
+        default=LogCaptureLevel.FULL,
+        nullable=False,
+        comment="日志采集级别",
+    )
+    log_sample_rate = Column(
+        Integer, default=1, comment="日志采样率（每N次请求记录1次）"
+    )
+    log_errors_always = Column(
+        Boolean, default=True, comment="非2xx响应是否始终记录"
+    )
     
+    # 网络模拟
+    latency_profile = Column(
+        Enum(LatencyProfile),
+        default=LatencyProfile.NONE,
+        nullable=False,
+        comment="延迟模拟方式",
+    )
+    latency_ms = Column(Integer, comment="延迟（毫秒）：固定值/均匀分布下限/正态分布均值")
+    latency_max_ms = Column(Integer, comment="延迟上限（毫秒）")
+    latency_stddev_ms = Column(Integer, comment="正态分布延迟的标准差（毫秒）")
+    throttle_bytes_per_sec = Column(Integer, comment="响应体传输限速（字节/秒）")
+
+    # 限流模拟（令牌桶）
+    rate_limit_capacity = Column(Integer, comment="令牌桶容量（突发请求数），为空表示不限流")
+    rate_limit_refill_per_sec = Column(Float, comment="令牌补充速率（个/秒）")
+    rate_limit_scope = Column(
+        Enum(RateLimitScope),
+        default=RateLimitScope.MOCK,
+        nullable=False,
+        comment="限流维度",
+    )
+
+    # 并发容量模拟
+    max_concurrency = Column(Integer, comment="最大并发处理数，为空表示不限制")
+    max_queue_depth = Column(Integer, default=0, comment="并发占满时的最大排队数")
+
     # 分类关联
     category_id = Column(Integer, ForeignKey("categories.id"), comment="所属分类ID")
     
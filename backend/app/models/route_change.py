@@ -0,0 +1,23 @@
+"""
+路由变更序列数据模型
+"""
+
+from sqlalchemy import Column, Integer
+
+from .base import BaseModel
+
+
+class RouteChange(BaseModel):
+    """路由变更记录模型
+
+    每次Mock接口增删改都会在同一事务中追加一条记录，自增ID即全局变更序号。
+    各worker轮询大于本地序号的记录，只重新加载发生变更的接口。
+    """
+
+    __tablename__ = "route_changes"
+
+    mock_api_id = Column(Integer, nullable=False, comment="变更的Mock接口ID")
+    version = Column(Integer, comment="变更后的版本号，删除时为空")
+
+    def __repr__(self):
+        return f"<RouteChange(id={self.id}, mock_api_id={self.mock_api_id}, version={self.version})>"
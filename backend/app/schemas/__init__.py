@@ -11,7 +11,7 @@ from .category import (
     CategoryTree,
     CategoryUpdate,
 )
-from .log import LogStatsResponse, RequestLogList, RequestLogResponse
+from .log import LogStatsResponse, LogWriterStats, RequestLogList, RequestLogResponse
 from .mock import MockAPICreate, MockAPIList, MockAPIResponse, MockAPIUpdate
 
 __all__ = [
@@ -22,6 +22,7 @@ __all__ = [
     "RequestLogResponse",
     "RequestLogList",
     "LogStatsResponse",
+    "LogWriterStats",
     "CategoryCreate",
     "CategoryUpdate", 
     "CategoryResponse",
@@ -5,7 +5,25 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+
+def _validate_upstream_url(v: Optional[str]) -> Optional[str]:
+    """上游地址必须是 http(s) 地址，空字符串视为未配置"""
+    if not v:
+        return None
+    if not v.startswith(("http://", "https://")):
+        raise ValueError("上游地址必须以 http:// 或 https:// 开头")
+    return v.rstrip("/")
+
+
+def _validate_path_prefix(v: Optional[str]) -> Optional[str]:
+    """路径前缀必须以 / 开头，空字符串视为未配置"""
+    if not v:
+        return None
+    if not v.startswith("/"):
+        raise ValueError("路径前缀必须以 / 开头")
+    return v.rstrip("/") or "/"
 
 
 class CategoryBase(BaseModel):
@@ -15,6 +33,19 @@ class CategoryBase(BaseModel):
     parent_id: Optional[int] = Field(None, description="父分类ID")
     sort_order: int = Field(0, description="排序权重")
     is_active: bool = Field(True, description="是否启用")
+    upstream_url: Optional[str] = Field(None, max_length=500, description="上游服务地址，未匹配Mock的请求转发到该地址")
+    path_prefix: Optional[str] = Field(None, max_length=500, description="转发到上游的请求路径前缀，如 /users")
+    record_mode: bool = Field(False, description="录制模式：完整记录上游响应，供批量生成Mock接口")
+
+    @field_validator("upstream_url")
+    @classmethod
+    def validate_upstream_url(cls, v):
+        return _validate_upstream_url(v)
+
+    @field_validator("path_prefix")
+    @classmethod
+    def validate_path_prefix(cls, v):
+        return _validate_path_prefix(v)
 
 
 class CategoryCreate(CategoryBase):
@@ -29,6 +60,19 @@ class CategoryUpdate(BaseModel):
     parent_id: Optional[int] = Field(None, description="父分类ID")
     sort_order: Optional[int] = Field(None, description="排序权重")
     is_active: Optional[bool] = Field(None, description="是否启用")
+    upstream_url: Optional[str] = Field(None, max_length=500, description="上游服务地址，未匹配Mock的请求转发到该地址")
+    path_prefix: Optional[str] = Field(None, max_length=500, description="转发到上游的请求路径前缀，如 /users")
+    record_mode: Optional[bool] = Field(None, description="录制模式：完整记录上游响应，供批量生成Mock接口")
+
+    @field_validator("upstream_url")
+    @classmethod
+    def validate_upstream_url(cls, v):
+        return _validate_upstream_url(v)
+
+    @field_validator("path_prefix")
+    @classmethod
+    def validate_path_prefix(cls, v):
+        return _validate_path_prefix(v)
 
 
 class CategoryResponse(CategoryBase):
@@ -27,4 +27,29 @@ class RecentMockAPI(BaseModel):
 class DashboardData(BaseModel):
     """仪表板完整数据"""
     stats: DashboardStats
-    recent_mocks: List[RecentMockAPI]
\ No newline at end of file
+    recent_mocks: List[RecentMockAPI]
+
+
+class TemplateCacheStats(BaseModel):
+    """模板编译缓存统计"""
+    size: int = 0
+    max_size: int = 0
+    hits: int = 0
+    misses: int = 0
+    hit_rate: float = 0.0
+
+
+class FakerPoolStats(BaseModel):
+    """Faker预生成数据池统计"""
+    running: bool = False
+    pools: int = 0
+    size: int = 0
+    available: int = 0
+    hits: int = 0
+    misses: int = 0
+
+
+class RuntimeStats(BaseModel):
+    """当前进程运行时缓存统计"""
+    template_cache: TemplateCacheStats
+    faker_pool: FakerPoolStats
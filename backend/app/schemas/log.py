@@ -26,6 +26,8 @@ class RequestLogResponse(BaseModel):
     response_headers: Optional[Dict[str, Any]] = Field(None, description="响应头")
     response_body: Optional[Dict[str, Any]] = Field(None, description="响应体")
     response_time_ms: Optional[int] = Field(None, description="响应时间(毫秒)")
+    queue_wait_ms: Optional[int] = Field(None, description="并发排队等待时间(毫秒)")
+    variant: Optional[str] = Field(None, description="命中的响应变体")
 
     # 客户端信息
     client_ip: Optional[str] = Field(None, description="客户端IP")
@@ -42,10 +44,16 @@ class RequestLogList(BaseModel):
     """请求日志列表Schema"""
 
     items: List[RequestLogResponse] = Field(..., description="日志列表")
-    total: int = Field(..., description="总数量")
-    page: int = Field(..., description="当前页码")
+    total: Optional[int] = Field(None, description="总数量（count=none 时不统计）")
+    total_estimated: bool = Field(
+        False, description="总数是否为估算值（count=estimated 时可能为计数上限）"
+    )
+    page: Optional[int] = Field(None, description="当前页码（游标翻页时为空）")
     size: int = Field(..., description="每页大小")
-    pages: int = Field(..., description="总页数")
+    pages: Optional[int] = Field(None, description="总页数（未统计总数时为空）")
+    next_cursor: Optional[str] = Field(
+        None, description="下一页的游标，原样传给 cursor 参数；为空表示没有更多数据"
+    )
 
 
 class LogStatsResponse(BaseModel):
@@ -58,3 +66,63 @@ class LogStatsResponse(BaseModel):
     top_apis: List[Dict[str, Any]] = Field(..., description="热门API")
     method_stats: Dict[str, int] = Field(..., description="方法统计")
     status_stats: Dict[str, int] = Field(..., description="状态码统计")
+
+
+class LogWriterStats(BaseModel):
+    """日志写入器统计Schema"""
+
+    running: bool = Field(..., description="后台写入任务是否运行")
+    policy: str = Field(..., description="队列满时的策略")
+    pending: int = Field(..., description="队列中待写入数量")
+    queued: int = Field(..., description="累计入队数量")
+    flushed: int = Field(..., description="累计写入数量")
+    dropped: int = Field(..., description="累计丢弃数量")
+    failed: int = Field(..., description="累计写入失败数量")
+
+
+class LogPromoteRequest(BaseModel):
+    """日志转Mock请求Schema"""
+
+    start_date: Optional[datetime] = Field(None, description="开始时间")
+    end_date: Optional[datetime] = Field(None, description="结束时间")
+    method: Optional[str] = Field(None, description="只转换该请求方法的日志")
+    path_prefix: Optional[str] = Field(None, description="只转换该路径前缀下的日志")
+    unmatched_only: bool = Field(
+        True, description="只转换未匹配Mock接口的日志（如上游透传录制的流量）"
+    )
+    include_errors: bool = Field(False, description="是否包含4xx/5xx响应")
+    key_params: List[str] = Field(
+        default_factory=list,
+        description="参与去重的查询参数，不同取值生成接口的条件响应规则",
+    )
+    parameterize_ids: bool = Field(
+        True, description="把路径中的数字、UUID等ID段替换为路径参数"
+    )
+    category_id: Optional[int] = Field(None, description="新接口所属分类ID")
+    dry_run: bool = Field(False, description="只统计将要创建的接口，不写入数据库")
+
+
+class PromotedRoute(BaseModel):
+    """日志转Mock生成的接口Schema"""
+
+    method: str = Field(..., description="请求方法")
+    path: str = Field(..., description="接口路径")
+    rules: int = Field(0, description="生成的条件响应规则数量")
+    source_log_id: int = Field(..., description="来源日志ID")
+
+
+class LogPromoteResult(BaseModel):
+    """日志转Mock结果Schema"""
+
+    scanned: int = Field(..., description="扫描的日志数量")
+    created: int = Field(..., description="创建的接口数量（dry_run时为将要创建的数量）")
+    rule_count: int = Field(..., description="生成的条件响应规则数量")
+    duplicates: int = Field(..., description="去重跳过的日志数量")
+    skipped_existing: int = Field(..., description="已存在同路径接口而跳过的日志数量")
+    skipped_incomplete: int = Field(
+        ..., description="响应体不完整或路径无法转换而跳过的日志数量"
+    )
+    dry_run: bool = Field(False, description="是否为试运行")
+    routes: List[PromotedRoute] = Field(
+        default_factory=list, description="生成的接口（最多列出 PROMOTE_PREVIEW_LIMIT 条）"
+    )
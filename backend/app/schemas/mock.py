@@ -3,11 +3,78 @@ Mock接口相关Schema
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
 
-from ..models.mock import HTTPMethod
+from ..models.mock import HTTPMethod, LatencyProfile, LogCaptureLevel, RateLimitScope
+from ..utils.response_rules import RuleCondition
+from ..utils.route_trie import compile_path
+
+
+def _validate_path(path: Optional[str]) -> Optional[str]:
+    """校验接口路径模式（路径参数、正则段、通配符），返回补全开头 / 的路径"""
+    if path is not None:
+        if not path.startswith("/"):
+            path = f"/{path}"
+        compile_path(path)
+    return path
+
+
+class MockRuleCondition(BaseModel):
+    """响应规则条件Schema"""
+
+    source: Literal["query", "header", "path", "body"] = Field(
+        ..., description="取值来源：查询参数/请求头/路径参数/请求体字段（a.b.0）"
+    )
+    key: str = Field(..., min_length=1, description="字段名")
+    op: Literal[
+        "eq",
+        "ne",
+        "in",
+        "not_in",
+        "contains",
+        "regex",
+        "exists",
+        "not_exists",
+        "gt",
+        "gte",
+        "lt",
+        "lte",
+    ] = Field("eq", description="比较运算")
+    value: Any = Field(None, description="比较值（in / not_in 为列表）")
+
+    @model_validator(mode="after")
+    def check_condition(self) -> "MockRuleCondition":
+        RuleCondition(self.source, self.key, self.op, self.value)
+        return self
+
+
+class MockResponseRule(BaseModel):
+    """条件响应规则Schema，未配置的响应字段继承Mock接口"""
+
+    name: Optional[str] = Field(None, description="规则名称")
+    conditions: List[MockRuleCondition] = Field(
+        default_factory=list, description="条件列表（全部满足时命中，为空表示总是命中）"
+    )
+    status_code: Optional[int] = Field(None, description="响应状态码")
+    response_headers: Optional[Dict[str, str]] = Field(None, description="响应头配置")
+    response_body: Optional[Dict[str, Any]] = Field(None, description="响应体配置")
+    response_template: Optional[str] = Field(None, description="响应模板")
+
+
+class MockResponseVariant(BaseModel):
+    """加权响应变体Schema，未配置的响应字段继承Mock接口"""
+
+    name: Optional[str] = Field(None, description="变体名称（记录在请求日志中）")
+    weight: float = Field(..., gt=0, description="权重（按占全部权重的比例选择）")
+    status_code: Optional[int] = Field(None, description="响应状态码")
+    response_headers: Optional[Dict[str, str]] = Field(None, description="响应头配置")
+    response_body: Optional[Dict[str, Any]] = Field(None, description="响应体配置")
+    response_template: Optional[str] = Field(None, description="响应模板")
+    latency_ms: Optional[int] = Field(
+        None, ge=0, description="变体的固定延迟（毫秒），如模拟超时"
+    )
 
 
 class MockAPIBase(BaseModel):
@@ -16,19 +83,64 @@ class MockAPIBase(BaseModel):
     name: str = Field(..., description="Mock接口名称")
     description: Optional[str] = Field(None, description="接口描述")
     method: HTTPMethod = Field(..., description="HTTP方法")
-    path: str = Field(..., description="接口路径")
+    path: str = Field(
+        ...,
+        description="接口路径，支持 {param}、{param:正则} 与末尾通配符 * / {param:*}",
+    )
     status_code: int = Field(200, description="响应状态码")
     response_headers: Optional[Dict[str, str]] = Field(None, description="响应头配置")
     response_body: Optional[Dict[str, Any]] = Field(None, description="响应体配置")
     response_template: Optional[str] = Field(None, description="响应模板")
+    pretty_json: bool = Field(False, description="响应体是否格式化输出（默认紧凑格式）")
+    response_rules: Optional[List[MockResponseRule]] = Field(
+        None, description="条件响应规则（按顺序匹配，第一条命中的规则生效）"
+    )
+    response_variants: Optional[List[MockResponseVariant]] = Field(
+        None, description="加权响应变体（没有条件规则命中时按权重随机选择）"
+    )
+    variant_seed: Optional[int] = Field(
+        None, description="变体选择的随机种子，设置后选择序列可复现"
+    )
     is_active: bool = Field(True, description="是否启用")
     category_id: Optional[int] = Field(None, description="所属分类ID")
+    log_level: LogCaptureLevel = Field(LogCaptureLevel.FULL, description="日志采集级别")
+    log_sample_rate: int = Field(1, ge=1, description="日志采样率（每N次请求记录1次）")
+    log_errors_always: bool = Field(True, description="非2xx响应是否始终记录")
+    latency_profile: LatencyProfile = Field(
+        LatencyProfile.NONE, description="延迟模拟方式"
+    )
+    latency_ms: Optional[int] = Field(
+        None, ge=0, description="延迟（毫秒）：固定值/均匀分布下限/正态分布均值"
+    )
+    latency_max_ms: Optional[int] = Field(None, ge=0, description="延迟上限（毫秒）")
+    latency_stddev_ms: Optional[int] = Field(
+        None, ge=0, description="正态分布延迟的标准差（毫秒）"
+    )
+    throttle_bytes_per_sec: Optional[int] = Field(
+        None, ge=1, description="响应体传输限速（字节/秒），为空表示不限速"
+    )
+    rate_limit_capacity: Optional[int] = Field(
+        None, ge=1, description="令牌桶容量（突发请求数），为空表示不限流"
+    )
+    rate_limit_refill_per_sec: Optional[float] = Field(
+        None, gt=0, description="令牌补充速率（个/秒），为空时等于容量"
+    )
+    rate_limit_scope: RateLimitScope = Field(
+        RateLimitScope.MOCK, description="限流维度：整个接口或每个客户端IP"
+    )
+    max_concurrency: Optional[int] = Field(
+        None, ge=1, description="最大并发处理数，为空表示不限制"
+    )
+    max_queue_depth: int = Field(0, ge=0, description="并发占满时的最大排队数")
 
 
 class MockAPICreate(MockAPIBase):
     """创建Mock接口Schema"""
 
-    pass
+    @field_validator("path")
+    @classmethod
+    def check_path(cls, value: Optional[str]) -> Optional[str]:
+        return _validate_path(value)
 
 
 class MockAPIUpdate(BaseModel):
@@ -42,8 +154,80 @@ class MockAPIUpdate(BaseModel):
     response_headers: Optional[Dict[str, str]] = Field(None, description="响应头配置")
     response_body: Optional[Dict[str, Any]] = Field(None, description="响应体配置")
     response_template: Optional[str] = Field(None, description="响应模板")
+    pretty_json: Optional[bool] = Field(None, description="响应体是否格式化输出")
+    response_rules: Optional[List[MockResponseRule]] = Field(
+        None, description="条件响应规则"
+    )
+    response_variants: Optional[List[MockResponseVariant]] = Field(
+        None, description="加权响应变体"
+    )
+    variant_seed: Optional[int] = Field(None, description="变体选择的随机种子")
     is_active: Optional[bool] = Field(None, description="是否启用")
     category_id: Optional[int] = Field(None, description="所属分类ID")
+    log_level: Optional[LogCaptureLevel] = Field(None, description="日志采集级别")
+    log_sample_rate: Optional[int] = Field(
+        None, ge=1, description="日志采样率（每N次请求记录1次）"
+    )
+    log_errors_always: Optional[bool] = Field(None, description="非2xx响应是否始终记录")
+    latency_profile: Optional[LatencyProfile] = Field(None, description="延迟模拟方式")
+    latency_ms: Optional[int] = Field(
+        None, ge=0, description="延迟（毫秒）：固定值/均匀分布下限/正态分布均值"
+    )
+    latency_max_ms: Optional[int] = Field(None, ge=0, description="延迟上限（毫秒）")
+    latency_stddev_ms: Optional[int] = Field(
+        None, ge=0, description="正态分布延迟的标准差（毫秒）"
+    )
+    throttle_bytes_per_sec: Optional[int] = Field(
+        None, ge=1, description="响应体传输限速（字节/秒）"
+    )
+    rate_limit_capacity: Optional[int] = Field(
+        None, ge=1, description="令牌桶容量（突发请求数）"
+    )
+    rate_limit_refill_per_sec: Optional[float] = Field(
+        None, gt=0, description="令牌补充速率（个/秒）"
+    )
+    rate_limit_scope: Optional[RateLimitScope] = Field(None, description="限流维度")
+    max_concurrency: Optional[int] = Field(None, ge=1, description="最大并发处理数")
+    max_queue_depth: Optional[int] = Field(
+        None, ge=0, description="并发占满时的最大排队数"
+    )
+
+    @field_validator("path")
+    @classmethod
+    def check_path(cls, value: Optional[str]) -> Optional[str]:
+        return _validate_path(value)
+
+
+class MockBatchUpdateItem(MockAPIUpdate):
+    """批量更新中的单个接口Schema（只修改传入的字段）"""
+
+    id: int = Field(..., description="接口ID")
+
+
+class MockBatchDelete(BaseModel):
+    """批量删除Schema"""
+
+    ids: List[int] = Field(..., min_length=1, description="要删除的接口ID列表")
+
+
+class MockBatchItemResult(BaseModel):
+    """批量操作中单个条目的结果Schema"""
+
+    index: int = Field(..., description="条目在请求数组中的下标")
+    id: Optional[int] = Field(None, description="接口ID")
+    status: Literal[
+        "created", "updated", "deleted", "not_found", "invalid", "skipped"
+    ] = Field(..., description="处理结果（skipped 表示因同批其他条目失败而未写入）")
+    error: Optional[str] = Field(None, description="失败原因")
+
+
+class MockBatchResult(BaseModel):
+    """批量操作结果Schema"""
+
+    committed: bool = Field(..., description="是否已写入（原子模式下有失败条目时整批不写入）")
+    succeeded: int = Field(..., description="写入成功的条目数")
+    failed: int = Field(..., description="失败的条目数")
+    items: List[MockBatchItemResult] = Field(..., description="逐条结果（与请求数组顺序一致）")
 
 
 class MockAPIResponse(MockAPIBase):
@@ -62,7 +246,40 @@ class MockAPIList(BaseModel):
     """Mock接口列表Schema"""
 
     items: List[MockAPIResponse] = Field(..., description="接口列表")
-    total: int = Field(..., description="总数量")
-    page: int = Field(..., description="当前页码")
+    total: Optional[int] = Field(None, description="总数量（count=none 时不统计）")
+    total_estimated: bool = Field(
+        False, description="总数是否为估算值（count=estimated 时可能为计数上限）"
+    )
+    page: Optional[int] = Field(None, description="当前页码（游标翻页时为空）")
     size: int = Field(..., description="每页大小")
-    pages: int = Field(..., description="总页数")
+    pages: Optional[int] = Field(None, description="总页数（未统计总数时为空）")
+    next_cursor: Optional[str] = Field(
+        None, description="下一页的游标，原样传给 cursor 参数；为空表示没有更多数据"
+    )
+
+
+class OpenAPIImportOptions(BaseModel):
+    """OpenAPI导入选项Schema"""
+
+    path_prefix: Optional[str] = Field(None, description="拼接在文档路径前的前缀")
+    on_conflict: Literal["skip", "update"] = Field(
+        "skip", description="已存在同方法同路径的接口时：skip 跳过 / update 覆盖响应配置"
+    )
+    categories_from_tags: bool = Field(
+        True, description="按接口的第一个 tag 归入同名顶级分类（不存在时创建）"
+    )
+    category_id: Optional[int] = Field(
+        None, description="没有 tag 或不按 tag 分类时使用的分类ID"
+    )
+    dynamic_examples: bool = Field(
+        True, description="email、uuid、date-time 等字段生成动态占位符"
+    )
+
+
+class MockImportOptions(BaseModel):
+    """NDJSON导入选项Schema"""
+
+    on_conflict: Literal["skip", "update"] = Field(
+        "update",
+        description="已存在同名分类（同一父分类下）或同方法同路径的接口时：skip 跳过 / update 覆盖",
+    )
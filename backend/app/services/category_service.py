@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session, joinedload
 
 from ..models import Category, MockAPI
 from ..schemas.category import CategoryCreate, CategoryUpdate
+from .upstream_service import upstream_table
 
 
 class CategoryService:
@@ -89,6 +90,7 @@ class CategoryService:
         self.db.add(category)
         self.db.commit()
         self.db.refresh(category)
+        upstream_table.invalidate()
         return category
 
     def update_category(self, category_id: int, category_data: CategoryUpdate) -> Optional[Category]:
@@ -115,6 +117,7 @@ class CategoryService:
 
         self.db.commit()
         self.db.refresh(category)
+        upstream_table.invalidate()
         return category
 
     def delete_category(self, category_id: int) -> bool:
@@ -139,6 +142,7 @@ class CategoryService:
         # 软删除
         category.is_active = False
         self.db.commit()
+        upstream_table.invalidate()
         return True
 
     def get_category_stats(self) -> dict:
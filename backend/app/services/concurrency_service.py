@@ -0,0 +1,116 @@
+"""
+并发容量模拟服务
+
+模拟固定连接池的慢速上游：每个Mock接口最多同时处理 max_concurrency 个
+请求，其余请求按到达顺序排队，排队数超过 max_queue_depth 时直接返回503。
+基于 asyncio 信号量实现，排队中的请求不占用worker线程。
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .route_table import route_table
+
+
+class ConcurrencyLimiter:
+    """单个Mock接口的并发槽位与等待队列"""
+
+    def __init__(self, max_concurrency: int, max_queue_depth: int):
+        self.max_concurrency = max_concurrency
+        self.max_queue_depth = max_queue_depth
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_flight = 0
+        self.waiting = 0
+        self.rejected = 0
+
+    async def acquire(self) -> Tuple[bool, int]:
+        """
+        申请并发槽位
+
+        Returns:
+            tuple: (是否获得槽位, 排队等待毫秒数)，队列已满时不等待直接返回 False
+        """
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue_depth:
+                self.rejected += 1
+                return False, 0
+
+            start = time.perf_counter()
+            self.waiting += 1
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self.waiting -= 1
+            wait_ms = int((time.perf_counter() - start) * 1000)
+        else:
+            await self._semaphore.acquire()
+            wait_ms = 0
+
+        self.in_flight += 1
+        return True, wait_ms
+
+    def release(self) -> None:
+        """归还并发槽位"""
+        self.in_flight -= 1
+        self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue_depth": self.max_queue_depth,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+        }
+
+
+class ConcurrencyLimits:
+    """按Mock接口版本维护并发限制器，配置变更后新请求使用新的限制器"""
+
+    def __init__(self):
+        # mock id -> (版本, 限制器)
+        self._limiters: Dict[int, Tuple[Optional[int], ConcurrencyLimiter]] = {}
+
+    def get(self, mock_api) -> Optional[ConcurrencyLimiter]:
+        """获取Mock接口的并发限制器，未配置并发上限时返回 None"""
+        if not mock_api.max_concurrency:
+            self._limiters.pop(mock_api.id, None)
+            return None
+
+        cached = self._limiters.get(mock_api.id)
+        if cached is not None and cached[0] == mock_api.version:
+            return cached[1]
+
+        limiter = ConcurrencyLimiter(
+            mock_api.max_concurrency, mock_api.max_queue_depth or 0
+        )
+        self._limiters[mock_api.id] = (mock_api.version, limiter)
+        return limiter
+
+    def discard(self, mock_ids: Iterable[int]) -> None:
+        """移除指定接口的限制器（已排队的请求仍持有原限制器，不受影响）"""
+        for mock_id in mock_ids:
+            self._limiters.pop(mock_id, None)
+
+
+# 全局并发限制器注册表（每个进程一份）
+concurrency_limits = ConcurrencyLimits()
+route_table.add_remove_listener(concurrency_limits.discard)
+
+
+class ConcurrencyService:
+    """并发容量模拟服务类"""
+
+    @staticmethod
+    def service_unavailable(mock_api) -> Tuple[Dict[str, Any], Dict[str, str], int]:
+        """生成容量耗尽响应：(响应体, 响应头, 状态码)"""
+        return (
+            {
+                "error": "Service Unavailable",
+                "message": "Concurrency limit and queue are full",
+                "mock_id": mock_api.id,
+            },
+            {"Content-Type": "application/json"},
+            503,
+        )
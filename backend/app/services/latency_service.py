@@ -0,0 +1,148 @@
+"""
+网络延迟与带宽模拟服务
+
+延迟与限速均基于 asyncio 定时器实现，等待期间不占用worker线程，
+单个进程可以同时挂起大量延迟中的响应。
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal
+from ..models.mock import LatencyProfile
+from .log_service import AsyncLogService
+from .route_table import route_table
+
+logger = logging.getLogger(__name__)
+
+
+class EmpiricalSampleCache:
+    """
+    经验分布样本缓存：每个Mock接口缓存同一路由透传到上游时记录的响应时间，
+    按TTL与版本刷新
+    """
+
+    def __init__(self, sample_size: int, ttl: float):
+        self.sample_size = sample_size
+        self.ttl = ttl
+        # mock id -> (版本, 过期时间, 样本)
+        self._entries: Dict[int, Tuple[Optional[int], float, List[int]]] = {}
+        # 缓存失效时每个Mock接口只让一个请求查询数据库；
+        # 锁按等待者计数，最后一个等待者退出后才移除
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self._waiters: Dict[int, int] = {}
+
+    async def get(self, mock_api) -> List[int]:
+        """获取Mock接口的响应时间样本（毫秒）"""
+        samples = self._lookup(mock_api)
+        if samples is not None:
+            return samples
+
+        lock = self._locks.setdefault(mock_api.id, asyncio.Lock())
+        self._waiters[mock_api.id] = self._waiters.get(mock_api.id, 0) + 1
+        try:
+            async with lock:
+                samples = self._lookup(mock_api)
+                if samples is not None:
+                    return samples
+
+                try:
+                    # 使用独立会话，查询完立即归还连接，不随延迟中的请求一起占用
+                    async with AsyncSessionLocal() as db:
+                        samples = await AsyncLogService.get_recorded_response_times(
+                            db, mock_api.method, mock_api.path, self.sample_size
+                        )
+                except Exception as e:
+                    # 查询失败不影响Mock响应：本TTL内按无样本处理（退回固定延迟）
+                    logger.warning("加载接口 %s 的响应时间样本失败: %s", mock_api.id, e)
+                    samples = []
+                self._entries[mock_api.id] = (
+                    mock_api.version,
+                    time.monotonic() + self.ttl,
+                    samples,
+                )
+                return samples
+        finally:
+            self._waiters[mock_api.id] -= 1
+            if not self._waiters[mock_api.id]:
+                del self._waiters[mock_api.id]
+                del self._locks[mock_api.id]
+
+    def discard(self, mock_ids: Iterable[int]) -> None:
+        """移除指定接口的样本（加载中的锁随最后一个等待者释放）"""
+        for mock_id in mock_ids:
+            self._entries.pop(mock_id, None)
+
+    def _lookup(self, mock_api) -> Optional[List[int]]:
+        cached = self._entries.get(mock_api.id)
+        if (
+            cached is not None
+            and cached[0] == mock_api.version
+            and cached[1] > time.monotonic()
+        ):
+            return cached[2]
+        return None
+
+
+# 全局经验分布样本缓存
+empirical_samples = EmpiricalSampleCache(
+    settings.LATENCY_EMPIRICAL_SAMPLE_SIZE, settings.LATENCY_EMPIRICAL_TTL
+)
+route_table.add_remove_listener(empirical_samples.discard)
+
+
+class LatencyService:
+    """延迟与带宽模拟服务类"""
+
+    @staticmethod
+    async def sample_delay_ms(mock_api) -> int:
+        """按Mock接口的延迟配置抽样本次请求的延迟（毫秒）"""
+        profile = mock_api.latency_profile or LatencyProfile.NONE
+        if profile == LatencyProfile.NONE:
+            return 0
+
+        base = mock_api.latency_ms or 0
+        upper = mock_api.latency_max_ms
+
+        if profile == LatencyProfile.FIXED:
+            delay = base
+        elif profile == LatencyProfile.UNIFORM:
+            delay = random.uniform(*sorted((base, base if upper is None else upper)))
+        elif profile == LatencyProfile.NORMAL:
+            delay = random.gauss(base, mock_api.latency_stddev_ms or 0)
+        else:
+            # 经验分布：回放上游真实响应时间的最近样本，无样本时退回固定延迟
+            samples = await empirical_samples.get(mock_api)
+            delay = random.choice(samples) if samples else base
+
+        if upper is not None:
+            delay = min(delay, upper)
+        return int(min(max(delay, 0), settings.LATENCY_MAX_MS))
+
+    @staticmethod
+    async def delay(delay_ms: int) -> None:
+        """异步等待指定毫秒数"""
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+    @staticmethod
+    async def throttle(content: bytes, bytes_per_sec: int) -> AsyncIterator[bytes]:
+        """
+        按字节速率分片输出响应内容
+
+        每个分片发送后按累计发送量计算下一分片的发送时间，避免定时误差累积。
+        """
+        chunk_size = max(int(bytes_per_sec * settings.THROTTLE_TICK_INTERVAL), 1)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        for offset in range(0, len(content), chunk_size):
+            chunk = content[offset : offset + chunk_size]
+            yield chunk
+            wait = start + (offset + len(chunk)) / bytes_per_sec - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
@@ -2,19 +2,71 @@
 请求日志业务服务
 """
 
+import random
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 
-from sqlalchemy import and_, func
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from ..core.config import settings
 from ..models.log import RequestLog
-from ..models.mock import MockAPI
+from ..models.mock import LogCaptureLevel, MockAPI
+from ..utils.pagination import (
+    CountMode,
+    Page,
+    count_total,
+    decode_cursor,
+    encode_cursor,
+)
+from ..utils.route_trie import PathSegment, RouteTrie, compile_path, is_dynamic_path
+
+
+class _RouteKey(NamedTuple):
+    """路径模式匹配时插入路由树的占位值"""
+
+    id: int
+
+
+# 各采集级别需要清空的日志字段
+_LEVEL_EXCLUDED_FIELDS = {
+    LogCaptureLevel.METADATA: (
+        "request_headers",
+        "request_body",
+        "response_headers",
+        "response_body",
+    ),
+    LogCaptureLevel.HEADERS: ("request_body", "response_body"),
+    LogCaptureLevel.FULL: (),
+}
 
 
 class LogService:
     """请求日志服务类"""
 
+    @staticmethod
+    def should_capture(mock_api, status_code: int) -> bool:
+        """根据Mock接口的日志采集策略判断本次请求是否需要记录日志"""
+        level = mock_api.log_level or LogCaptureLevel.FULL
+        if level == LogCaptureLevel.OFF:
+            return False
+
+        if mock_api.log_errors_always and not 200 <= status_code < 300:
+            return True
+
+        sample_rate = mock_api.log_sample_rate or 1
+        return sample_rate <= 1 or random.random() * sample_rate < 1
+
+    @staticmethod
+    def apply_capture_level(
+        level: Optional[LogCaptureLevel], log_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """按采集级别裁剪日志字段（请求头、请求体等）"""
+        for field in _LEVEL_EXCLUDED_FIELDS.get(level or LogCaptureLevel.FULL, ()):
+            log_data[field] = None
+        return log_data
+
     @staticmethod
     def create_log(
         db: Session,
@@ -28,6 +80,8 @@ class LogService:
         response_headers: Optional[Dict[str, Any]] = None,
         response_body: Optional[Dict[str, Any]] = None,
         response_time_ms: Optional[int] = None,
+        queue_wait_ms: Optional[int] = None,
+        variant: Optional[str] = None,
         client_ip: Optional[str] = None,
         user_agent: Optional[str] = None,
     ) -> RequestLog:
@@ -43,6 +97,8 @@ class LogService:
             response_headers=response_headers,
             response_body=response_body,
             response_time_ms=response_time_ms,
+            queue_wait_ms=queue_wait_ms,
+            variant=variant,
             client_ip=client_ip,
             user_agent=user_agent,
         )
@@ -61,8 +117,15 @@ class LogService:
         status_code: Optional[int] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> tuple[List[RequestLog], int]:
-        """获取请求日志列表"""
+        cursor: Optional[str] = None,
+        count: CountMode = "exact",
+    ) -> Page:
+        """
+        获取请求日志列表（按时间倒序）
+
+        传入 cursor 时按 (created_at, id) 游标翻页并忽略 skip；
+        count 指定总数的统计方式（exact / estimated / none）。
+        """
         query = db.query(RequestLog)
 
         # 添加过滤条件
@@ -77,16 +140,38 @@ class LogService:
         if end_date:
             query = query.filter(RequestLog.created_at <= end_date)
 
-        # 按时间倒序排列
-        query = query.order_by(RequestLog.created_at.desc())
-
         # 获取总数
-        total = query.count()
+        filtered = any((mock_api_id, method, status_code, start_date, end_date))
+        total, total_estimated = count_total(
+            db, query, count, RequestLog.__tablename__, filtered
+        )
 
-        # 分页查询
-        items = query.offset(skip).limit(limit).all()
+        # 按时间倒序排列，时间相同时按ID倒序（与游标的排序键一致）
+        query = query.order_by(RequestLog.created_at.desc(), RequestLog.id.desc())
+        if cursor:
+            created_at, log_id = decode_cursor("logs", cursor, 2)
+            try:
+                created_at = datetime.fromisoformat(created_at)
+                log_id = int(log_id)
+            except (TypeError, ValueError):
+                raise ValueError("无效的分页游标")
+            query = query.filter(
+                or_(
+                    RequestLog.created_at < created_at,
+                    and_(RequestLog.created_at == created_at, RequestLog.id < log_id),
+                )
+            )
+        else:
+            query = query.offset(skip)
+
+        # 多取一条判断是否还有下一页
+        items = query.limit(limit + 1).all()
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor("logs", [items[-1].created_at, items[-1].id])
 
-        return items, total
+        return Page(items, total, total_estimated, next_cursor)
 
     @staticmethod
     def get_log(db: Session, log_id: int) -> Optional[RequestLog]:
@@ -180,3 +265,55 @@ class LogService:
                 str(k): v for k, v in status_stats.items() if k is not None
             },
         }
+
+
+class AsyncLogService:
+    """请求日志异步服务类（供Mock代理使用）"""
+
+    @staticmethod
+    async def get_recorded_response_times(
+        db: AsyncSession, method: str, path: str, limit: int
+    ) -> List[int]:
+        """
+        获取透传到上游（未命中Mock）的同一路由最近的响应时间
+
+        只取成功响应；Mock接口自身的日志包含模拟注入的延迟，不作为样本。
+        动态路径按首个动态段之前的静态前缀查询，再用路径模式逐条匹配。
+        """
+        query = select(RequestLog.request_path, RequestLog.response_time_ms).where(
+            RequestLog.mock_api_id.is_(None),
+            RequestLog.request_method == method,
+            RequestLog.response_time_ms.isnot(None),
+            RequestLog.response_status_code < 400,
+        )
+        if not is_dynamic_path(path):
+            result = await db.execute(
+                query.where(RequestLog.request_path == path)
+                .order_by(RequestLog.id.desc())
+                .limit(limit)
+            )
+            return [response_time for _, response_time in result.all()]
+
+        prefix = []
+        for segment in compile_path(path):
+            if segment.kind != PathSegment.STATIC:
+                break
+            prefix.append(segment.value)
+        trie = RouteTrie()
+        trie.insert(path, _RouteKey(0))
+
+        result = await db.execute(
+            query.where(RequestLog.request_path.startswith(
+                    "/".join(["", *prefix, ""]), autoescape=True
+                )
+            )
+            .order_by(RequestLog.id.desc())
+            .limit(settings.LATENCY_EMPIRICAL_SCAN_ROWS)
+        )
+        samples = []
+        for request_path, response_time in result.all():
+            if trie.match(request_path) is not None:
+                samples.append(response_time)
+                if len(samples) >= limit:
+                    break
+        return samples
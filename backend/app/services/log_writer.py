@@ -0,0 +1,186 @@
+"""
+请求日志批量写入器
+
+Mock代理只把轻量的日志记录放入有界内存队列，后台任务按数量或时间
+攒批，以一条多行INSERT写入数据库，响应路径上不再有数据库往返。
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal
+from ..models.log import RequestLog
+
+logger = logging.getLogger(__name__)
+
+# 队列满时的处理策略
+POLICY_DROP = "drop"  # 直接丢弃新记录
+POLICY_BLOCK = "block"  # 等待队列有空位（对请求施加背压）
+
+# 日志记录字段，多行INSERT要求每行字段一致
+LOG_FIELDS = (
+    "mock_api_id",
+    "request_method",
+    "request_path",
+    "request_headers",
+    "request_body",
+    "request_params",
+    "response_status_code",
+    "response_headers",
+    "response_body",
+    "response_time_ms",
+    "queue_wait_ms",
+    "variant",
+    "client_ip",
+    "user_agent",
+)
+
+
+class LogWriter:
+    """批量异步请求日志写入器"""
+
+    def __init__(
+        self,
+        max_queue: int,
+        batch_size: int,
+        flush_interval: float,
+        policy: str = POLICY_DROP,
+    ):
+        if policy not in (POLICY_DROP, POLICY_BLOCK):
+            raise ValueError(f"不支持的日志队列策略: {policy}")
+
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.policy = policy
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+        # 统计计数
+        self.queued = 0
+        self.flushed = 0
+        self.dropped = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """启动后台写入任务"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float) -> None:
+        """停止写入任务，在超时时间内写完队列中剩余的日志"""
+        if not self.running:
+            return
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "日志队列未能在 %.1f 秒内写完，剩余 %d 条", timeout, self._queue.qsize()
+            )
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def submit(self, **log_data: Any) -> bool:
+        """
+        提交一条请求日志，字段与 LogService.create_log 一致
+
+        Returns:
+            bool: 是否被接受（drop 策略下队列已满时返回 False）
+        """
+        record = {field: log_data.get(field) for field in LOG_FIELDS}
+        record["created_at"] = record["updated_at"] = datetime.utcnow()
+
+        # 写入器未启动（如脚本或测试环境）时直接写库
+        if not self.running:
+            self.queued += 1
+            await self._flush([record])
+            return True
+
+        if self.policy == POLICY_BLOCK:
+            await self._queue.put(record)
+        else:
+            try:
+                self._queue.put_nowait(record)
+            except asyncio.QueueFull:
+                self.dropped += 1
+                return False
+
+        self.queued += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """获取写入器统计信息"""
+        return {
+            "running": self.running,
+            "policy": self.policy,
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "queued": self.queued,
+            "flushed": self.flushed,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+
+            # 攒批：达到批量大小或等待超过刷新间隔即写入
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(insert(RequestLog.__table__).values(batch))
+                await db.commit()
+            self.flushed += len(batch)
+        except Exception as e:
+            self.failed += len(batch)
+            logger.warning("请求日志批量写入失败（%d 条）: %s", len(batch), e)
+
+
+# 全局日志写入器实例（每个进程一份）
+log_writer = LogWriter(
+    max_queue=settings.LOG_QUEUE_SIZE,
+    batch_size=settings.LOG_BATCH_SIZE,
+    flush_interval=settings.LOG_FLUSH_INTERVAL,
+    policy=settings.LOG_QUEUE_POLICY,
+)
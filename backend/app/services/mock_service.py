@@ -2,13 +2,32 @@
 Mock接口业务服务
 """
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-from sqlalchemy import and_
+from sqlalchemy import delete, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from ..models.category import Category
+from ..models.log import RequestLog
 from ..models.mock import MockAPI
-from ..schemas.mock import MockAPICreate, MockAPIUpdate
+from ..models.route_change import RouteChange
+from ..schemas.mock import (
+    MockAPICreate,
+    MockAPIUpdate,
+    MockBatchItemResult,
+    MockBatchResult,
+    MockBatchUpdateItem,
+)
+from ..utils.pagination import (
+    CountMode,
+    Page,
+    count_total,
+    decode_cursor,
+    encode_cursor,
+)
+from .route_table import record_route_change, route_table
 
 
 class MockService:
@@ -19,10 +38,339 @@ class MockService:
         """创建Mock接口"""
         db_mock = MockAPI(**mock_data.model_dump())
         db.add(db_mock)
+        record_route_change(db, db_mock)
         db.commit()
         db.refresh(db_mock)
+        route_table.upsert(db_mock)
         return db_mock
 
+    @staticmethod
+    def bulk_create(db: Session, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        批量创建Mock接口
+
+        以一条多行INSERT写入，并在同一事务中批量追加路由变更记录，提交后
+        再一次查询新接口修补路由表。
+
+        Args:
+            rows: 字段一致的Mock接口数据
+
+        Returns:
+            List[int]: 新建接口的ID（按ID升序）
+        """
+        created_ids, _ = MockService.bulk_write(db, creates=rows)
+        return created_ids
+
+    @staticmethod
+    def bulk_write(
+        db: Session,
+        creates: List[Dict[str, Any]] = (),
+        updates: List[Dict[str, Any]] = (),
+    ) -> Tuple[List[int], List[int]]:
+        """
+        在一个事务中批量创建与更新Mock接口
+
+        Args:
+            creates: 字段一致的新接口数据
+            updates: 含 id 的字段一致的更新数据，版本号自动加一
+
+        Returns:
+            tuple: (新建接口ID, 更新接口ID)
+        """
+        changes: List[Tuple[int, int]] = []
+        created_ids: List[int] = []
+        updated_ids: List[int] = []
+        try:
+            if creates:
+                created = MockService._insert_rows(db, creates)
+                created_ids = [mock_id for mock_id, _ in created]
+                changes.extend(created)
+            if updates:
+                updated = MockService._update_rows(db, updates)
+                updated_ids = [mock_id for mock_id, _ in updated]
+                changes.extend(updated)
+            if changes:
+                db.execute(
+                    insert(RouteChange),
+                    [
+                        {"mock_api_id": mock_id, "version": version}
+                        for mock_id, version in changes
+                    ],
+                )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        MockService.refresh_routes(db, [mock_id for mock_id, _ in changes])
+        return created_ids, updated_ids
+
+    @staticmethod
+    def bulk_delete(db: Session, mock_ids: List[int]) -> List[int]:
+        """
+        在一个事务中批量删除Mock接口
+
+        Returns:
+            List[int]: 实际删除的接口ID
+        """
+        deleted_ids = [
+            mock_id
+            for (mock_id,) in db.query(MockAPI.id).filter(MockAPI.id.in_(mock_ids))
+        ]
+        if not deleted_ids:
+            return []
+
+        try:
+            # 与单个删除时ORM的处理一致：先解除请求日志与接口的关联
+            db.execute(
+                update(RequestLog)
+                .where(RequestLog.mock_api_id.in_(deleted_ids))
+                .values(mock_api_id=None)
+            )
+            db.execute(delete(MockAPI).where(MockAPI.id.in_(deleted_ids)))
+            db.execute(
+                insert(RouteChange),
+                [{"mock_api_id": mock_id, "version": None} for mock_id in deleted_ids],
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        route_table.upsert_many((), removed_ids=deleted_ids)
+        return deleted_ids
+
+    @staticmethod
+    def refresh_routes(db: Session, mock_ids: List[int]) -> None:
+        """提交后一次查询变更的接口，整批修补本进程路由表"""
+        if mock_ids:
+            route_table.upsert_many(
+                db.query(MockAPI).filter(MockAPI.id.in_(mock_ids)).all()
+            )
+
+    @staticmethod
+    def batch_create(
+        db: Session, items: List[MockAPICreate], atomic: bool = True
+    ) -> MockBatchResult:
+        """
+        批量创建Mock接口，逐条返回结果
+
+        Args:
+            items: 已通过Schema校验的接口数据
+            atomic: 为True时任一条目失败则整批不写入
+        """
+        categories = MockService._existing_categories(
+            db, [item.category_id for item in items]
+        )
+        results: List[MockBatchItemResult] = []
+        rows: List[Dict[str, Any]] = []
+        for index, item in enumerate(items):
+            if item.category_id is not None and item.category_id not in categories:
+                results.append(
+                    MockBatchItemResult(
+                        index=index, status="invalid", error="所属分类不存在"
+                    )
+                )
+                continue
+            results.append(MockBatchItemResult(index=index, status="created"))
+            rows.append(item.model_dump())
+
+        if not MockService._should_write(results, atomic):
+            return MockService._batch_result(results, committed=False)
+
+        created_ids, _ = MockService.bulk_write(db, creates=rows)
+        # 多行INSERT按请求顺序分配自增ID
+        created = [result for result in results if result.status == "created"]
+        for result, mock_id in zip(created, created_ids):
+            result.id = mock_id
+        return MockService._batch_result(results, committed=True)
+
+    @staticmethod
+    def batch_update(
+        db: Session, items: List[MockBatchUpdateItem], atomic: bool = True
+    ) -> MockBatchResult:
+        """
+        批量更新Mock接口（每个条目只修改传入的字段），逐条返回结果
+
+        Args:
+            items: 已通过Schema校验的更新数据
+            atomic: 为True时任一条目失败则整批不写入
+        """
+        existing = {
+            mock_id
+            for (mock_id,) in db.query(MockAPI.id).filter(
+                MockAPI.id.in_({item.id for item in items})
+            )
+        }
+        categories = MockService._existing_categories(
+            db, [item.category_id for item in items]
+        )
+        results: List[MockBatchItemResult] = []
+        rows: List[Dict[str, Any]] = []
+        seen = set()
+        for index, item in enumerate(items):
+            error = None
+            status = "invalid"
+            if item.id in seen:
+                error = "同一批次中重复的接口ID"
+            elif item.id not in existing:
+                status, error = "not_found", "Mock接口不存在"
+            elif item.category_id is not None and item.category_id not in categories:
+                error = "所属分类不存在"
+            seen.add(item.id)
+            if error:
+                results.append(
+                    MockBatchItemResult(
+                        index=index, id=item.id, status=status, error=error
+                    )
+                )
+                continue
+            results.append(
+                MockBatchItemResult(index=index, id=item.id, status="updated")
+            )
+            rows.append(
+                {"id": item.id, **item.model_dump(exclude_unset=True, exclude={"id"})}
+            )
+
+        if not MockService._should_write(results, atomic):
+            return MockService._batch_result(results, committed=False)
+
+        _, updated_ids = MockService.bulk_write(db, updates=rows)
+        # 校验之后被其他请求删除的接口
+        updated = set(updated_ids)
+        for result in results:
+            if result.status == "updated" and result.id not in updated:
+                result.status, result.error = "not_found", "Mock接口不存在"
+        return MockService._batch_result(results, committed=True)
+
+    @staticmethod
+    def batch_delete(
+        db: Session, mock_ids: List[int], atomic: bool = True
+    ) -> MockBatchResult:
+        """
+        批量删除Mock接口，逐条返回结果
+
+        Args:
+            mock_ids: 要删除的接口ID
+            atomic: 为True时任一接口不存在则整批不删除
+        """
+        existing = {
+            mock_id
+            for (mock_id,) in db.query(MockAPI.id).filter(MockAPI.id.in_(set(mock_ids)))
+        }
+        results: List[MockBatchItemResult] = []
+        seen = set()
+        for index, mock_id in enumerate(mock_ids):
+            if mock_id in seen:
+                result = MockBatchItemResult(
+                    index=index, id=mock_id, status="invalid", error="同一批次中重复的接口ID"
+                )
+            elif mock_id not in existing:
+                result = MockBatchItemResult(
+                    index=index, id=mock_id, status="not_found", error="Mock接口不存在"
+                )
+            else:
+                result = MockBatchItemResult(index=index, id=mock_id, status="deleted")
+            seen.add(mock_id)
+            results.append(result)
+
+        if not MockService._should_write(results, atomic):
+            return MockService._batch_result(results, committed=False)
+
+        deleted = set(
+            MockService.bulk_delete(
+                db, [result.id for result in results if result.status == "deleted"]
+            )
+        )
+        for result in results:
+            if result.status == "deleted" and result.id not in deleted:
+                result.status, result.error = "not_found", "Mock接口不存在"
+        return MockService._batch_result(results, committed=True)
+
+    @staticmethod
+    def _existing_categories(
+        db: Session, category_ids: List[Optional[int]]
+    ) -> Set[int]:
+        """一次查询批次中引用的分类，返回存在的分类ID"""
+        wanted = {
+            category_id for category_id in category_ids if category_id is not None
+        }
+        if not wanted:
+            return set()
+        return {
+            category_id
+            for (category_id,) in db.query(Category.id).filter(Category.id.in_(wanted))
+        }
+
+    @staticmethod
+    def _should_write(results: List[MockBatchItemResult], atomic: bool) -> bool:
+        """判断批次是否写入；原子模式下有失败条目时把其余条目标记为未写入"""
+        failed = any(result.error for result in results)
+        if failed and atomic:
+            for result in results:
+                if not result.error:
+                    result.status = "skipped"
+            return False
+        return any(not result.error for result in results)
+
+    @staticmethod
+    def _batch_result(
+        results: List[MockBatchItemResult], committed: bool
+    ) -> MockBatchResult:
+        failed = sum(1 for result in results if result.error)
+        return MockBatchResult(
+            committed=committed,
+            succeeded=len(results) - failed if committed else 0,
+            failed=failed,
+            items=results,
+        )
+
+    @staticmethod
+    def _insert_rows(
+        db: Session, rows: List[Dict[str, Any]]
+    ) -> List[Tuple[int, int]]:
+        """多行INSERT写入新接口（不提交），返回与 rows 顺序一致的 [(id, 版本号)]"""
+        dialect = db.get_bind().dialect
+        if dialect.insert_executemany_returning_sort_by_parameter_order:
+            # 支持 RETURNING 的数据库（PostgreSQL、SQLite、MariaDB）按参数顺序返回新行
+            result = db.execute(
+                insert(MockAPI).returning(
+                    MockAPI.id, MockAPI.version, sort_by_parameter_order=True
+                ),
+                rows,
+            )
+            return [(mock_id, version) for mock_id, version in result]
+
+        # MySQL：一条多行INSERT的自增ID连续分配，lastrowid 为第一行的ID
+        result = db.execute(insert(MockAPI).values(rows))
+        first_id = result.lastrowid
+        if not first_id or result.rowcount != len(rows):
+            raise RuntimeError("无法获取批量插入的接口ID")
+        return [
+            (first_id + offset, row.get("version", 1))
+            for offset, row in enumerate(rows)
+        ]
+
+    @staticmethod
+    def _update_rows(
+        db: Session, rows: List[Dict[str, Any]]
+    ) -> List[Tuple[int, int]]:
+        """按主键批量UPDATE（不提交），返回 [(id, 新版本号)]"""
+        versions = dict(
+            db.query(MockAPI.id, MockAPI.version).filter(
+                MockAPI.id.in_([row["id"] for row in rows])
+            )
+        )
+        now = datetime.utcnow()
+        rows = [
+            {**row, "version": (versions[row["id"]] or 0) + 1, "updated_at": now}
+            for row in rows
+            if row["id"] in versions
+        ]
+        if rows:
+            db.execute(update(MockAPI), rows)
+        return [(row["id"], row["version"]) for row in rows]
+
     @staticmethod
     def get_mock(db: Session, mock_id: int) -> Optional[MockAPI]:
         """获取单个Mock接口"""
@@ -37,8 +385,15 @@ class MockService:
         method: Optional[str] = None,
         search: Optional[str] = None,
         category_id: Optional[int] = None,
-    ) -> tuple[List[MockAPI], int]:
-        """获取Mock接口列表"""
+        cursor: Optional[str] = None,
+        count: CountMode = "exact",
+    ) -> Page:
+        """
+        获取Mock接口列表（按ID升序）
+
+        传入 cursor 时按ID游标翻页并忽略 skip；
+        count 指定总数的统计方式（exact / estimated / none）。
+        """
         query = db.query(MockAPI)
 
         # 添加过滤条件
@@ -57,12 +412,30 @@ class MockService:
                 query = query.filter(MockAPI.category_id == category_id)
 
         # 获取总数
-        total = query.count()
+        filtered = any(
+            (is_active is not None, method, search, category_id is not None)
+        )
+        total, total_estimated = count_total(
+            db, query, count, MockAPI.__tablename__, filtered
+        )
+
+        query = query.order_by(MockAPI.id)
+        if cursor:
+            (last_id,) = decode_cursor("mocks", cursor, 1)
+            if not isinstance(last_id, int):
+                raise ValueError("无效的分页游标")
+            query = query.filter(MockAPI.id > last_id)
+        else:
+            query = query.offset(skip)
 
-        # 分页查询
-        items = query.offset(skip).limit(limit).all()
+        # 多取一条判断是否还有下一页
+        items = query.limit(limit + 1).all()
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor("mocks", [items[-1].id])
 
-        return items, total
+        return Page(items, total, total_estimated, next_cursor)
 
     @staticmethod
     def update_mock(
@@ -80,9 +453,11 @@ class MockService:
 
         # 更新版本号
         db_mock.version += 1
+        record_route_change(db, db_mock)
 
         db.commit()
         db.refresh(db_mock)
+        route_table.upsert(db_mock)
         return db_mock
 
     @staticmethod
@@ -93,7 +468,9 @@ class MockService:
             return False
 
         db.delete(db_mock)
+        record_route_change(db, db_mock, deleted=True)
         db.commit()
+        route_table.remove(mock_id)
         return True
 
     @staticmethod
@@ -104,21 +481,60 @@ class MockService:
             return None
 
         db_mock.is_active = not db_mock.is_active
+        record_route_change(db, db_mock)
         db.commit()
         db.refresh(db_mock)
+        route_table.upsert(db_mock)
         return db_mock
 
+
+class AsyncMockService:
+    """Mock接口异步服务类（供Mock代理与路由表同步使用）"""
+
     @staticmethod
-    def find_matching_mock(db: Session, method: str, path: str) -> Optional[MockAPI]:
-        """查找匹配的Mock接口"""
-        return (
-            db.query(MockAPI)
-            .filter(
-                and_(
-                    MockAPI.method == method,
-                    MockAPI.path == path,
-                    MockAPI.is_active == True,
-                )
-            )
-            .first()
+    async def get_active_mocks(db: AsyncSession) -> List[MockAPI]:
+        """获取全部启用的Mock接口"""
+        result = await db.execute(
+            select(MockAPI).where(MockAPI.is_active == True).order_by(MockAPI.id)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def get_mocks_by_ids(
+        db: AsyncSession, mock_ids: Iterable[int]
+    ) -> List[MockAPI]:
+        """按ID批量获取Mock接口"""
+        result = await db.execute(select(MockAPI).where(MockAPI.id.in_(mock_ids)))
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def get_change_seq_range(
+        db: AsyncSession,
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """获取路由变更序号范围 (最小序号, 最大序号)"""
+        result = await db.execute(
+            select(func.min(RouteChange.id), func.max(RouteChange.id))
+        )
+        return tuple(result.one())
+
+    @staticmethod
+    async def get_route_changes(
+        db: AsyncSession, after_seq: int, missing_seqs: Iterable[int] = ()
+    ) -> List[RouteChange]:
+        """获取指定序号之后的路由变更记录，以及之前尚未读到的指定序号"""
+        condition = RouteChange.id > after_seq
+        missing_seqs = list(missing_seqs)
+        if missing_seqs:
+            condition = or_(condition, RouteChange.id.in_(missing_seqs))
+        result = await db.execute(
+            select(RouteChange).where(condition).order_by(RouteChange.id)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def get_route_change_seqs(db: AsyncSession, after_seq: int) -> List[int]:
+        """获取指定序号之后已提交的变更序号"""
+        result = await db.execute(
+            select(RouteChange.id).where(RouteChange.id > after_seq)
         )
+        return list(result.scalars().all())
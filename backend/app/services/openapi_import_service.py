@@ -0,0 +1,243 @@
+"""
+OpenAPI / Swagger 批量导入服务
+
+逐个读取文档中的接口定义，按响应Schema合成示例响应，攒满一批后在一个
+事务中批量插入新接口、批量更新已存在的接口（按 方法+路径 判断）。
+接口的第一个 tag 映射为同名的顶级分类，缺少的分类按批创建。
+
+导入以生成器的形式运行，每写入一批产出一次进度，供API流式返回或CLI打印。
+"""
+
+import re
+import time
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..models.category import Category
+from ..models.mock import HTTPMethod, MockAPI
+from ..schemas.mock import OpenAPIImportOptions
+from ..utils.openapi import (
+    OPERATION_METHODS,
+    ExampleBuilder,
+    OpenAPIDocument,
+    build_example,
+    pick_response,
+    to_response_body,
+    to_response_template,
+)
+from ..utils.route_trie import compile_path
+from .mock_service import MockService
+
+# OpenAPI 路径参数名中不被路由语法接受的字符
+_PARAM_NAME_RE = re.compile(r"\{([^}]+)\}")
+
+# 导入时覆盖的字段（更新已存在的接口时只修改这些字段）
+_IMPORTED_FIELDS = (
+    "name",
+    "description",
+    "status_code",
+    "response_headers",
+    "response_body",
+    "response_template",
+)
+
+# 进度中保留的错误信息条数
+MAX_REPORTED_ERRORS = 20
+
+
+def convert_path(path: str, prefix: str = "") -> str:
+    """把 OpenAPI 路径转换为路由语法（参数名中的非法字符替换为下划线）"""
+    path = _PARAM_NAME_RE.sub(
+        lambda match: "{" + re.sub(r"\W", "_", match.group(1)) + "}", path
+    )
+    return (prefix.rstrip("/") + "/" + path.lstrip("/")).rstrip("/") or "/"
+
+
+class OpenAPIImportService:
+    """OpenAPI批量导入服务类"""
+
+    @staticmethod
+    def run(
+        db: Session, document: OpenAPIDocument, options: OpenAPIImportOptions
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        执行导入，每写入一批产出一次进度
+
+        Yields:
+            Dict: {"event": "progress" / "done", 统计计数...}
+        """
+        started = time.monotonic()
+        builder = ExampleBuilder(document, dynamic=options.dynamic_examples)
+        prefix = (options.path_prefix or "") + document.base_path
+
+        # (method, path) -> (id, 分类ID)，用于判断新建还是更新
+        existing = {
+            (method, path): (mock_id, category_id)
+            for mock_id, method, path, category_id in db.query(
+                MockAPI.id, MockAPI.method, MockAPI.path, MockAPI.category_id
+            ).order_by(MockAPI.id.desc())
+        }
+        categories = OpenAPIImportService._load_categories(db)
+        stats = {
+            "operations": 0,
+            "created": 0,
+            "updated": 0,
+            "skipped": 0,
+            "failed": 0,
+            "categories_created": 0,
+        }
+        errors: List[str] = []
+        seen: Set[Tuple[HTTPMethod, str]] = set()
+        batch: List[Dict[str, Any]] = []
+
+        def flush() -> Dict[str, Any]:
+            stats["categories_created"] += OpenAPIImportService._write_batch(
+                db, batch, existing, categories, options
+            )
+            batch.clear()
+            return {"event": "progress", **stats}
+
+        for raw_path, path_item in document.iter_paths():
+            path_item = document.resolve(path_item)
+            if not isinstance(path_item, dict):
+                continue
+            for method_name in OPERATION_METHODS:
+                operation = path_item.get(method_name)
+                if not isinstance(operation, dict):
+                    continue
+                stats["operations"] += 1
+
+                try:
+                    row = OpenAPIImportService._build_row(
+                        document, builder, prefix, raw_path, method_name, operation
+                    )
+                except Exception as e:
+                    stats["failed"] += 1
+                    if len(errors) < MAX_REPORTED_ERRORS:
+                        errors.append(f"{method_name.upper()} {raw_path}: {e}")
+                    continue
+
+                key = (row["method"], row["path"])
+                if key in seen or (key in existing and options.on_conflict == "skip"):
+                    stats["skipped"] += 1
+                    continue
+                seen.add(key)
+                stats["updated" if key in existing else "created"] += 1
+                batch.append(row)
+
+                if len(batch) >= settings.IMPORT_BATCH_SIZE:
+                    yield flush()
+
+        if batch:
+            yield flush()
+
+        yield {
+            "event": "done",
+            **stats,
+            "errors": errors,
+            "elapsed_ms": int((time.monotonic() - started) * 1000),
+        }
+
+    @staticmethod
+    def _build_row(
+        document: OpenAPIDocument,
+        builder: ExampleBuilder,
+        prefix: str,
+        raw_path: str,
+        method_name: str,
+        operation: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """把一个接口定义转换为Mock接口数据"""
+        path = convert_path(raw_path, prefix)
+        compile_path(path)
+        method = HTTPMethod(method_name.upper())
+
+        status_code, media_type, media = pick_response(document, operation)
+        example = build_example(builder, media)
+
+        response_body = None
+        response_template = None
+        if isinstance(example, dict):
+            response_body = to_response_body(example)
+        elif example is not None:
+            # 数组等非对象响应通过模板输出
+            response_template = to_response_template(example)
+        elif status_code != 204:
+            response_body = {}
+
+        tags = operation.get("tags")
+        return {
+            "name": (
+                operation.get("summary")
+                or operation.get("operationId")
+                or f"{method.value} {path}"
+            )[:255],
+            "description": operation.get("description"),
+            "method": method,
+            "path": path,
+            "status_code": status_code,
+            "response_headers": {"Content-Type": media_type} if media_type else None,
+            "response_body": response_body,
+            "response_template": response_template,
+            "tag": str(tags[0])[:50] if isinstance(tags, list) and tags else None,
+        }
+
+    @staticmethod
+    def _load_categories(db: Session) -> Dict[str, int]:
+        """顶级分类 名称 -> ID"""
+        return {
+            name: category_id
+            for category_id, name in db.query(Category.id, Category.name)
+            .filter(Category.parent_id.is_(None), Category.is_active == True)
+            .order_by(Category.id.desc())
+        }
+
+    @staticmethod
+    def _write_batch(
+        db: Session,
+        batch: List[Dict[str, Any]],
+        existing: Dict[Tuple[HTTPMethod, str], Tuple[int, Optional[int]]],
+        categories: Dict[str, int],
+        options: OpenAPIImportOptions,
+    ) -> int:
+        """在一个事务中写入一批接口，返回新建的分类数量"""
+        created_categories = 0
+        if options.categories_from_tags:
+            missing = {
+                row["tag"]
+                for row in batch
+                if row["tag"] and row["tag"] not in categories
+            }
+            if missing:
+                db.execute(
+                    insert(Category),
+                    [{"name": name, "is_active": True} for name in sorted(missing)],
+                )
+                categories.update(OpenAPIImportService._load_categories(db))
+                created_categories = len(missing)
+
+        creates: List[Dict[str, Any]] = []
+        updates: List[Dict[str, Any]] = []
+        for row in batch:
+            category_id = options.category_id
+            if options.categories_from_tags and row["tag"]:
+                category_id = categories[row["tag"]]
+
+            data = {field: row[field] for field in _IMPORTED_FIELDS}
+            current = existing.get((row["method"], row["path"]))
+            if current is not None:
+                # 没有可用的分类时保留接口原有的分类
+                mock_id, current_category_id = current
+                data["category_id"] = (
+                    current_category_id if category_id is None else category_id
+                )
+                updates.append({"id": mock_id, **data})
+            else:
+                data["category_id"] = category_id
+                creates.append({**data, "method": row["method"], "path": row["path"]})
+
+        MockService.bulk_write(db, creates=creates, updates=updates)
+        return created_categories
@@ -0,0 +1,267 @@
+"""
+日志转Mock服务（录制回放）
+
+把请求日志中的真实请求/响应（如上游透传录制的流量）批量转换为Mock接口：
+
+- 按日志ID分批扫描（keyset分页），每批只读取需要的列，内存占用与日志总量无关
+- 按 (方法, 规范化路径, 关键查询参数) 的哈希去重，每个组合只保留第一条
+- 同一 (方法, 规范化路径) 的不同关键参数组合生成该接口的条件响应规则
+- 新接口以多行INSERT分批写入，并同步记录路由变更
+"""
+
+import hashlib
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.json_codec import json_codec
+from ..models.log import RequestLog
+from ..models.mock import HTTPMethod, MockAPI
+from ..schemas.log import LogPromoteRequest, LogPromoteResult, PromotedRoute
+from ..utils.route_trie import route_shape
+from .mock_service import MockService
+
+# 视为资源ID的路径段：纯数字、UUID、长十六进制串（如 ObjectId）
+_ID_SEGMENT_RE = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|[0-9a-fA-F]{24,})$"
+)
+
+# 日志中被截断或无法解码的响应体格式（见 LazyRequestBody.preview 与上游透传）
+_CAPTURE_KEYS = ({"raw", "truncated"}, {"content_encoding", "size"})
+
+
+def normalize_path(path: str, parameterize_ids: bool = True) -> str:
+    """
+    规范化请求路径：合并多余的斜杠、去掉末尾斜杠，可选地把ID段替换为路径参数
+
+    例如 ``/users/42/orders/7/`` -> ``/users/{id}/orders/{id2}``
+    """
+    segments = [segment for segment in path.split("/") if segment]
+    count = 0
+    for index, segment in enumerate(segments):
+        if parameterize_ids and _ID_SEGMENT_RE.match(segment):
+            count += 1
+            segments[index] = "{id}" if count == 1 else f"{{id{count}}}"
+    return "/" + "/".join(segments)
+
+
+def _route_hash(method: str, path: str, key_values: List[Optional[str]]) -> bytes:
+    """去重键：(方法, 规范化路径, 关键参数值) 的定长摘要"""
+    return hashlib.blake2b(
+        json_codec.dumps([method, path, key_values]), digest_size=16
+    ).digest()
+
+
+def _is_complete(body: Any) -> bool:
+    """响应体是否为可以直接回放的完整JSON对象"""
+    if not isinstance(body, dict):
+        return False
+    keys = set(body)
+    return not any(keys == capture for capture in _CAPTURE_KEYS)
+
+
+def _content_type(headers: Optional[Dict[str, Any]]) -> Optional[str]:
+    for name, value in (headers or {}).items():
+        if name.lower() == "content-type":
+            return value
+    return None
+
+
+class _PendingMock:
+    """扫描过程中待创建的Mock接口"""
+
+    __slots__ = ("log_id", "response", "rules")
+
+    def __init__(self, log_id: int):
+        self.log_id = log_id
+        # 不带关键参数的请求对应的响应
+        self.response: Optional[Dict[str, Any]] = None
+        self.rules: List[Dict[str, Any]] = []
+
+
+class LogPromotionService:
+    """日志转Mock服务类"""
+
+    @staticmethod
+    def promote(db: Session, options: LogPromoteRequest) -> LogPromoteResult:
+        """按筛选条件把请求日志批量转换为Mock接口"""
+        result = LogPromotionService._scan(db, options)
+        pending: Dict[Tuple[str, str], _PendingMock] = result.pop("pending")
+
+        rows = [
+            LogPromotionService._build_row(method, path, item, options.category_id)
+            for (method, path), item in pending.items()
+        ]
+        created_ids: List[int] = []
+        if not options.dry_run:
+            batch_size = settings.PROMOTE_INSERT_BATCH_SIZE
+            for offset in range(0, len(rows), batch_size):
+                created_ids.extend(
+                    MockService.bulk_create(db, rows[offset : offset + batch_size])
+                )
+
+        return LogPromoteResult(
+            **result,
+            created=len(created_ids) if not options.dry_run else len(rows),
+            rule_count=sum(len(row["response_rules"] or ()) for row in rows),
+            dry_run=options.dry_run,
+            routes=[
+                PromotedRoute(
+                    method=row["method"].value,
+                    path=row["path"],
+                    rules=len(row["response_rules"] or ()),
+                    source_log_id=item.log_id,
+                )
+                for row, item in zip(
+                    rows[: settings.PROMOTE_PREVIEW_LIMIT], pending.values()
+                )
+            ],
+        )
+
+    @staticmethod
+    def _scan(db: Session, options: LogPromoteRequest) -> Dict[str, Any]:
+        """分批扫描日志，按哈希去重并归并到待创建的接口"""
+        # 已有接口按 (方法, 路径形状) 比较，参数名不同的同一路由也视为已存在
+        existing = set()
+        for method, path in db.query(MockAPI.method, MockAPI.path):
+            try:
+                existing.add((method, route_shape(path)))
+            except ValueError:
+                # 历史数据中的非法路径模式不参与比较
+                continue
+        key_params = options.key_params
+
+        query = db.query(
+            RequestLog.id,
+            RequestLog.request_method,
+            RequestLog.request_path,
+            RequestLog.request_params,
+            RequestLog.response_status_code,
+            RequestLog.response_headers,
+            RequestLog.response_body,
+        )
+        if options.unmatched_only:
+            query = query.filter(RequestLog.mock_api_id.is_(None))
+        if options.method:
+            query = query.filter(RequestLog.request_method == options.method)
+        if options.path_prefix:
+            query = query.filter(
+                RequestLog.request_path.startswith(options.path_prefix)
+            )
+        if not options.include_errors:
+            query = query.filter(RequestLog.response_status_code < 400)
+        if options.start_date:
+            query = query.filter(RequestLog.created_at >= options.start_date)
+        if options.end_date:
+            query = query.filter(RequestLog.created_at <= options.end_date)
+
+        seen: Set[bytes] = set()
+        pending: Dict[Tuple[str, str], _PendingMock] = {}
+        counts = {
+            "scanned": 0,
+            "duplicates": 0,
+            "skipped_existing": 0,
+            "skipped_incomplete": 0,
+        }
+
+        last_id = 0
+        while True:
+            batch = (
+                query.filter(RequestLog.id > last_id)
+                .order_by(RequestLog.id)
+                .limit(settings.PROMOTE_SCAN_BATCH_SIZE)
+                .all()
+            )
+            if not batch:
+                break
+            last_id = batch[-1].id
+            counts["scanned"] += len(batch)
+
+            for log in batch:
+                try:
+                    method = HTTPMethod(log.request_method)
+                    path = normalize_path(log.request_path, options.parameterize_ids)
+                    shape = route_shape(path)
+                except ValueError:
+                    counts["skipped_incomplete"] += 1
+                    continue
+
+                if (method, shape) in existing:
+                    counts["skipped_existing"] += 1
+                    continue
+                if not _is_complete(log.response_body):
+                    counts["skipped_incomplete"] += 1
+                    continue
+
+                params = log.request_params or {}
+                key_values = [params.get(name) for name in key_params]
+                digest = _route_hash(method.value, path, key_values)
+                if digest in seen:
+                    counts["duplicates"] += 1
+                    continue
+                seen.add(digest)
+
+                response = {
+                    "status_code": log.response_status_code or 200,
+                    "response_body": log.response_body,
+                }
+                content_type = _content_type(log.response_headers)
+                if content_type:
+                    response["response_headers"] = {"Content-Type": content_type}
+
+                item = pending.get((method, path))
+                if item is None:
+                    item = pending[(method, path)] = _PendingMock(log.id)
+
+                if all(value is None for value in key_values):
+                    item.response = response
+                else:
+                    # 关键参数组合生成条件规则，缺失的参数要求请求中也不存在
+                    conditions = [
+                        {"source": "query", "key": name, "op": "eq", "value": value}
+                        if value is not None
+                        else {"source": "query", "key": name, "op": "not_exists"}
+                        for name, value in zip(key_params, key_values)
+                    ]
+                    item.rules.append(
+                        {
+                            "name": "&".join(
+                                f"{name}={value}"
+                                for name, value in zip(key_params, key_values)
+                                if value is not None
+                            )[:100],
+                            "conditions": conditions,
+                            **response,
+                        }
+                    )
+
+        return {**counts, "pending": pending}
+
+    @staticmethod
+    def _build_row(
+        method: HTTPMethod, path: str, item: _PendingMock, category_id: Optional[int]
+    ) -> Dict[str, Any]:
+        """生成批量插入的Mock接口数据（字段一致）"""
+        # 没有不带关键参数的请求时，以第一条规则的响应作为默认响应
+        response = item.response
+        if response is None:
+            response = {
+                key: value
+                for key, value in item.rules[0].items()
+                if key not in ("name", "conditions")
+            }
+        return {
+            "name": f"{method.value} {path}"[:255],
+            "description": f"由请求日志 #{item.log_id} 生成",
+            "method": method,
+            "path": path,
+            "status_code": response["status_code"],
+            "response_headers": response.get("response_headers"),
+            "response_body": response["response_body"],
+            "response_rules": item.rules or None,
+            "category_id": category_id,
+            "is_active": True,
+        }
@@ -0,0 +1,186 @@
+"""
+令牌桶限流模拟服务
+
+为配置了限流的Mock接口（或其每个客户端IP）维护一个令牌桶，桶空时
+Mock代理返回 429 并给出 Retry-After，用于模拟上游接口的配额限制。
+
+令牌桶存储可插拔：
+
+- local：进程内字典，每次请求O(1)，在事件循环中同步完成，无需加锁
+- redis：令牌桶保存在Redis中，通过Lua脚本原子更新，限额在多个worker间共享
+"""
+
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.config import settings
+from ..models.mock import RateLimitScope
+
+# (是否放行, 需要等待的秒数)
+Decision = Tuple[bool, float]
+
+
+class RateLimiterBackend(ABC):
+    """令牌桶存储接口"""
+
+    name = "base"
+
+    @abstractmethod
+    async def acquire(self, key: str, capacity: int, refill_per_sec: float) -> Decision:
+        """尝试从令牌桶取一个令牌"""
+
+    async def close(self) -> None:
+        """释放存储占用的资源"""
+
+    def stats(self) -> Dict[str, Any]:
+        """获取存储统计信息"""
+        return {"backend": self.name}
+
+
+def _take_token(
+    tokens: float, elapsed: float, capacity: int, refill_per_sec: float
+) -> Tuple[float, Decision]:
+    """令牌桶计算：补充经过时间内的令牌后尝试扣减一个"""
+    tokens = min(capacity, tokens + elapsed * refill_per_sec)
+    if tokens >= 1:
+        return tokens - 1, (True, 0.0)
+    return tokens, (False, (1 - tokens) / refill_per_sec)
+
+
+class LocalRateLimiter(RateLimiterBackend):
+    """进程内令牌桶（每个worker独立计数）"""
+
+    name = "local"
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        # key -> [剩余令牌, 上次更新时间]，按最近使用排序
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    async def acquire(self, key: str, capacity: int, refill_per_sec: float) -> Decision:
+        # 整个过程没有await，在事件循环中天然原子
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(capacity), now]
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+
+        bucket[0], decision = _take_token(
+            bucket[0], now - bucket[1], capacity, refill_per_sec
+        )
+        bucket[1] = now
+        return decision
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.name, "buckets": len(self._buckets)}
+
+
+# Redis令牌桶脚本：使用Redis服务器时间，保证多实例间时钟一致
+_REDIS_TOKEN_BUCKET = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(now - ts, 0) * rate)
+local allowed = 0
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+return {allowed, tostring(wait)}
+"""
+
+
+class RedisRateLimiter(RateLimiterBackend):
+    """Redis令牌桶（跨worker共享，需要安装 redis 包）"""
+
+    name = "redis"
+
+    def __init__(self, url: str, prefix: str = "mocker:ratelimit:"):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis 需要安装 redis 包") from e
+
+        self.prefix = prefix
+        self._client = redis.from_url(url)
+        self._script = self._client.register_script(_REDIS_TOKEN_BUCKET)
+
+    async def acquire(self, key: str, capacity: int, refill_per_sec: float) -> Decision:
+        allowed, wait = await self._script(
+            keys=[self.prefix + key], args=[capacity, refill_per_sec]
+        )
+        return bool(allowed), float(wait)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+def create_rate_limiter(backend: str) -> RateLimiterBackend:
+    """按配置创建令牌桶存储"""
+    if backend == "local":
+        return LocalRateLimiter(settings.RATE_LIMIT_MAX_KEYS)
+    if backend == "redis":
+        return RedisRateLimiter(settings.REDIS_URL)
+    raise ValueError(f"不支持的限流存储: {backend}")
+
+
+# 全局令牌桶存储实例
+rate_limiter = create_rate_limiter(settings.RATE_LIMIT_BACKEND)
+
+
+class RateLimitService:
+    """限流模拟服务类"""
+
+    @staticmethod
+    async def check(mock_api, client_ip: Optional[str]) -> Optional[int]:
+        """
+        检查本次请求是否超出Mock接口的限流配置
+
+        Returns:
+            Optional[int]: 被限流时返回 Retry-After 秒数，放行时返回 None
+        """
+        capacity = mock_api.rate_limit_capacity
+        if not capacity:
+            return None
+
+        key = str(mock_api.id)
+        if mock_api.rate_limit_scope == RateLimitScope.CLIENT_IP:
+            key = f"{key}:{client_ip or '-'}"
+
+        allowed, wait = await rate_limiter.acquire(
+            key, capacity, mock_api.rate_limit_refill_per_sec or capacity
+        )
+        if allowed:
+            return None
+        return max(math.ceil(wait), 1)
+
+    @staticmethod
+    def too_many_requests(
+        mock_api, retry_after: int
+    ) -> Tuple[Dict[str, Any], Dict[str, str], int]:
+        """生成限流响应：(响应体, 响应头, 状态码)"""
+        return (
+            {
+                "error": "Too Many Requests",
+                "message": "Rate limit exceeded",
+                "mock_id": mock_api.id,
+                "retry_after": retry_after,
+            },
+            {"Content-Type": "application/json", "Retry-After": str(retry_after)},
+            429,
+        )
@@ -0,0 +1,125 @@
+"""
+路由表加载与跨进程同步
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal
+from ..models.route_change import RouteChange
+from .mock_service import AsyncMockService
+from .route_table import route_table
+
+logger = logging.getLogger(__name__)
+
+
+def _track_gaps(after_seq: int, upper_seq: int, seen_seqs: Iterable[int]) -> None:
+    """
+    记录 (after_seq, upper_seq) 之间尚未读到的变更序号
+
+    自增ID在插入时分配，但事务可能晚于序号更大的事务提交；这些序号在之后
+    的轮询中继续查询，超过 ROUTE_SYNC_GAP_TIMEOUT 仍未出现视为事务已回滚。
+    """
+    now = time.monotonic()
+    gaps = route_table.seq_gaps
+    seen = set(seen_seqs)
+    for seq in seen:
+        gaps.pop(seq, None)
+
+    # 从最大序号向下查找，离最大序号越近越可能是仍在进行的事务
+    seq = upper_seq - 1
+    while seq > after_seq and len(gaps) < settings.ROUTE_SYNC_MAX_GAPS:
+        if seq not in seen and seq not in gaps:
+            gaps[seq] = now
+        seq -= 1
+
+    expire_at = now - settings.ROUTE_SYNC_GAP_TIMEOUT
+    for seq, found_at in list(gaps.items()):
+        if found_at < expire_at:
+            del gaps[seq]
+
+
+async def load_route_table(db: AsyncSession) -> int:
+    """从数据库全量加载路由表，返回加载数量"""
+    # 先读取变更序号再加载数据，加载期间产生的变更会在下次同步时重放
+    min_seq, max_seq = await AsyncMockService.get_change_seq_range(db)
+    max_seq = max_seq or 0
+    # 最大序号之前尚未提交的变更无法通过 id > change_seq 读到，记为空洞
+    window_start = max(max_seq - settings.ROUTE_SYNC_MAX_GAPS, (min_seq or 1) - 1)
+    seen = await AsyncMockService.get_route_change_seqs(db, window_start)
+    mocks = await AsyncMockService.get_active_mocks(db)
+    count = route_table.replace_all(mocks, max_seq)
+    route_table.seq_gaps.clear()
+    _track_gaps(window_start, max_seq, seen)
+    return count
+
+
+async def ensure_route_table_loaded(db: AsyncSession) -> None:
+    """路由表尚未加载时执行全量加载"""
+    if not route_table.loaded:
+        await load_route_table(db)
+
+
+async def sync_route_table(db: AsyncSession) -> int:
+    """
+    拉取其他进程产生的路由变更，只重新加载变更过的接口
+
+    Returns:
+        int: 实际更新的接口数量
+    """
+    if not route_table.loaded:
+        return await load_route_table(db)
+
+    # 变更记录已被清理到本地序号之后，无法增量同步，退化为全量加载
+    min_seq, _ = await AsyncMockService.get_change_seq_range(db)
+    if min_seq is not None and min_seq > route_table.change_seq + 1:
+        return await load_route_table(db)
+
+    after_seq = route_table.change_seq
+    changes = await AsyncMockService.get_route_changes(
+        db, after_seq, route_table.seq_gaps
+    )
+    max_seq = max([after_seq, *(change.id for change in changes)])
+    _track_gaps(after_seq, max_seq, (change.id for change in changes))
+    if not changes:
+        return 0
+
+    changed_ids = {change.mock_api_id for change in changes}
+    mocks = await AsyncMockService.get_mocks_by_ids(db, changed_ids)
+    return route_table.apply_changes(max_seq, changed_ids, mocks)
+
+
+async def prune_route_changes(db: AsyncSession) -> None:
+    """清理过期的路由变更记录"""
+    expire_at = datetime.utcnow() - timedelta(
+        hours=settings.ROUTE_CHANGE_RETENTION_HOURS
+    )
+    await db.execute(delete(RouteChange).where(RouteChange.created_at < expire_at))
+    await db.commit()
+
+
+async def run_route_sync() -> None:
+    """后台路由同步任务，变更在 ROUTE_SYNC_INTERVAL 秒内传播到本进程"""
+    interval = settings.ROUTE_SYNC_INTERVAL
+    prune_every = max(int(3600 / interval), 1)
+    rounds = 0
+
+    while True:
+        await asyncio.sleep(interval)
+        rounds += 1
+        try:
+            async with AsyncSessionLocal() as db:
+                updated = await sync_route_table(db)
+                if rounds % prune_every == 0:
+                    await prune_route_changes(db)
+            if updated:
+                logger.info("路由表已同步 %d 条变更接口", updated)
+        except Exception as e:
+            logger.warning("路由表同步失败: %s", e)
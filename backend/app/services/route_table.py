@@ -0,0 +1,303 @@
+"""
+Mock路由表（进程内缓存）
+
+启动时加载所有启用的Mock接口，Mock代理命中时不再访问数据库。
+管理接口提交变更后通过 upsert/remove 增量修补路由表。
+
+静态路径走 (method, path) 哈希精确匹配；包含路径参数、正则段或通配符的
+路径按HTTP方法编入基数树（见 utils/route_trie.py）。
+
+多worker部署时，变更会同时写入 route_changes 表，各进程周期性拉取
+其他worker产生的变更，只重新加载变更过的接口（见 route_sync.py）。
+
+按接口ID缓存编译结果、限制器等状态的模块通过 add_remove_listener 注册
+回调，接口被删除、停用或整表重载后不再存在时一并清理。
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..models.mock import MockAPI
+from ..models.route_change import RouteChange
+from ..utils.response_generator import VersionedCache
+from ..utils.route_trie import RouteTrie, is_dynamic_path
+
+logger = logging.getLogger(__name__)
+
+
+class CachedMock:
+    """Mock接口快照（脱离数据库会话的只读副本）"""
+
+    __slots__ = (
+        "id",
+        "name",
+        "method",
+        "path",
+        "status_code",
+        "response_headers",
+        "response_body",
+        "response_template",
+        "pretty_json",
+        "response_rules",
+        "response_variants",
+        "variant_seed",
+        "is_active",
+        "version",
+        "category_id",
+        "log_level",
+        "log_sample_rate",
+        "log_errors_always",
+        "latency_profile",
+        "latency_ms",
+        "latency_max_ms",
+        "latency_stddev_ms",
+        "throttle_bytes_per_sec",
+        "rate_limit_capacity",
+        "rate_limit_refill_per_sec",
+        "rate_limit_scope",
+        "max_concurrency",
+        "max_queue_depth",
+    )
+
+    def __init__(self, mock: MockAPI):
+        self.id = mock.id
+        self.name = mock.name
+        self.method = getattr(mock.method, "value", mock.method)
+        self.path = mock.path
+        self.status_code = mock.status_code
+        self.response_headers = mock.response_headers
+        self.response_body = mock.response_body
+        self.response_template = mock.response_template
+        self.pretty_json = mock.pretty_json
+        self.response_rules = mock.response_rules
+        self.response_variants = mock.response_variants
+        self.variant_seed = mock.variant_seed
+        self.is_active = mock.is_active
+        self.version = mock.version
+        self.category_id = mock.category_id
+        self.log_level = mock.log_level
+        self.log_sample_rate = mock.log_sample_rate
+        self.log_errors_always = mock.log_errors_always
+        self.latency_profile = mock.latency_profile
+        self.latency_ms = mock.latency_ms
+        self.latency_max_ms = mock.latency_max_ms
+        self.latency_stddev_ms = mock.latency_stddev_ms
+        self.throttle_bytes_per_sec = mock.throttle_bytes_per_sec
+        self.rate_limit_capacity = mock.rate_limit_capacity
+        self.rate_limit_refill_per_sec = mock.rate_limit_refill_per_sec
+        self.rate_limit_scope = mock.rate_limit_scope
+        self.max_concurrency = mock.max_concurrency
+        self.max_queue_depth = mock.max_queue_depth
+
+    def __repr__(self):
+        return f"<CachedMock(id={self.id}, method='{self.method}', path='{self.path}', version={self.version})>"
+
+
+class RouteTable:
+    """按 (method, path) 索引的Mock路由表"""
+
+    def __init__(self):
+        # 同一 (method, path) 可能存在多条记录，按ID升序保存，取第一条
+        self._routes: Dict[Tuple[str, str], List[CachedMock]] = {}
+        self._tries: Dict[str, RouteTrie] = {}
+        self._keys_by_id: Dict[int, Tuple[str, str]] = {}
+        self._cached_by_id: Dict[int, CachedMock] = {}
+        # 管理接口运行在线程池中，写操作需要加锁；读操作无锁
+        self._lock = threading.Lock()
+        self.loaded = False
+        # 已应用的最大变更序号（route_changes.id）
+        self.change_seq = 0
+        # 小于 change_seq 但尚未读到的变更序号 -> 首次发现的时间（monotonic）
+        # 自增ID按插入顺序分配，但事务不一定按序提交，这些序号需要继续查询
+        self.seq_gaps: Dict[int, float] = {}
+        # 接口移出路由表时的回调，参数为移出的接口ID
+        self._remove_listeners: List[Callable[[List[int]], None]] = []
+
+    def add_remove_listener(self, callback: Callable[[List[int]], None]) -> None:
+        """注册接口移出路由表时的回调，用于清理按接口ID缓存的状态"""
+        self._remove_listeners.append(callback)
+
+    def replace_all(self, mocks: Iterable[MockAPI], change_seq: int) -> int:
+        """用给定的启用接口整体替换路由表，返回加载数量"""
+        routes: Dict[Tuple[str, str], List[CachedMock]] = {}
+        tries: Dict[str, RouteTrie] = {}
+        keys_by_id: Dict[int, Tuple[str, str]] = {}
+        cached_by_id: Dict[int, CachedMock] = {}
+        for mock in mocks:
+            cached = CachedMock(mock)
+            key = (cached.method, cached.path)
+            try:
+                self._add(routes, tries, cached)
+            except ValueError:
+                # 历史数据中的非法路径模式不参与匹配
+                continue
+            keys_by_id[cached.id] = key
+            cached_by_id[cached.id] = cached
+
+        with self._lock:
+            removed_ids = [
+                mock_id for mock_id in self._keys_by_id if mock_id not in keys_by_id
+            ]
+            self._routes = routes
+            self._tries = tries
+            self._keys_by_id = keys_by_id
+            self._cached_by_id = cached_by_id
+            self.change_seq = change_seq
+            self.loaded = True
+
+        self._notify_removed(removed_ids)
+        return len(keys_by_id)
+
+    def upsert(self, mock: MockAPI) -> None:
+        """
+        新增或更新单个Mock接口
+
+        未启用的接口会被移出路由表；路径模式无法编译的接口记录警告后
+        不参与匹配（数据库中的修改已经提交，不因此报错）。
+        """
+        cached = CachedMock(mock)
+        added = False
+        with self._lock:
+            self._discard(cached.id)
+            if cached.is_active:
+                added = self._try_add(cached)
+        if not added:
+            self._notify_removed([cached.id])
+
+    def remove(self, mock_id: int) -> None:
+        """从路由表移除Mock接口"""
+        with self._lock:
+            self._discard(mock_id)
+        self._notify_removed([mock_id])
+
+    def upsert_many(
+        self, mocks: Iterable[MockAPI], removed_ids: Iterable[int] = ()
+    ) -> None:
+        """批量新增、更新或移除Mock接口，整批只加一次锁"""
+        cached_mocks = [CachedMock(mock) for mock in mocks]
+        removed_ids = list(removed_ids)
+        with self._lock:
+            for mock_id in removed_ids:
+                self._discard(mock_id)
+            for cached in cached_mocks:
+                self._discard(cached.id)
+                if not (cached.is_active and self._try_add(cached)):
+                    removed_ids.append(cached.id)
+        self._notify_removed(removed_ids)
+
+    def apply_changes(
+        self, change_seq: int, changed_ids: Iterable[int], mocks: Iterable[MockAPI]
+    ) -> int:
+        """
+        应用其他进程产生的路由变更
+
+        Args:
+            change_seq: 本批变更的最大序号
+            changed_ids: 发生变更的接口ID
+            mocks: 变更接口的最新数据（已删除的接口不在其中）
+
+        Returns:
+            int: 实际更新的接口数量
+        """
+        latest = {mock.id: mock for mock in mocks}
+        updated = 0
+        for mock_id in changed_ids:
+            mock = latest.get(mock_id)
+            cached = self._cached_by_id.get(mock_id)
+            if mock is None or not mock.is_active:
+                if cached is not None:
+                    self.remove(mock_id)
+                    updated += 1
+            elif cached is None or cached.version != mock.version:
+                self.upsert(mock)
+                updated += 1
+
+        self.change_seq = max(self.change_seq, change_seq)
+        return updated
+
+    def match(
+        self, method: str, path: str
+    ) -> Optional[Tuple[CachedMock, Dict[str, str]]]:
+        """查找匹配的Mock接口，返回 (Mock快照, 路径参数)"""
+        entries = self._routes.get((method, path))
+        if entries:
+            return entries[0], {}
+
+        trie = self._tries.get(method)
+        if trie is None:
+            return None
+        return trie.match(path)
+
+    def __len__(self):
+        return len(self._keys_by_id)
+
+    def _try_add(self, cached: CachedMock) -> bool:
+        """加入路由表（需持有锁），路径模式无法编译时记录警告并跳过"""
+        try:
+            self._add(self._routes, self._tries, cached)
+        except ValueError as e:
+            logger.warning("Mock接口 %s 的路径无法加入路由表: %s", cached.id, e)
+            return False
+        self._keys_by_id[cached.id] = (cached.method, cached.path)
+        self._cached_by_id[cached.id] = cached
+        return True
+
+    def _notify_removed(self, mock_ids: List[int]) -> None:
+        if not mock_ids:
+            return
+        for callback in self._remove_listeners:
+            callback(mock_ids)
+
+    @staticmethod
+    def _add(
+        routes: Dict[Tuple[str, str], List[CachedMock]],
+        tries: Dict[str, RouteTrie],
+        cached: CachedMock,
+    ) -> None:
+        if is_dynamic_path(cached.path):
+            trie = tries.get(cached.method)
+            if trie is None:
+                trie = tries[cached.method] = RouteTrie()
+            trie.insert(cached.path, cached)
+            return
+
+        key = (cached.method, cached.path)
+        entries = [*routes.get(key, []), cached]
+        entries.sort(key=lambda item: item.id)
+        routes[key] = entries
+
+    def _discard(self, mock_id: int) -> None:
+        self._cached_by_id.pop(mock_id, None)
+        key = self._keys_by_id.pop(mock_id, None)
+        if key is None:
+            return
+
+        method, path = key
+        if is_dynamic_path(path):
+            trie = self._tries.get(method)
+            if trie is not None:
+                trie.remove(path, mock_id)
+            return
+
+        entries = [item for item in self._routes.get(key, []) if item.id != mock_id]
+        if entries:
+            self._routes[key] = entries
+        else:
+            self._routes.pop(key, None)
+
+
+# 全局路由表实例（每个进程一份）
+route_table = RouteTable()
+route_table.add_remove_listener(VersionedCache.discard_all)
+
+
+def record_route_change(db: Session, mock: MockAPI, deleted: bool = False) -> None:
+    """在当前事务中追加一条路由变更记录（需在commit之前调用）"""
+    if mock.id is None:
+        db.flush()
+    db.add(
+        RouteChange(mock_api_id=mock.id, version=None if deleted else mock.version)
+    )
@@ -0,0 +1,316 @@
+"""
+Mock数据导出 / 导入服务（NDJSON）
+
+用于在不同环境的Mocker实例之间整体迁移接口数据。导出文件每行一条记录：
+
+- ``{"type": "meta", ...}``：格式版本与导出时间
+- ``{"type": "category", "id": ..., "parent_id": ..., ...}``：分类，按树的层级
+  输出（父分类总在子分类之前），parent_id 即树形关系
+- ``{"type": "mock", "id": ..., "category_id": ..., ...}``：Mock接口
+
+导出按层级/全表使用服务端游标分批读取，内存占用与数据量无关。导入逐行
+读取：分类按 (名称, 父分类) 匹配已有分类，接口按 (方法, 路径) 匹配已有
+接口，攒满一批后批量插入或更新；文件中的 parent_id / category_id 按导入
+过程中建立的 旧ID -> 新ID 映射重写。
+"""
+
+import time
+from collections import deque
+from datetime import datetime
+from enum import Enum
+from typing import IO, Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.json_codec import json_codec
+from ..models.category import Category
+from ..models.mock import HTTPMethod, MockAPI
+from ..schemas.category import CategoryBase
+from ..schemas.mock import MockAPICreate, MockImportOptions
+from .mock_service import MockService
+from .openapi_import_service import MAX_REPORTED_ERRORS
+from .upstream_service import upstream_table
+
+# 导出格式版本
+EXPORT_FORMAT_VERSION = 1
+
+# 导出的字段（与创建Schema一致，另加原ID）
+_CATEGORY_FIELDS = ("id", *CategoryBase.model_fields)
+_MOCK_FIELDS = ("id", *MockAPICreate.model_fields)
+
+
+def _to_record(record_type: str, row: Any, fields: Tuple[str, ...]) -> Dict[str, Any]:
+    record = {"type": record_type}
+    for field in fields:
+        value = row[field]
+        record[field] = value.value if isinstance(value, Enum) else value
+    return record
+
+
+def iter_ndjson(fileobj: IO[bytes]) -> Iterator[Tuple[int, Any]]:
+    """逐行解析NDJSON，产出 (行号, 记录)；无法解析的行产出 (行号, ValueError)"""
+    for line_no, line in enumerate(fileobj, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_no, json_codec.loads(line)
+        except ValueError as e:
+            yield line_no, ValueError(f"JSON格式错误: {e}")
+
+
+class MockTransferService:
+    """Mock数据导出 / 导入服务类"""
+
+    @staticmethod
+    def export(db: Session) -> Iterator[bytes]:
+        """按 meta、分类（按层级）、接口的顺序逐行产出NDJSON"""
+        yield MockTransferService._line(
+            {
+                "type": "meta",
+                "format": "mocker-export",
+                "version": EXPORT_FORMAT_VERSION,
+                "exported_at": datetime.utcnow().isoformat(),
+            }
+        )
+
+        category_columns = [Category.__table__.c[field] for field in _CATEGORY_FIELDS]
+        exported = set()
+        level: Optional[List[int]] = None
+        while level is None or level:
+            query = select(*category_columns).order_by(Category.id)
+            if level is None:
+                query = query.where(Category.parent_id.is_(None))
+            else:
+                query = query.where(Category.parent_id.in_(level))
+            next_level: List[int] = []
+            for row in MockTransferService._stream(db, query):
+                if row.id in exported:
+                    continue
+                exported.add(row.id)
+                next_level.append(row.id)
+                yield MockTransferService._line(
+                    _to_record("category", row._mapping, _CATEGORY_FIELDS)
+                )
+            level = next_level
+
+        mock_columns = [MockAPI.__table__.c[field] for field in _MOCK_FIELDS]
+        for row in MockTransferService._stream(
+            db, select(*mock_columns).order_by(MockAPI.id)
+        ):
+            yield MockTransferService._line(
+                _to_record("mock", row._mapping, _MOCK_FIELDS)
+            )
+
+    @staticmethod
+    def _stream(db: Session, query) -> Iterable[Any]:
+        """服务端游标分批读取（MySQL 使用 SSCursor，不会一次取回全部结果）"""
+        return db.execute(
+            query.execution_options(
+                stream_results=True, yield_per=settings.EXPORT_YIELD_PER
+            )
+        )
+
+    @staticmethod
+    def _line(record: Dict[str, Any]) -> bytes:
+        return json_codec.dumps(record) + b"\n"
+
+    @staticmethod
+    def run_import(
+        db: Session,
+        records: Iterable[Tuple[int, Any]],
+        options: MockImportOptions,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        导入NDJSON记录，每写入一批产出一次进度
+
+        Args:
+            records: iter_ndjson 产出的 (行号, 记录)
+
+        Yields:
+            Dict: {"event": "progress" / "done", 统计计数...}
+        """
+        started = time.monotonic()
+        importer = _Importer(db, options)
+        errors: List[str] = []
+
+        try:
+            for line_no, record in records:
+                # 只有记录本身的问题计为失败，数据库错误中止导入
+                try:
+                    if isinstance(record, Exception):
+                        raise record
+                    if not isinstance(record, dict):
+                        raise ValueError("记录必须是JSON对象")
+                    flushed = importer.add(record)
+                except ValueError as e:
+                    importer.stats["failed"] += 1
+                    if len(errors) < MAX_REPORTED_ERRORS:
+                        errors.append(f"第 {line_no} 行: {e}")
+                    continue
+                if flushed:
+                    yield {"event": "progress", **importer.stats}
+
+            if importer.flush():
+                yield {"event": "progress", **importer.stats}
+        finally:
+            if importer.categories_changed:
+                upstream_table.invalidate()
+
+        yield {
+            "event": "done",
+            **importer.stats,
+            "errors": errors,
+            "elapsed_ms": int((time.monotonic() - started) * 1000),
+        }
+
+
+class _Importer:
+    """导入过程的状态：ID映射、已有数据索引与待写入的批次"""
+
+    def __init__(self, db: Session, options: MockImportOptions):
+        self.db = db
+        self.options = options
+        self.stats = {
+            "categories_created": 0,
+            "categories_updated": 0,
+            "categories_skipped": 0,
+            "created": 0,
+            "updated": 0,
+            "skipped": 0,
+            "failed": 0,
+        }
+        # 文件中的分类ID -> 本实例的分类ID
+        self.category_ids: Dict[int, int] = {}
+        # (名称, 父分类ID) -> 已有分类ID
+        self.categories: Dict[Tuple[str, Optional[int]], int] = {
+            (name, parent_id): category_id
+            for category_id, name, parent_id in db.query(
+                Category.id, Category.name, Category.parent_id
+            ).order_by(Category.id.desc())
+        }
+        # (方法, 路径) -> 尚未被文件记录占用的已有接口ID（按ID升序）
+        self.mocks: Dict[Tuple[HTTPMethod, str], Deque[int]] = {}
+        for mock_id, method, path in db.query(
+            MockAPI.id, MockAPI.method, MockAPI.path
+        ).order_by(MockAPI.id):
+            self.mocks.setdefault((method, path), deque()).append(mock_id)
+
+        # 待写入的分类：(文件中的ID, 数据, 已有分类ID)
+        self.pending_categories: List[Tuple[int, Dict[str, Any], Optional[int]]] = []
+        self.pending_keys = set()
+        self.creates: List[Dict[str, Any]] = []
+        self.updates: List[Dict[str, Any]] = []
+        self.categories_changed = False
+
+    def add(self, record: Dict[str, Any]) -> bool:
+        """处理一条记录，返回是否写入了一批"""
+        record_type = record.get("type")
+        if record_type == "meta":
+            version = record.get("version")
+            if not isinstance(version, int) or version > EXPORT_FORMAT_VERSION:
+                raise ValueError(f"不支持的导出格式版本: {version}")
+            return False
+        if record_type == "category":
+            return self._add_category(record)
+        if record_type == "mock":
+            return self._add_mock(record)
+        raise ValueError(f"未知的记录类型: {record_type}")
+
+    def _add_category(self, record: Dict[str, Any]) -> bool:
+        source_id = record.get("id")
+        if not isinstance(source_id, int):
+            raise ValueError("分类缺少ID")
+        data = CategoryBase.model_validate(record).model_dump()
+
+        flushed = False
+        # 父分类还在当前批次中时，先写入以获得新ID
+        if data["parent_id"] in self.pending_keys:
+            flushed = self.flush()
+
+        # 父分类不在文件中（或导入失败）时作为顶级分类导入
+        data["parent_id"] = self.category_ids.get(data["parent_id"])
+        existing_id = self.categories.get((data["name"], data["parent_id"]))
+        if existing_id is not None and self.options.on_conflict == "skip":
+            self.category_ids[source_id] = existing_id
+            self.stats["categories_skipped"] += 1
+            return flushed
+
+        self.pending_categories.append((source_id, data, existing_id))
+        self.pending_keys.add(source_id)
+        if len(self.pending_categories) >= settings.IMPORT_BATCH_SIZE:
+            flushed = self.flush() or flushed
+        return flushed
+
+    def _add_mock(self, record: Dict[str, Any]) -> bool:
+        data = MockAPICreate.model_validate(record).model_dump()
+
+        flushed = False
+        # 接口引用的分类需要先写入
+        if self.pending_categories:
+            flushed = self.flush()
+
+        data["category_id"] = self.category_ids.get(data["category_id"])
+        existing = self.mocks.get((data["method"], data["path"]))
+        if existing:
+            # 文件中同一 (方法, 路径) 的多条记录依次对应已有的多条接口
+            mock_id = existing.popleft()
+            if self.options.on_conflict == "skip":
+                self.stats["skipped"] += 1
+                return flushed
+            self.updates.append({"id": mock_id, **data})
+            self.stats["updated"] += 1
+        else:
+            self.creates.append(data)
+            self.stats["created"] += 1
+
+        if len(self.creates) + len(self.updates) >= settings.IMPORT_BATCH_SIZE:
+            flushed = self.flush() or flushed
+        return flushed
+
+    def flush(self) -> bool:
+        """写入当前批次（先分类后接口），返回是否有数据写入"""
+        flushed = False
+        if self.pending_categories:
+            self._write_categories()
+            flushed = True
+        if self.creates or self.updates:
+            creates, updates = self.creates, self.updates
+            self.creates, self.updates = [], []
+            MockService.bulk_write(self.db, creates=creates, updates=updates)
+            flushed = True
+        return flushed
+
+    def _write_categories(self) -> None:
+        """在一个事务中写入一批分类，并记录ID映射"""
+        db = self.db
+        created: List[Tuple[int, Category]] = []
+        updates: List[Dict[str, Any]] = []
+        try:
+            for source_id, data, existing_id in self.pending_categories:
+                if existing_id is None:
+                    category = Category(**data)
+                    db.add(category)
+                    created.append((source_id, category))
+                else:
+                    updates.append({"id": existing_id, **data})
+                    self.category_ids[source_id] = existing_id
+            if updates:
+                db.execute(update(Category), updates)
+            db.flush()
+            for source_id, category in created:
+                self.category_ids[source_id] = category.id
+                self.categories[(category.name, category.parent_id)] = category.id
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            self.pending_categories = []
+            self.pending_keys = set()
+
+        self.stats["categories_created"] += len(created)
+        self.stats["categories_updated"] += len(updates)
+        self.categories_changed = True
@@ -0,0 +1,407 @@
+"""
+上游透传服务
+
+未匹配到Mock接口的请求可以转发到真实后端，从而只Mock接口的一部分：
+分类配置了 upstream_url 与 path_prefix 时，路径落在该前缀下的请求转发到
+分类的上游（最长前缀优先），否则使用全局 UPSTREAM_URL。
+
+所有转发共用一个带连接池的异步HTTP客户端，与上游保持长连接；请求体与
+响应体均以流的方式转发，不会整体读入内存，日志只保留有限长度的前缀。
+
+开启录制模式的上游会在日志中保存完整的响应体（压缩的响应解压后保存），
+随后可以通过日志转Mock批量生成Mock接口（见 promotion_service.py）。
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
+
+import httpx
+from fastapi import Request
+from sqlalchemy import select
+from starlette.background import BackgroundTask
+from starlette.responses import Response, StreamingResponse
+
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal
+from ..core.json_codec import json_codec
+from ..models.category import Category
+from ..utils.compression import decompress
+from .log_writer import log_writer
+
+logger = logging.getLogger(__name__)
+
+# 逐跳（hop-by-hop）头只对单个连接有效，不应转发
+HOP_BY_HOP_HEADERS = frozenset(
+    (
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "proxy-connection",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+    )
+)
+
+# 由代理重新生成的转发头
+FORWARDED_HEADERS = ("x-forwarded-for", "x-forwarded-host", "x-forwarded-proto")
+
+
+def _forward_headers(headers) -> List[Tuple[str, str]]:
+    """去掉逐跳头（含 Connection 中列出的头）与 Host，保留重复的头"""
+    dropped = set(HOP_BY_HOP_HEADERS)
+    for value in headers.getlist("connection"):
+        dropped.update(name.strip().lower() for name in value.split(","))
+    return [
+        (name, value)
+        for name, value in headers.items()
+        if name.lower() not in dropped and name.lower() != "host"
+    ]
+
+
+class _Capture:
+    """转发字节流的同时保留前 max_bytes 字节用于日志"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.prefix = bytearray()
+        self.size = 0
+
+    def feed(self, chunk: bytes) -> bytes:
+        if len(self.prefix) < self.max_bytes:
+            self.prefix += chunk[: self.max_bytes - len(self.prefix)]
+        self.size += len(chunk)
+        return chunk
+
+    @property
+    def truncated(self) -> bool:
+        return self.size > len(self.prefix)
+
+    def preview(self) -> Optional[Dict[str, Any]]:
+        """与请求体日志格式一致：{"raw": 前缀文本, "truncated": 是否被截断}"""
+        if not self.size:
+            return None
+        return {
+            "raw": bytes(self.prefix).decode("utf-8", errors="ignore"),
+            "truncated": self.truncated,
+        }
+
+    async def tee(self, stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        async for chunk in stream:
+            yield self.feed(chunk)
+
+
+class UpstreamTarget(NamedTuple):
+    """请求路径对应的上游"""
+
+    url: str
+    record: bool = False
+
+
+class UpstreamTable:
+    """分类上游配置缓存：路径前缀 -> 上游，按TTL刷新"""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        # [(路径前缀, 上游)]，按前缀长度降序
+        self._routes: List[Tuple[str, UpstreamTarget]] = []
+        self._expires_at = 0.0
+        # 缓存失效时只让一个请求查询数据库
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        """分类变更后立即失效（其他worker在TTL到期后刷新）"""
+        self._expires_at = 0.0
+
+    async def resolve(self, path: str) -> Optional[UpstreamTarget]:
+        """按最长路径前缀查找上游，没有匹配的分类时使用全局上游"""
+        if self._expires_at <= time.monotonic():
+            async with self._lock:
+                if self._expires_at <= time.monotonic():
+                    await self._load()
+
+        for prefix, target in self._routes:
+            if prefix == "/" or path == prefix or path.startswith(prefix + "/"):
+                return target
+        if settings.UPSTREAM_URL:
+            return UpstreamTarget(
+                settings.UPSTREAM_URL.rstrip("/"), settings.UPSTREAM_RECORD
+            )
+        return None
+
+    async def _load(self) -> None:
+        # 使用独立会话，查询完立即归还连接
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    select(
+                        Category.path_prefix,
+                        Category.upstream_url,
+                        Category.record_mode,
+                    ).where(
+                        Category.is_active == True,
+                        Category.upstream_url.isnot(None),
+                        Category.path_prefix.isnot(None),
+                    )
+                )
+                rows = result.all()
+        except Exception as e:
+            # 数据库暂不可用时沿用旧配置，稍后重试
+            logger.warning("加载分类上游配置失败: %s", e)
+            self._expires_at = time.monotonic() + min(self.ttl, 1.0)
+            return
+
+        self._routes = sorted(
+            (
+                (prefix.rstrip("/") or "/", UpstreamTarget(url.rstrip("/"), bool(record)))
+                for prefix, url, record in rows
+            ),
+            key=lambda route: len(route[0]),
+            reverse=True,
+        )
+        self._expires_at = time.monotonic() + self.ttl
+
+
+# 全局分类上游配置缓存
+upstream_table = UpstreamTable(settings.UPSTREAM_REFRESH_INTERVAL)
+
+
+class UpstreamClient:
+    """共享的连接池HTTP客户端，随应用启动与关闭"""
+
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # 未通过生命周期启动（如脚本环境）时按需创建
+        if self._client is None:
+            self.start()
+        return self._client
+
+    def start(self) -> None:
+        if self._client is not None:
+            return
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.UPSTREAM_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.UPSTREAM_MAX_KEEPALIVE,
+                keepalive_expiry=settings.UPSTREAM_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(
+                connect=settings.UPSTREAM_CONNECT_TIMEOUT,
+                read=settings.UPSTREAM_READ_TIMEOUT,
+                write=settings.UPSTREAM_READ_TIMEOUT,
+                pool=settings.UPSTREAM_POOL_TIMEOUT,
+            ),
+            # 重定向原样返回给客户端，由客户端决定是否跟随
+            follow_redirects=False,
+        )
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# 全局上游客户端
+upstream_client = UpstreamClient()
+
+
+class UpstreamService:
+    """上游透传服务类"""
+
+    @staticmethod
+    async def resolve(path: str) -> Optional[UpstreamTarget]:
+        """获取请求路径对应的上游，未配置时返回 None"""
+        return await upstream_table.resolve(path)
+
+    @staticmethod
+    async def forward(
+        request: Request,
+        target: UpstreamTarget,
+        path: str,
+        may_have_body: bool,
+        start_time: float,
+    ) -> Response:
+        """
+        把请求转发到上游并以流的方式返回响应
+
+        Args:
+            request: 原始请求
+            target: 上游地址与是否录制
+            path: Mock前缀之后的请求路径，原样拼接到上游地址后
+            may_have_body: 请求是否携带请求体
+            start_time: 请求开始时间，用于计算日志中的响应时间
+        """
+        client_ip = request.client.host if request.client else None
+        query = request.url.query
+        url = target.url + path + (f"?{query}" if query else "")
+
+        # 追加客户端地址到 X-Forwarded-For，并告知上游原始的 Host 与协议
+        forwarded_for = request.headers.get("x-forwarded-for")
+        headers = [
+            item
+            for item in _forward_headers(request.headers)
+            if item[0].lower() not in FORWARDED_HEADERS
+        ]
+        if client_ip:
+            headers.append(
+                (
+                    "x-forwarded-for",
+                    f"{forwarded_for}, {client_ip}" if forwarded_for else client_ip,
+                )
+            )
+        elif forwarded_for:
+            headers.append(("x-forwarded-for", forwarded_for))
+        headers.append(("x-forwarded-host", request.headers.get("host", "")))
+        headers.append(("x-forwarded-proto", request.url.scheme))
+
+        request_capture = _Capture(settings.LOG_BODY_MAX_BYTES)
+        upstream_request = upstream_client.client.build_request(
+            request.method,
+            url,
+            headers=headers,
+            content=request_capture.tee(request.stream()) if may_have_body else None,
+        )
+
+        log_data = {
+            "mock_api_id": None,
+            "request_method": request.method,
+            "request_path": path,
+            "request_headers": dict(request.headers),
+            "request_params": dict(request.query_params),
+            "client_ip": client_ip,
+            "user_agent": request.headers.get("user-agent"),
+        }
+
+        try:
+            upstream_response = await upstream_client.client.send(
+                upstream_request, stream=True
+            )
+        except httpx.TimeoutException as e:
+            return await UpstreamService._error(
+                504, "Upstream timeout", e, url, log_data, request_capture, start_time
+            )
+        except httpx.HTTPError as e:
+            return await UpstreamService._error(
+                502,
+                "Upstream unavailable",
+                e,
+                url,
+                log_data,
+                request_capture,
+                start_time,
+            )
+
+        response_headers = [
+            (name, value)
+            for name, value in upstream_response.headers.multi_items()
+            if name.lower() not in HOP_BY_HOP_HEADERS
+        ]
+        # 录制模式保存完整响应体（不超过 UPSTREAM_RECORD_MAX_BYTES）
+        response_capture = _Capture(
+            settings.UPSTREAM_RECORD_MAX_BYTES
+            if target.record
+            else settings.LOG_BODY_MAX_BYTES
+        )
+
+        async def finish() -> None:
+            """响应发送完毕（或客户端断开）后归还上游连接并记录日志"""
+            await upstream_response.aclose()
+            await log_writer.submit(
+                **log_data,
+                request_body=request_capture.preview(),
+                response_status_code=upstream_response.status_code,
+                response_headers=dict(upstream_response.headers),
+                response_body=UpstreamService._logged_body(
+                    upstream_response, response_capture
+                ),
+                response_time_ms=int((time.time() - start_time) * 1000),
+            )
+
+        async def body() -> AsyncIterator[bytes]:
+            # 读取上游失败时后台任务不会执行，需要在这里归还上游连接
+            try:
+                # aiter_raw 不解压，上游的 Content-Encoding / Content-Length 原样保留
+                async for chunk in response_capture.tee(upstream_response.aiter_raw()):
+                    yield chunk
+            finally:
+                await upstream_response.aclose()
+
+        response = StreamingResponse(
+            body(),
+            status_code=upstream_response.status_code,
+            background=BackgroundTask(finish),
+        )
+        response.raw_headers = [
+            (name.encode("latin-1"), value.encode("latin-1"))
+            for name, value in response_headers
+        ]
+        return response
+
+    @staticmethod
+    def _logged_body(upstream_response: httpx.Response, capture: _Capture) -> Any:
+        """完整的JSON对象响应体按JSON记录（压缩的先解压），其余记录有限长度的前缀"""
+        if not capture.size:
+            return None
+
+        encoding = upstream_response.headers.get("content-encoding")
+        complete = not capture.truncated
+        data = bytes(capture.prefix)
+        if encoding:
+            try:
+                data = decompress(data, encoding) if complete else b""
+            except Exception:
+                complete = False
+            if not complete:
+                # 不完整或无法解压的压缩内容无法解码，只记录大小
+                return {"content_encoding": encoding, "size": capture.size}
+
+        if complete and "json" in upstream_response.headers.get("content-type", ""):
+            try:
+                body = json_codec.loads(data)
+            except ValueError:
+                body = None
+            # 日志的响应体字段只保存JSON对象
+            if isinstance(body, dict):
+                return body
+
+        limit = settings.LOG_BODY_MAX_BYTES
+        return {
+            "raw": data[:limit].decode("utf-8", errors="ignore"),
+            "truncated": not complete or len(data) > limit,
+        }
+
+    @staticmethod
+    async def _error(
+        status_code: int,
+        error: str,
+        exc: Exception,
+        url: str,
+        log_data: Dict[str, Any],
+        request_capture: _Capture,
+        start_time: float,
+    ) -> Response:
+        """上游连接失败或超时时返回 502 / 504 并记录日志"""
+        logger.warning("上游请求失败 %s: %r", url, exc)
+        response_body = {"error": error, "message": str(exc) or type(exc).__name__}
+        response_headers = {"Content-Type": "application/json"}
+
+        await log_writer.submit(
+            **log_data,
+            request_body=request_capture.preview(),
+            response_status_code=status_code,
+            response_headers=response_headers,
+            response_body=response_body,
+            response_time_ms=int((time.time() - start_time) * 1000),
+        )
+        return Response(
+            content=json_codec.dumps(response_body),
+            status_code=status_code,
+            headers=response_headers,
+        )
@@ -0,0 +1,104 @@
+"""
+响应压缩
+
+根据请求的 Accept-Encoding 协商压缩算法，支持 gzip，安装了 brotli 时
+同时支持 br。静态响应的压缩结果随预序列化字节一起缓存，动态响应只在
+超过大小阈值时压缩。
+"""
+
+import gzip
+import zlib
+from typing import Dict, Optional
+
+from ..core.config import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP = "gzip"
+BROTLI = "br"
+DEFLATE = "deflate"
+
+# 服务端支持的编码，q值相同时按此顺序优先
+SUPPORTED_ENCODINGS = (BROTLI, GZIP) if brotli is not None else (GZIP,)
+
+# 静态响应只压缩一次，使用最高压缩级别
+STATIC_LEVELS = {GZIP: 9, BROTLI: 11}
+
+
+def _parse_accept_encoding(header: str) -> Dict[str, float]:
+    """解析 Accept-Encoding，返回 编码 -> q值"""
+    weights: Dict[str, float] = {}
+    for item in header.split(","):
+        parts = item.strip().split(";")
+        coding = parts[0].strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in parts[1:]:
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding] = q
+    return weights
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    按 Accept-Encoding 选择压缩编码
+
+    Returns:
+        Optional[str]: 选中的编码，客户端不接受任何支持的编码时为 None
+    """
+    if not accept_encoding or not settings.COMPRESSION_ENABLED:
+        return None
+
+    weights = _parse_accept_encoding(accept_encoding)
+    wildcard = weights.get("*", 0.0)
+
+    best, best_q = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        q = weights.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """
+    按指定编码压缩
+
+    Args:
+        data: 原始字节
+        encoding: gzip / br
+        level: 压缩级别，为空时使用适合实时压缩的默认级别
+    """
+    if encoding == GZIP:
+        return gzip.compress(
+            data,
+            compresslevel=settings.COMPRESSION_GZIP_LEVEL if level is None else level,
+            mtime=0,
+        )
+    if encoding == BROTLI and brotli is not None:
+        return brotli.compress(
+            data,
+            quality=settings.COMPRESSION_BROTLI_QUALITY if level is None else level,
+        )
+    raise ValueError(f"不支持的压缩编码: {encoding}")
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    """按 Content-Encoding 解压（用于记录上游透传的压缩响应）"""
+    encoding = encoding.strip().lower()
+    if encoding == GZIP:
+        return gzip.decompress(data)
+    if encoding == DEFLATE:
+        return zlib.decompress(data)
+    if encoding == BROTLI and brotli is not None:
+        return brotli.decompress(data)
+    raise ValueError(f"不支持的压缩编码: {encoding}")
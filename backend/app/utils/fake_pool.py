@@ -0,0 +1,181 @@
+"""
+Faker预生成数据池
+
+部分 zh_CN Faker provider（地址、段落文本等）生成较慢。数据池为常用的
+调用方式各维护一个环形缓冲区，由后台线程预先生成并持续补充；请求路径
+上直接取用，缓冲区取空时退回实时生成。
+"""
+
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, Iterable, Optional, Tuple
+
+from faker import Faker
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 调用签名：(方法名, 位置参数, 排序后的关键字参数)
+CallKey = Tuple[str, Tuple[Any, ...], Tuple[Tuple[str, Hashable], ...]]
+
+# 预生成的调用方式，覆盖内置占位符与模板中的常见用法
+DEFAULT_POOLED_CALLS: Tuple[CallKey, ...] = (
+    ("name", (), ()),
+    ("email", (), ()),
+    ("phone_number", (), ()),
+    ("address", (), ()),
+    ("company", (), ()),
+    ("uuid4", (), ()),
+    ("text", (), ()),
+    ("text", (), (("max_nb_chars", 100),)),
+)
+
+
+def _call_key(name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> CallKey:
+    return name, args, tuple(sorted(kwargs.items())) if kwargs else ()
+
+
+class PooledFaker:
+    """Faker门面：命中数据池的调用直接取预生成值，其余调用委托给实时Faker"""
+
+    def __init__(self, pool: "FakerPool"):
+        self._pool = pool
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._pool.live, name)
+        if not callable(attr) or name not in self._pool.pooled_names:
+            return attr
+
+        def call(*args, **kwargs):
+            try:
+                key = _call_key(name, args, kwargs)
+            except TypeError:
+                # 参数不可哈希，无法命中数据池
+                return attr(*args, **kwargs)
+            return self._pool.take(key, attr, args, kwargs)
+
+        return call
+
+
+class FakerPool:
+    """Faker预生成数据池"""
+
+    def __init__(
+        self,
+        locale: str,
+        calls: Iterable[CallKey],
+        size: int,
+        low_watermark: float,
+        refill_interval: float,
+    ):
+        # 请求路径使用的实时Faker，补充线程使用独立实例，互不共享随机状态
+        self.live = Faker(locale)
+        self._generator = Faker(locale)
+        self.size = size
+        self.low_size = max(int(size * low_watermark), 1)
+        self.refill_interval = refill_interval
+
+        self._pools: Dict[CallKey, Deque[Any]] = {
+            key: deque(maxlen=size) for key in calls
+        }
+        self.pooled_names = {key[0] for key in self._pools}
+
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.hits = 0
+        self.misses = 0
+
+        self.facade = PooledFaker(self)
+
+    def take(
+        self,
+        key: CallKey,
+        fallback: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """从数据池取一个值，数据池为空或未配置该调用时实时生成"""
+        pool = self._pools.get(key)
+        if pool is None:
+            return fallback(*args, **kwargs)
+
+        try:
+            value = pool.popleft()
+        except IndexError:
+            self.misses += 1
+            self._wakeup.set()
+            return fallback(*args, **kwargs)
+
+        self.hits += 1
+        if len(pool) < self.low_size:
+            self._wakeup.set()
+        return value
+
+    def start(self) -> None:
+        """启动后台补充线程"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="faker-pool-refill", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """停止后台补充线程"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        """获取数据池统计信息"""
+        return {
+            "running": self._thread is not None and self._thread.is_alive(),
+            "pools": len(self._pools),
+            "size": self.size,
+            "available": sum(len(pool) for pool in self._pools.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            for key, pool in self._pools.items():
+                if self._stopped.is_set():
+                    return
+                # 只补充低于水位线的数据池，其余数据池不必每轮都生成
+                if len(pool) >= self.low_size:
+                    continue
+                try:
+                    self._refill(key, pool)
+                except Exception as e:
+                    logger.warning("Faker数据池补充失败 %s: %s", key[0], e)
+
+            self._wakeup.wait(self.refill_interval)
+            self._wakeup.clear()
+
+    def _refill(self, key: CallKey, pool: Deque[Any]) -> None:
+        name, args, kwargs = key
+        method = getattr(self._generator, name)
+        kwargs = dict(kwargs)
+        for _ in range(self.size - len(pool)):
+            pool.append(method(*args, **kwargs))
+
+
+# 全局Faker数据池实例
+fake_pool = FakerPool(
+    locale=settings.FAKER_LOCALE,
+    calls=DEFAULT_POOLED_CALLS,
+    size=settings.FAKER_POOL_SIZE,
+    low_watermark=settings.FAKER_POOL_LOW_WATERMARK,
+    refill_interval=settings.FAKER_POOL_REFILL_INTERVAL,
+)
+
+# 供响应生成器使用的Faker门面
+fake = fake_pool.facade
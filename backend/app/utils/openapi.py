@@ -0,0 +1,346 @@
+"""
+OpenAPI / Swagger 文档解析与示例数据生成
+
+支持 OpenAPI 3.x 与 Swagger 2.0，JSON 或 YAML 格式。安装了 ijson 时
+JSON 文档按流解析：第一遍只构建 components / definitions 等引用目标，
+第二遍逐个产出 paths 下的路径项，文档中的接口定义不会整体读入内存。
+未安装 ijson 或文档为 YAML（需要 PyYAML）时退回整体解析。
+
+示例响应按以下优先级生成：媒体类型的 example / examples → Schema 的
+example / default / enum → 按类型与格式合成。动态模式下，字符串格式
+（email、uuid、date-time 等）生成Faker占位符，每次请求返回不同的数据。
+"""
+
+from typing import IO, Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from ..core.json_codec import json_codec
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# 可导入的HTTP方法（OpenAPI路径项中的小写键）
+OPERATION_METHODS = ("get", "post", "put", "delete", "patch", "head", "options")
+
+# 需要从文档顶层收集的字段（引用目标与基础路径）
+_TOP_LEVEL_KEYS = ("openapi", "swagger", "basePath", "components", "definitions")
+
+# Schema 嵌套与引用展开的最大深度
+MAX_EXAMPLE_DEPTH = 8
+
+# 静态示例值：字符串格式 -> 示例
+_FORMAT_EXAMPLES = {
+    "date-time": "2024-01-01T00:00:00Z",
+    "date": "2024-01-01",
+    "time": "00:00:00",
+    "email": "user@example.com",
+    "uuid": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+    "uri": "https://example.com",
+    "url": "https://example.com",
+    "hostname": "example.com",
+    "ipv4": "127.0.0.1",
+    "ipv6": "::1",
+    "byte": "U3dhZ2dlciByb2Nrcw==",
+    "password": "********",
+}
+
+# 动态示例：字符串格式或字段名 -> (响应体占位符, 模板表达式)
+_DYNAMIC_FORMATS = {
+    "date-time": ("{{now}}", "now.isoformat()"),
+    "email": ("{{fake.email}}", "fake.email()"),
+    "uuid": ("{{fake.uuid}}", "fake.uuid4()"),
+}
+_DYNAMIC_NAMES = {
+    "name": ("{{fake.name}}", "fake.name()"),
+    "email": ("{{fake.email}}", "fake.email()"),
+    "phone": ("{{fake.phone}}", "fake.phone_number()"),
+    "address": ("{{fake.address}}", "fake.address()"),
+    "company": ("{{fake.company}}", "fake.company()"),
+}
+
+
+class DynamicValue:
+    """动态示例值：写入响应体时为占位符，写入模板时为Jinja表达式"""
+
+    __slots__ = ("placeholder", "expression")
+
+    def __init__(self, placeholder: str, expression: str):
+        self.placeholder = placeholder
+        self.expression = expression
+
+
+def to_response_body(value: Any) -> Any:
+    """把示例值转换为响应体（动态值替换为占位符）"""
+    if isinstance(value, DynamicValue):
+        return value.placeholder
+    if isinstance(value, dict):
+        return {key: to_response_body(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_response_body(item) for item in value]
+    return value
+
+
+def to_response_template(value: Any) -> str:
+    """把示例值转换为输出JSON的Jinja模板（用于数组等非对象响应）"""
+    if isinstance(value, DynamicValue):
+        return "{{ " + value.expression + " | tojson }}"
+    if isinstance(value, dict):
+        return (
+            "{"
+            + ", ".join(
+                f"{json_codec.dumps_str(str(key))}: {to_response_template(item)}"
+                for key, item in value.items()
+            )
+            + "}"
+        )
+    if isinstance(value, list):
+        return "[" + ", ".join(to_response_template(item) for item in value) + "]"
+    # 字面量中的 {{ / {% 需要转义，避免被当作模板语法
+    text = json_codec.dumps_str(value)
+    if "{{" in text or "{%" in text or "{#" in text:
+        return "{% raw %}" + text + "{% endraw %}"
+    return text
+
+
+class OpenAPIDocument:
+    """OpenAPI / Swagger 文档"""
+
+    def __init__(self, fileobj: IO[bytes]):
+        """
+        Args:
+            fileobj: 可 seek 的二进制文件对象（上传文件或本地文件）
+        """
+        self._file = fileobj
+        self._paths: Optional[Dict[str, Any]] = None
+
+        head = fileobj.read(64).lstrip()
+        fileobj.seek(0)
+        is_json = head.startswith(b"{")
+
+        if is_json and ijson is not None:
+            # 流式解析：第一遍只构建顶层的引用目标
+            self.root = self._collect_top_level()
+            self.streaming = True
+        else:
+            document = self._load_document(is_json)
+            self._paths = document.get("paths") or {}
+            self.root = {key: document.get(key) for key in _TOP_LEVEL_KEYS}
+            self.streaming = False
+
+        if not (self.root.get("openapi") or self.root.get("swagger")):
+            raise ValueError("不是有效的 OpenAPI / Swagger 文档")
+
+    @property
+    def base_path(self) -> str:
+        """Swagger 2.0 的 basePath（OpenAPI 3 的 servers 不参与路径拼接）"""
+        return (self.root.get("basePath") or "").rstrip("/")
+
+    def _load_document(self, is_json: bool) -> Dict[str, Any]:
+        data = self._file.read()
+        if is_json:
+            document = json_codec.loads(data)
+        else:
+            if yaml is None:
+                raise ValueError("解析YAML文档需要安装 PyYAML")
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            document = yaml.load(data, Loader=loader)
+        if not isinstance(document, dict):
+            raise ValueError("不是有效的 OpenAPI / Swagger 文档")
+        return document
+
+    def _collect_top_level(self) -> Dict[str, Any]:
+        builders: Dict[str, Any] = {}
+        for prefix, event, value in ijson.parse(self._file, use_float=True):
+            key = prefix.split(".", 1)[0]
+            if key not in _TOP_LEVEL_KEYS:
+                continue
+            builder = builders.get(key)
+            if builder is None:
+                builder = builders[key] = ijson.ObjectBuilder()
+            builder.event(event, value)
+        self._file.seek(0)
+        return {key: builder.value for key, builder in builders.items()}
+
+    def iter_paths(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """逐个产出 (路径, 路径项)"""
+        if not self.streaming:
+            yield from self._paths.items()
+            return
+        self._file.seek(0)
+        yield from ijson.kvitems(self._file, "paths", use_float=True)
+
+    def resolve(self, node: Any) -> Any:
+        """展开一层本地 $ref（#/components/...、#/definitions/...），无法解析时返回 None"""
+        seen: Set[str] = set()
+        while isinstance(node, dict) and "$ref" in node:
+            ref = node["$ref"]
+            if not isinstance(ref, str) or not ref.startswith("#/") or ref in seen:
+                return None
+            seen.add(ref)
+            node = self.root
+            for part in ref[2:].split("/"):
+                part = part.replace("~1", "/").replace("~0", "~")
+                if not isinstance(node, dict) or part not in node:
+                    return None
+                node = node[part]
+        return node
+
+
+class ExampleBuilder:
+    """按 Schema 生成示例值，命名 Schema（$ref）的结果会被缓存复用"""
+
+    def __init__(self, document: OpenAPIDocument, dynamic: bool = True):
+        self.document = document
+        self.dynamic = dynamic
+        self._ref_cache: Dict[str, Any] = {}
+
+    def build(
+        self,
+        schema: Any,
+        name: Optional[str] = None,
+        depth: int = 0,
+        stack: Tuple[str, ...] = (),
+    ) -> Any:
+        """生成示例值；循环引用或超过最大深度时返回 None"""
+        if not isinstance(schema, dict) or depth > MAX_EXAMPLE_DEPTH:
+            return None
+
+        ref = schema.get("$ref")
+        if isinstance(ref, str):
+            if ref in stack:
+                return None
+            # 字符串示例与字段名有关，按 (引用, 字段名) 缓存
+            cache_key = f"{ref}#{name}"
+            if cache_key not in self._ref_cache:
+                self._ref_cache[cache_key] = self.build(
+                    self.document.resolve(schema), name, depth + 1, stack + (ref,)
+                )
+            return self._ref_cache[cache_key]
+
+        for key in ("example", "default", "const"):
+            if key in schema:
+                return schema[key]
+        if isinstance(schema.get("enum"), list) and schema["enum"]:
+            return schema["enum"][0]
+        if isinstance(schema.get("examples"), list) and schema["examples"]:
+            return schema["examples"][0]
+
+        if isinstance(schema.get("allOf"), list):
+            merged: Dict[str, Any] = {}
+            for part in schema["allOf"]:
+                value = self.build(part, name, depth + 1, stack)
+                if isinstance(value, dict):
+                    merged.update(value)
+            return merged
+        for key in ("oneOf", "anyOf"):
+            if isinstance(schema.get(key), list) and schema[key]:
+                return self.build(schema[key][0], name, depth + 1, stack)
+
+        schema_type = schema.get("type")
+        if isinstance(schema_type, list):
+            # OpenAPI 3.1：type 可以是列表，取第一个非 null 类型
+            schema_type = next((item for item in schema_type if item != "null"), None)
+        if schema_type is None:
+            if "properties" in schema or "additionalProperties" in schema:
+                schema_type = "object"
+            elif "items" in schema:
+                schema_type = "array"
+
+        if schema_type == "object":
+            properties = schema.get("properties") or {}
+            return {
+                key: self.build(value, key, depth + 1, stack)
+                for key, value in properties.items()
+            }
+        if schema_type == "array":
+            item = self.build(schema.get("items"), name, depth + 1, stack)
+            return [item] * max(int(schema.get("minItems") or 1), 1)
+        if schema_type == "integer":
+            return int(schema.get("minimum") or 0) or 1
+        if schema_type == "number":
+            return float(schema.get("minimum") or 0) or 1.0
+        if schema_type == "boolean":
+            return True
+        if schema_type == "string":
+            return self._string(schema, name)
+        return None
+
+    def _string(self, schema: Dict[str, Any], name: Optional[str]) -> Any:
+        fmt = schema.get("format")
+        if self.dynamic:
+            dynamic = _DYNAMIC_FORMATS.get(fmt) or _DYNAMIC_NAMES.get(
+                (name or "").lower()
+            )
+            if dynamic is not None:
+                return DynamicValue(*dynamic)
+        if fmt in _FORMAT_EXAMPLES:
+            return _FORMAT_EXAMPLES[fmt]
+        return name or "string"
+
+
+def pick_response(
+    document: OpenAPIDocument, operation: Dict[str, Any]
+) -> Tuple[int, Optional[str], Any]:
+    """
+    选择用于Mock的响应：状态码最小的2xx，没有时使用 default
+
+    Returns:
+        tuple: (状态码, 媒体类型, 媒体类型对象或Swagger 2.0的响应对象)
+    """
+    responses = document.resolve(operation.get("responses")) or {}
+    codes: List[Tuple[int, str]] = []
+    for code in responses:
+        text = str(code)
+        if text.isdigit() and 200 <= int(text) < 300:
+            codes.append((int(text), text))
+        elif text.upper() == "2XX":
+            codes.append((200, text))
+    if codes:
+        status_code, key = min(codes)
+    elif "default" in responses:
+        status_code, key = 200, "default"
+    else:
+        return 200, None, None
+
+    response = document.resolve(responses[key])
+    if not isinstance(response, dict):
+        return status_code, None, None
+
+    content = response.get("content")
+    if isinstance(content, dict) and content:
+        # OpenAPI 3：优先选择 JSON 媒体类型
+        media_type = next(
+            (item for item in content if "json" in item.lower()), next(iter(content))
+        )
+        return status_code, media_type, content[media_type] or {}
+    if "schema" in response or "examples" in response:
+        # Swagger 2.0：schema 直接位于响应对象下
+        return status_code, "application/json", response
+    return status_code, None, None
+
+
+def build_example(builder: ExampleBuilder, media: Optional[Dict[str, Any]]) -> Any:
+    """按媒体类型对象（或Swagger 2.0响应对象）生成示例响应"""
+    if not isinstance(media, dict):
+        return None
+    if "example" in media:
+        return media["example"]
+    examples = media.get("examples")
+    if isinstance(examples, dict) and examples:
+        if builder.document.root.get("swagger"):
+            # Swagger 2.0：examples 按媒体类型给出示例值
+            for media_type, value in examples.items():
+                if "json" in media_type.lower():
+                    return value
+        else:
+            # OpenAPI 3：Example 对象，取第一个
+            first = builder.document.resolve(next(iter(examples.values())))
+            if isinstance(first, dict) and "value" in first:
+                return first["value"]
+    return builder.build(media.get("schema"))
@@ -0,0 +1,130 @@
+"""
+游标（keyset）分页
+
+游标是上一页最后一条记录排序键的编码，对调用方不透明，只能原样传回。
+翻页条件为“排序键严格位于游标之后”，配合排序键上的索引，每页的代价与
+翻到第几页无关，也不会因为翻页期间插入新数据而重复或遗漏。
+
+总数统计可选：exact 精确 COUNT；estimated 在没有过滤条件时读取数据库的
+表统计信息（MySQL / PostgreSQL），否则最多计数到 COUNT_ESTIMATE_CAP 行；
+none 不统计。
+"""
+
+import base64
+import math
+from datetime import datetime
+from typing import Any, List, Literal, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import func, inspect, select, text
+from sqlalchemy.orm import Query, Session
+
+from ..core.config import settings
+from ..core.json_codec import json_codec
+
+CountMode = Literal["exact", "estimated", "none"]
+
+
+class Page(NamedTuple):
+    """一页查询结果"""
+
+    items: List[Any]
+    # 总数；为 None 表示未统计
+    total: Optional[int]
+    # 总数是否为估算值（或计数上限）
+    total_estimated: bool
+    # 下一页的游标；为 None 表示没有更多数据
+    next_cursor: Optional[str]
+
+
+def encode_cursor(kind: str, values: Sequence[Any]) -> str:
+    """把排序键编码为游标（URL安全的Base64）"""
+    payload = [
+        kind,
+        *(
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in values
+        ),
+    ]
+    token = base64.urlsafe_b64encode(json_codec.dumps(payload))
+    return token.rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(kind: str, cursor: str, size: int) -> List[Any]:
+    """解析游标，返回排序键；游标无效或不属于该列表时抛出 ValueError"""
+    try:
+        payload = json_codec.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+    except ValueError:
+        raise ValueError("无效的分页游标")
+    if (
+        not isinstance(payload, list)
+        or len(payload) != size + 1
+        or payload[0] != kind
+    ):
+        raise ValueError("无效的分页游标")
+    return payload[1:]
+
+
+def page_count(total: Optional[int], size: int) -> Optional[int]:
+    """总页数；未统计总数时返回 None"""
+    if total is None:
+        return None
+    return math.ceil(total / size) if total > 0 else 1
+
+
+def count_total(
+    db: Session, query: Query, mode: CountMode, table: str, filtered: bool
+) -> Tuple[Optional[int], bool]:
+    """
+    按统计方式计算总数
+
+    Args:
+        query: 已添加过滤条件、未排序分页的查询
+        table: 表名（无过滤条件时读取表统计信息）
+        filtered: 查询是否带有过滤条件
+
+    Returns:
+        tuple: (总数, 是否为估算值)
+    """
+    if mode == "none":
+        return None, False
+    if mode == "exact":
+        return query.count(), False
+
+    if not filtered:
+        estimate = estimate_table_rows(db, table)
+        if estimate is not None:
+            return estimate, True
+
+    cap = settings.COUNT_ESTIMATE_CAP
+    entity = query.column_descriptions[0]["entity"]
+    limited = (
+        query.with_entities(*inspect(entity).primary_key).limit(cap + 1).subquery()
+    )
+    count = db.execute(select(func.count()).select_from(limited)).scalar()
+    if count > cap:
+        return cap, True
+    return count, False
+
+
+def estimate_table_rows(db: Session, table: str) -> Optional[int]:
+    """读取数据库维护的表行数估算值，不支持的数据库返回 None"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        statement = text(
+            "SELECT TABLE_ROWS FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+        )
+    elif dialect == "postgresql":
+        statement = text(
+            "SELECT reltuples::bigint FROM pg_class WHERE relname = :table"
+        )
+    else:
+        return None
+
+    value = db.execute(statement, {"table": table}).scalar()
+    # PostgreSQL 未 ANALYZE 过的表返回 -1
+    if value is None or value < 0:
+        return None
+    return int(value)
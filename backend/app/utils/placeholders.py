@@ -0,0 +1,197 @@
+"""
+响应体占位符预编译
+
+Mock接口的响应体在每个版本只编译一次：记录所有包含 {{...}} 占位符的
+JSON路径，并把对应字符串预先切分为字面量与占位符片段。请求时只需在
+浅拷贝的骨架上填充这些位置，其余部分与原响应体共享，不再逐个字符串扫描。
+
+支持的占位符：
+
+- ``{{request.<参数名>}}``：查询参数
+- ``{{request.path_params.<参数名>}}``：路径参数
+- ``{{request.body.<字段>}}``：请求体字段，支持 ``a.b.0`` 形式的嵌套路径
+- ``{{now}}``、``{{timestamp}}``：当前时间（ISO格式 / Unix秒）
+- ``{{fake.name}}`` 等：Faker随机数据，见 FAKER_PLACEHOLDERS
+
+无法识别的占位符原样保留。
+"""
+
+import re
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+_TOKEN_RE = re.compile(r"\{\{(.*?)\}\}")
+_PATH_PARAM_RE = re.compile(r"^request\.path_params\.(\w+)$")
+_BODY_FIELD_RE = re.compile(r"^request\.body\.([\w.]+)$")
+_REQUEST_PARAM_RE = re.compile(r"^request\.(\w+)$")
+
+# Faker占位符：名称 -> 生成函数
+FAKER_PLACEHOLDERS: Dict[str, Callable[[Any], str]] = {
+    "fake.name": lambda fake: fake.name(),
+    "fake.email": lambda fake: fake.email(),
+    "fake.phone": lambda fake: fake.phone_number(),
+    "fake.address": lambda fake: fake.address(),
+    "fake.company": lambda fake: fake.company(),
+    "fake.uuid": lambda fake: fake.uuid4(),
+    "fake.number": lambda fake: str(fake.random_int(1, 1000)),
+    "fake.text": lambda fake: fake.text(max_nb_chars=100),
+}
+
+Resolver = Callable[[Dict[str, Any]], str]
+Segment = Union[str, Resolver]
+JSONPath = Tuple[Union[str, int], ...]
+
+
+def _lookup_body_field(body: Any, keys: List[str], raw: str) -> str:
+    """按嵌套路径读取请求体字段"""
+    value = body
+    for key in keys:
+        if isinstance(value, dict) and key in value:
+            value = value[key]
+        elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+            value = value[int(key)]
+        else:
+            return raw
+    return str(value)
+
+
+def uses_request_body(expression: str) -> bool:
+    """占位符表达式是否引用请求体"""
+    return _BODY_FIELD_RE.match(expression) is not None
+
+
+def _compile_token(expression: str, raw: str, fake) -> Union[str, Resolver]:
+    """编译单个占位符，无法识别时返回原始文本"""
+    match = _BODY_FIELD_RE.match(expression)
+    if match:
+        keys = match.group(1).split(".")
+        return lambda context: _lookup_body_field(context.get("body"), keys, raw)
+
+    match = _PATH_PARAM_RE.match(expression)
+    if match:
+        name = match.group(1)
+        return lambda context: str(context.get("path_params", {}).get(name, raw))
+
+    match = _REQUEST_PARAM_RE.match(expression)
+    if match:
+        name = match.group(1)
+        return lambda context: str(context.get("params", {}).get(name, raw))
+
+    if expression == "now":
+        return lambda context: datetime.now().isoformat()
+    if expression == "timestamp":
+        return lambda context: str(int(datetime.now().timestamp()))
+
+    generator = FAKER_PLACEHOLDERS.get(expression)
+    if generator is not None:
+        return lambda context: generator(fake)
+
+    return raw
+
+
+def compile_string(text: str, fake) -> List[Segment]:
+    """把字符串切分为字面量与占位符片段，相邻字面量会被合并"""
+    segments: List[Segment] = []
+    position = 0
+
+    for match in _TOKEN_RE.finditer(text):
+        pieces = [text[position : match.start()]]
+        pieces.append(_compile_token(match.group(1), match.group(0), fake))
+        position = match.end()
+
+        for piece in pieces:
+            if isinstance(piece, str) and segments and isinstance(segments[-1], str):
+                segments[-1] += piece
+            elif piece != "":
+                segments.append(piece)
+
+    tail = text[position:]
+    if tail:
+        if segments and isinstance(segments[-1], str):
+            segments[-1] += tail
+        else:
+            segments.append(tail)
+
+    return segments
+
+
+class PlaceholderPlan:
+    """响应体占位符填充计划"""
+
+    __slots__ = ("skeleton", "slots", "uses_body", "_copy_paths")
+
+    def __init__(
+        self,
+        skeleton: Any,
+        slots: List[Tuple[JSONPath, List[Segment]]],
+        uses_body: bool = False,
+    ):
+        self.skeleton = skeleton
+        self.slots = slots
+        # 是否有占位符引用请求体（决定代理是否需要解析请求体）
+        self.uses_body = uses_body
+        # 需要浅拷贝的容器路径（按深度排序，父容器先于子容器）
+        prefixes = {path[:depth] for path, _ in slots for depth in range(len(path))}
+        self._copy_paths = sorted(prefixes, key=len)
+
+    @property
+    def is_static(self) -> bool:
+        """响应体是否不含任何可替换的占位符"""
+        return not self.slots
+
+    def render(self, context: Dict[str, Any]) -> Any:
+        """填充占位符，未变化的部分与骨架共享"""
+        if not self.slots:
+            return self.skeleton
+
+        if not self._copy_paths:
+            # 响应体本身就是一个带占位符的字符串
+            return _render_segments(self.slots[0][1], context)
+
+        copies: Dict[JSONPath, Any] = {}
+        for path in self._copy_paths:
+            source = self.skeleton if not path else copies[path[:-1]][path[-1]]
+            copied = dict(source) if isinstance(source, dict) else list(source)
+            if path:
+                copies[path[:-1]][path[-1]] = copied
+            copies[path] = copied
+
+        for path, segments in self.slots:
+            copies[path[:-1]][path[-1]] = _render_segments(segments, context)
+
+        return copies[()]
+
+
+def _render_segments(segments: List[Segment], context: Dict[str, Any]) -> str:
+    return "".join(
+        segment if isinstance(segment, str) else segment(context)
+        for segment in segments
+    )
+
+
+def compile_placeholders(body: Any, fake) -> PlaceholderPlan:
+    """编译响应体，记录所有包含占位符的JSON路径"""
+    slots: List[Tuple[JSONPath, List[Segment]]] = []
+    uses_body = False
+
+    def walk(value: Any, path: JSONPath) -> None:
+        nonlocal uses_body
+        if isinstance(value, str):
+            if "{{" not in value:
+                return
+            segments = compile_string(value, fake)
+            if any(not isinstance(segment, str) for segment in segments):
+                slots.append((path, segments))
+                uses_body = uses_body or any(
+                    uses_request_body(match.group(1))
+                    for match in _TOKEN_RE.finditer(value)
+                )
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                walk(item, path + (key,))
+        elif isinstance(value, list):
+            for index, item in enumerate(value):
+                walk(item, path + (index,))
+
+    walk(body, ())
+    return PlaceholderPlan(body, slots, uses_body)
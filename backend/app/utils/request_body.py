@@ -0,0 +1,116 @@
+"""
+按需读取的请求体
+"""
+
+from typing import Any, Dict, Optional
+
+from fastapi import Request, UploadFile
+
+from ..core.json_codec import json_codec
+
+# 可能携带请求体的HTTP方法
+BODY_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+
+class LazyRequestBody:
+    """
+    按需读取与解析的请求体
+
+    只有Mock接口的模板或占位符引用了请求体时才完整读取并解析；
+    日志只需要有限长度的原始前缀，未被使用的大请求体不会整体读入内存。
+    """
+
+    _UNSET = object()
+
+    def __init__(self, request: Request):
+        self.request = request
+        self._raw: Optional[bytes] = None
+        self._parsed: Any = self._UNSET
+        self._prefix: Optional[bytes] = None
+        self._truncated = False
+
+    @property
+    def may_have_body(self) -> bool:
+        """请求是否可能携带请求体"""
+        headers = self.request.headers
+        if self.request.method not in BODY_METHODS:
+            return False
+        return headers.get("content-length") not in (None, "0") or (
+            "transfer-encoding" in headers
+        )
+
+    async def raw(self) -> bytes:
+        """读取完整的原始请求体"""
+        if self._raw is None:
+            self._raw = await self.request.body()
+        return self._raw
+
+    async def parsed(self) -> Optional[Dict[str, Any]]:
+        """按 Content-Type 解析请求体，解析失败时返回 None"""
+        if self._parsed is not self._UNSET:
+            return self._parsed
+
+        self._parsed = None
+        if self.request.method not in ("POST", "PUT", "PATCH"):
+            return None
+
+        try:
+            content_type = self.request.headers.get("content-type", "")
+            body_bytes = await self.raw()
+            if "application/json" in content_type:
+                self._parsed = json_codec.loads(body_bytes)
+            elif (
+                "application/x-www-form-urlencoded" in content_type
+                or "multipart/form-data" in content_type
+            ):
+                # 请求体已缓存，request.form() 从缓存解析，日志仍可读取原始前缀
+                form_data = await self.request.form()
+                self._parsed = {
+                    key: value.filename if isinstance(value, UploadFile) else value
+                    for key, value in form_data.items()
+                }
+            else:
+                self._parsed = {"raw": body_bytes.decode("utf-8", errors="ignore")}
+        except Exception:
+            self._parsed = None
+
+        return self._parsed
+
+    async def preview(self, max_bytes: int) -> Optional[Dict[str, Any]]:
+        """
+        获取用于日志的请求体前缀
+
+        Returns:
+            Optional[Dict]: {"raw": 前缀文本, "truncated": 是否被截断}，无请求体时为 None
+        """
+        if self._prefix is None:
+            if self._raw is not None:
+                self._prefix = self._raw[:max_bytes]
+                self._truncated = len(self._raw) > max_bytes
+            elif not self.may_have_body:
+                return None
+            else:
+                self._prefix, self._truncated = await self._read_prefix(max_bytes)
+
+        if not self._prefix:
+            return None
+        return {
+            "raw": self._prefix.decode("utf-8", errors="ignore"),
+            "truncated": self._truncated,
+        }
+
+    async def _read_prefix(self, max_bytes: int) -> tuple[bytes, bool]:
+        """只读取请求流的前 max_bytes 字节"""
+        chunks = []
+        size = 0
+        try:
+            async for chunk in self.request.stream():
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > max_bytes:
+                    break
+        except Exception:
+            pass
+
+        data = b"".join(chunks)
+        return data[:max_bytes], size > max_bytes
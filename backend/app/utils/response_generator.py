@@ -2,15 +2,134 @@
 响应生成器工具
 """
 
-import json
-import re
+import hashlib
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
 
-from faker import Faker
-from jinja2 import Template
+from ..core.json_codec import json_codec
+from .compression import STATIC_LEVELS, compress
+from .fake_pool import fake
+from .placeholders import PlaceholderPlan, compile_placeholders
+from .template_cache import template_cache, template_uses_request_body
 
-fake = Faker("zh_CN")
+# 每次请求都需要重新生成的响应头
+TIMESTAMP_HEADER = "X-Mock-Timestamp"
+
+
+class StaticResponse:
+    """预序列化的静态响应（按Mock接口版本缓存）"""
+
+    __slots__ = (
+        "body",
+        "content",
+        "etag",
+        "headers",
+        "dynamic_timestamp",
+        "_encoded",
+    )
+
+    def __init__(
+        self,
+        body: Dict[str, Any],
+        headers: Dict[str, str],
+        custom_headers: Optional[Dict[str, str]],
+        pretty: bool = False,
+    ):
+        self.body = body
+        # 序列化后的UTF-8字节（默认紧凑格式），直接作为响应内容
+        self.content = json_codec.dumps(body, pretty=pretty)
+        # 强ETag取内容哈希，每个版本只计算一次
+        self.etag = hashlib.sha1(self.content).hexdigest()
+        self.headers = headers
+        # 用户自定义了时间戳响应头时不再逐请求生成
+        self.dynamic_timestamp = TIMESTAMP_HEADER not in (custom_headers or {})
+        # 各压缩编码的结果，首次请求该编码时生成
+        self._encoded: Dict[str, bytes] = {}
+
+    def etag_header(self, encoding: Optional[str] = None) -> str:
+        """生成ETag响应头，压缩后的表示带上编码后缀以区分"""
+        if encoding is None:
+            return f'"{self.etag}"'
+        return f'"{self.etag}-{encoding}"'
+
+    def etag_matches(self, if_none_match: Optional[str]) -> bool:
+        """判断 If-None-Match 是否命中当前内容（弱比较，忽略编码后缀）"""
+        if not if_none_match:
+            return False
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag == "*":
+                return True
+            if tag.startswith("W/"):
+                tag = tag[2:]
+            if tag.strip('"').split("-", 1)[0] == self.etag:
+                return True
+        return False
+
+    def encoded(self, encoding: str) -> bytes:
+        """获取指定编码压缩后的响应内容"""
+        data = self._encoded.get(encoding)
+        if data is None:
+            data = compress(self.content, encoding, STATIC_LEVELS[encoding])
+            self._encoded[encoding] = data
+        return data
+
+    def render_headers(self) -> Dict[str, str]:
+        """生成本次请求的响应头，只补充动态的时间戳"""
+        if not self.dynamic_timestamp:
+            return dict(self.headers)
+        return {**self.headers, TIMESTAMP_HEADER: datetime.now().isoformat()}
+
+
+class VersionedCache:
+    """
+    按Mock接口版本失效的编译结果缓存，每个 (mock id, 名称) 只保留最新版本
+
+    条件规则、响应变体派生的响应 id 为 (mock id, 类型, 序号)，与所属接口
+    归为一组；接口移出路由表时整组清理。
+    """
+
+    # 全部缓存实例，接口移出路由表时统一清理
+    instances: List["VersionedCache"] = []
+
+    def __init__(self):
+        # 所属 mock id -> {(id, 名称): (版本, 值)}
+        self._entries: Dict[
+            int, Dict[Tuple[Hashable, Hashable], Tuple[Optional[int], Any]]
+        ] = {}
+        VersionedCache.instances.append(self)
+
+    def get(self, mock_config, name: Hashable, factory: Callable[[], Any]) -> Any:
+        config_id = mock_config.id
+        owner = config_id[0] if isinstance(config_id, tuple) else config_id
+        entries = self._entries.get(owner)
+        if entries is None:
+            entries = self._entries.setdefault(owner, {})
+
+        key = (config_id, name)
+        cached = entries.get(key)
+        if cached is not None and cached[0] == mock_config.version:
+            return cached[1]
+
+        value = factory()
+        entries[key] = (mock_config.version, value)
+        return value
+
+    def discard(self, mock_ids: Iterable[int]) -> None:
+        """清理指定接口（及其派生响应）的缓存"""
+        for mock_id in mock_ids:
+            self._entries.pop(mock_id, None)
+
+    @classmethod
+    def discard_all(cls, mock_ids: Iterable[int]) -> None:
+        """从全部缓存实例中清理指定接口"""
+        mock_ids = list(mock_ids)
+        for cache in cls.instances:
+            cache.discard(mock_ids)
+
+
+# 编译结果缓存：静态响应（None 表示非静态）、占位符填充计划、请求体引用分析
+_compiled_cache = VersionedCache()
 
 
 class ResponseGenerator:
@@ -34,13 +153,15 @@ class ResponseGenerator:
         if mock_config.response_template:
             # 使用模板生成响应
             response_body = ResponseGenerator._render_template(
-                mock_config.response_template, request_data
+                mock_config.response_template,
+                request_data,
+                cache_key=(mock_config.id, mock_config.version),
             )
         elif mock_config.response_body:
-            # 使用静态响应体
-            response_body = ResponseGenerator._process_dynamic_fields(
-                mock_config.response_body, request_data
-            )
+            # 使用静态响应体，按预编译计划填充占位符
+            response_body = ResponseGenerator.get_placeholder_plan(
+                mock_config
+            ).render(request_data)
         else:
             # 默认响应
             response_body = {
@@ -51,35 +172,98 @@ class ResponseGenerator:
             }
 
         # 生成响应头
+        response_headers = ResponseGenerator.build_headers(mock_config)
+
+        return response_body, response_headers
+
+    @staticmethod
+    def get_static_response(mock_config) -> Optional[StaticResponse]:
+        """
+        获取预序列化的静态响应
+
+        仅包含静态响应体（无模板、无占位符）的Mock接口可以缓存，
+        按 (mock id, version) 缓存，版本变化后自动重建。
+
+        Returns:
+            Optional[StaticResponse]: 非静态Mock接口返回 None
+        """
+
+        def build() -> Optional[StaticResponse]:
+            if not ResponseGenerator.is_static(mock_config):
+                return None
+            return StaticResponse(
+                mock_config.response_body,
+                ResponseGenerator.build_headers(mock_config),
+                mock_config.response_headers,
+                pretty=bool(mock_config.pretty_json),
+            )
+
+        return _compiled_cache.get(mock_config, "static", build)
+
+    @staticmethod
+    def get_placeholder_plan(mock_config) -> PlaceholderPlan:
+        """获取响应体的占位符填充计划，按 (mock id, version) 缓存"""
+        return _compiled_cache.get(
+            mock_config,
+            "plan",
+            lambda: compile_placeholders(mock_config.response_body, fake),
+        )
+
+    @staticmethod
+    def uses_request_body(mock_config) -> bool:
+        """判断Mock接口的模板或占位符是否引用请求体，按 (mock id, version) 缓存"""
+
+        def analyze() -> bool:
+            if mock_config.response_template:
+                return template_uses_request_body(mock_config.response_template)
+            if mock_config.response_body:
+                return ResponseGenerator.get_placeholder_plan(mock_config).uses_body
+            return False
+
+        return _compiled_cache.get(mock_config, "uses_body", analyze)
+
+    @staticmethod
+    def is_static(mock_config) -> bool:
+        """判断Mock接口的响应是否完全静态（无模板且响应体不含占位符）"""
+        if mock_config.response_template or not mock_config.response_body:
+            return False
+        return ResponseGenerator.get_placeholder_plan(mock_config).is_static
+
+    @staticmethod
+    def build_headers(mock_config) -> Dict[str, str]:
+        """合并默认响应头与Mock接口配置的响应头"""
         response_headers = mock_config.response_headers or {}
         default_headers = {
             "Content-Type": "application/json",
             "X-Mock-Response": "true",
-            "X-Mock-Timestamp": datetime.now().isoformat(),
+            TIMESTAMP_HEADER: datetime.now().isoformat(),
         }
-        response_headers = {**default_headers, **response_headers}
-
-        return response_body, response_headers
+        return {**default_headers, **response_headers}
 
     @staticmethod
-    def _render_template(template_str: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        """渲染Jinja2模板"""
+    def _render_template(
+        template_str: str,
+        context: Dict[str, Any],
+        cache_key: Optional[Hashable] = None,
+    ) -> Dict[str, Any]:
+        """渲染Jinja2模板（编译结果按 cache_key 或内容哈希缓存）"""
         try:
             # 添加faker函数到模板上下文
             template_context = {
                 **context,
+                "request": context,
                 "fake": fake,
                 "now": datetime.now(),
                 "timestamp": datetime.now().isoformat(),
             }
 
-            template = Template(template_str)
+            template = template_cache.get(template_str, cache_key)
             rendered = template.render(**template_context)
 
             # 尝试解析为JSON
             try:
-                return json.loads(rendered)
-            except json.JSONDecodeError:
+                return json_codec.loads(rendered)
+            except ValueError:
                 return {"content": rendered}
 
         except Exception as e:
@@ -88,58 +272,3 @@ class ResponseGenerator:
                 "message": str(e),
                 "template": template_str,
             }
-
-    @staticmethod
-    def _process_dynamic_fields(
-        response_body: Dict[str, Any], request_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """处理响应体中的动态字段"""
-
-        def process_value(value):
-            if isinstance(value, str):
-                # 处理占位符
-                value = ResponseGenerator._replace_placeholders(value, request_data)
-            elif isinstance(value, dict):
-                # 递归处理字典
-                value = {k: process_value(v) for k, v in value.items()}
-            elif isinstance(value, list):
-                # 递归处理列表
-                value = [process_value(item) for item in value]
-
-            return value
-
-        return process_value(response_body)
-
-    @staticmethod
-    def _replace_placeholders(text: str, context: Dict[str, Any]) -> str:
-        """替换文本中的占位符"""
-
-        # 替换请求参数占位符 {{request.param_name}}
-        def replace_request_param(match):
-            param_name = match.group(1)
-            params = context.get("params", {})
-            return str(params.get(param_name, f"{{{{request.{param_name}}}}}"))
-
-        text = re.sub(r"\{\{request\.(\w+)\}\}", replace_request_param, text)
-
-        # 替换时间占位符
-        text = text.replace("{{now}}", datetime.now().isoformat())
-        text = text.replace("{{timestamp}}", str(int(datetime.now().timestamp())))
-
-        # 替换Faker占位符
-        faker_patterns = {
-            "{{fake.name}}": lambda: fake.name(),
-            "{{fake.email}}": lambda: fake.email(),
-            "{{fake.phone}}": lambda: fake.phone_number(),
-            "{{fake.address}}": lambda: fake.address(),
-            "{{fake.company}}": lambda: fake.company(),
-            "{{fake.uuid}}": lambda: fake.uuid4(),
-            "{{fake.number}}": lambda: str(fake.random_int(1, 1000)),
-            "{{fake.text}}": lambda: fake.text(max_nb_chars=100),
-        }
-
-        for pattern, generator in faker_patterns.items():
-            if pattern in text:
-                text = text.replace(pattern, generator())
-
-        return text
@@ -0,0 +1,319 @@
+"""
+条件响应规则引擎
+
+Mock接口可以配置一组有序规则，按查询参数、请求头、路径参数或请求体字段
+选择不同的响应，第一条满足全部条件的规则生效，没有规则命中时使用接口本身
+的响应配置。规则格式::
+
+    {
+        "name": "查询失败",
+        "conditions": [
+            {"source": "query", "key": "status", "op": "eq", "value": "failed"}
+        ],
+        "status_code": 500,
+        "response_headers": {...},
+        "response_body": {...},
+        "response_template": "..."
+    }
+
+规则按 (mock id, version) 编译为分派结构：含等值条件（eq / in）的规则按
+其第一个等值条件的 (来源, 字段) 编入哈希表，请求时每个字段只需一次查表；
+只有不含等值条件的复杂规则才顺序求值。规则增长到数百条时匹配代价基本不变。
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..core.json_codec import json_codec
+from .response_generator import ResponseGenerator, VersionedCache
+
+# 条件取值来源
+SOURCES = ("query", "header", "path", "body")
+
+# 支持的比较运算
+OPERATORS = (
+    "eq",
+    "ne",
+    "in",
+    "not_in",
+    "contains",
+    "regex",
+    "exists",
+    "not_exists",
+    "gt",
+    "gte",
+    "lt",
+    "lte",
+)
+
+# 可以编入哈希表的等值运算
+INDEXED_OPERATORS = ("eq", "in")
+
+_MISSING = object()
+
+
+def canonical(value: Any) -> str:
+    """把条件值与请求值统一为字符串比较（查询参数与请求头本身就是字符串）"""
+    if isinstance(value, str):
+        return value
+    return json_codec.dumps(value).decode("utf-8")
+
+
+def _extract(source: str, key: str, request_data: Dict[str, Any]) -> Any:
+    """从请求数据中取条件字段的值，不存在时返回 _MISSING"""
+    if source == "query":
+        return (request_data.get("params") or {}).get(key, _MISSING)
+    if source == "header":
+        return (request_data.get("headers") or {}).get(key.lower(), _MISSING)
+    if source == "path":
+        return (request_data.get("path_params") or {}).get(key, _MISSING)
+
+    value = request_data.get("body")
+    for part in key.split("."):
+        if isinstance(value, dict) and part in value:
+            value = value[part]
+        elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        else:
+            return _MISSING
+    return value
+
+
+def _to_number(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _compare(op: str, expected: Any) -> Callable[[Any], bool]:
+    """生成比较函数，参数为请求中的实际值（可能为 _MISSING）"""
+    if op == "exists":
+        return lambda actual: actual is not _MISSING
+    if op == "not_exists":
+        return lambda actual: actual is _MISSING
+
+    if op in ("eq", "ne"):
+        target = canonical(expected)
+        if op == "eq":
+            return lambda actual: (
+                actual is not _MISSING and canonical(actual) == target
+            )
+        return lambda actual: actual is _MISSING or canonical(actual) != target
+
+    if op in ("in", "not_in"):
+        if not isinstance(expected, list):
+            raise ValueError(f"{op} 条件的值必须是列表")
+        targets = {canonical(item) for item in expected}
+        if op == "in":
+            return lambda actual: (
+                actual is not _MISSING and canonical(actual) in targets
+            )
+        return lambda actual: (
+            actual is _MISSING or canonical(actual) not in targets
+        )
+
+    if op == "contains":
+        target = canonical(expected)
+
+        def contains(actual: Any) -> bool:
+            if isinstance(actual, list):
+                return any(canonical(item) == target for item in actual)
+            if isinstance(actual, dict):
+                return target in actual
+            return actual is not _MISSING and target in canonical(actual)
+
+        return contains
+
+    if op == "regex":
+        try:
+            pattern = re.compile(str(expected))
+        except re.error as e:
+            raise ValueError(f"正则表达式无效: {e}")
+        return lambda actual: (
+            actual is not _MISSING and pattern.search(canonical(actual)) is not None
+        )
+
+    if op in ("gt", "gte", "lt", "lte"):
+        bound = _to_number(expected)
+        if bound is None:
+            raise ValueError(f"{op} 条件的值必须是数字")
+        check = {
+            "gt": lambda number: number > bound,
+            "gte": lambda number: number >= bound,
+            "lt": lambda number: number < bound,
+            "lte": lambda number: number <= bound,
+        }[op]
+
+        def numeric(actual: Any) -> bool:
+            number = _to_number(actual) if actual is not _MISSING else None
+            return number is not None and check(number)
+
+        return numeric
+
+    raise ValueError(f"不支持的条件运算: {op}")
+
+
+class RuleCondition:
+    """编译后的规则条件"""
+
+    __slots__ = ("source", "key", "op", "value", "_test")
+
+    def __init__(self, source: str, key: str, op: str = "eq", value: Any = None):
+        if source not in SOURCES:
+            raise ValueError(f"不支持的条件来源: {source}")
+        self.source = source
+        self.key = key
+        self.op = op
+        self.value = value
+        self._test = _compare(op, value)
+
+    def matches(self, request_data: Dict[str, Any]) -> bool:
+        return self._test(_extract(self.source, self.key, request_data))
+
+
+class ResponseOverride:
+    """
+    派生自Mock接口的响应配置（条件规则、加权变体共用）
+
+    可直接作为 ResponseGenerator 的响应配置使用：未配置的字段继承Mock接口，
+    id 为 (mock id, 类型, 序号)，使派生响应拥有独立的编译缓存。
+    """
+
+    __slots__ = (
+        "id",
+        "version",
+        "index",
+        "name",
+        "status_code",
+        "response_headers",
+        "response_body",
+        "response_template",
+        "pretty_json",
+    )
+
+    kind = "override"
+
+    def __init__(self, mock_config, index: int, config: Dict[str, Any]):
+        self.id = (mock_config.id, self.kind, index)
+        self.version = mock_config.version
+        self.index = index
+        self.name = config.get("name")
+
+        self.status_code = config.get("status_code") or mock_config.status_code
+        headers = {
+            **(mock_config.response_headers or {}),
+            **(config.get("response_headers") or {}),
+        }
+        self.response_headers = headers or None
+        if config.get("response_body") is not None or config.get("response_template"):
+            self.response_body = config.get("response_body")
+            self.response_template = config.get("response_template")
+        else:
+            self.response_body = mock_config.response_body
+            self.response_template = mock_config.response_template
+        self.pretty_json = mock_config.pretty_json
+
+
+class ResponseRule(ResponseOverride):
+    """编译后的条件响应规则"""
+
+    __slots__ = ("conditions",)
+
+    kind = "rule"
+
+    def __init__(self, mock_config, index: int, rule: Dict[str, Any]):
+        super().__init__(mock_config, index, rule)
+        self.conditions = [
+            RuleCondition(
+                item.get("source"),
+                item.get("key"),
+                item.get("op", "eq"),
+                item.get("value"),
+            )
+            for item in rule.get("conditions") or []
+        ]
+
+    def matches(self, request_data: Dict[str, Any]) -> bool:
+        return all(condition.matches(request_data) for condition in self.conditions)
+
+
+class RuleSet:
+    """Mock接口的规则分派结构"""
+
+    def __init__(self, mock_config):
+        self.rules = [
+            ResponseRule(mock_config, index, rule)
+            for index, rule in enumerate(mock_config.response_rules or [])
+        ]
+        # (来源, 字段) -> 条件值 -> 规则序号（升序）
+        self._index: Dict[Tuple[str, str], Dict[str, List[int]]] = {}
+        # 不含等值条件、需要顺序求值的规则序号
+        self._sequential: List[int] = []
+
+        for rule in self.rules:
+            condition = next(
+                (item for item in rule.conditions if item.op in INDEXED_OPERATORS),
+                None,
+            )
+            if condition is None:
+                self._sequential.append(rule.index)
+                continue
+
+            values = condition.value if condition.op == "in" else [condition.value]
+            table = self._index.setdefault((condition.source, condition.key), {})
+            for value in values:
+                table.setdefault(canonical(value), []).append(rule.index)
+
+        # 条件或规则响应引用了请求体时，代理需要解析请求体
+        self.uses_body = any(
+            condition.source == "body"
+            for rule in self.rules
+            for condition in rule.conditions
+        ) or any(ResponseGenerator.uses_request_body(rule) for rule in self.rules)
+
+    def select(self, request_data: Dict[str, Any]) -> Optional[ResponseRule]:
+        """返回第一条满足全部条件的规则，没有规则命中时返回 None"""
+        best = len(self.rules)
+
+        for (source, key), table in self._index.items():
+            value = _extract(source, key, request_data)
+            if value is _MISSING:
+                continue
+            for index in table.get(canonical(value), ()):
+                if index >= best:
+                    break
+                if self.rules[index].matches(request_data):
+                    best = index
+                    break
+
+        for index in self._sequential:
+            if index >= best:
+                break
+            if self.rules[index].matches(request_data):
+                best = index
+                break
+
+        return self.rules[best] if best < len(self.rules) else None
+
+
+# 编译后的规则集缓存
+_rule_sets = VersionedCache()
+
+
+def get_rule_set(mock_config) -> Optional[RuleSet]:
+    """
+    获取Mock接口编译后的规则集，按 (mock id, version) 缓存
+
+    未配置规则，或历史数据中的规则无法编译时返回 None（使用接口本身的响应）。
+    """
+    if not mock_config.response_rules:
+        return None
+
+    def build() -> Optional[RuleSet]:
+        try:
+            return RuleSet(mock_config)
+        except (TypeError, ValueError, AttributeError):
+            return None
+
+    return _rule_sets.get(mock_config, "rules", build)
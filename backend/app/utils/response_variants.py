@@ -0,0 +1,108 @@
+"""
+加权响应变体
+
+Mock接口可以配置多个按权重随机返回的响应变体（如 95% 成功、4% 500、
+1% 超时），用于在压测中检验客户端的容错能力。变体按 (mock id, version)
+预先构建别名表（Vose alias method），每次请求只需一次随机数与一次查表，
+选择代价与变体数量无关。配置了 variant_seed 时使用固定种子，同一进程内
+可以复现相同的选择序列。
+"""
+
+import random
+from typing import Any, Dict, List, Optional
+
+from .response_generator import ResponseGenerator, VersionedCache
+from .response_rules import ResponseOverride
+
+
+class ResponseVariant(ResponseOverride):
+    """加权响应变体"""
+
+    __slots__ = ("weight", "latency_ms")
+
+    kind = "variant"
+
+    def __init__(self, mock_config, index: int, variant: Dict[str, Any]):
+        super().__init__(mock_config, index, variant)
+        self.weight = float(variant.get("weight", 1))
+        # 变体自身的固定延迟（如模拟超时），为空时沿用Mock接口的延迟配置
+        self.latency_ms = variant.get("latency_ms")
+
+    @property
+    def label(self) -> str:
+        """日志中记录的变体标识"""
+        return self.name or f"#{self.index}"
+
+
+class AliasTable:
+    """Vose别名表：O(n) 构建，O(1) 按权重抽样"""
+
+    def __init__(self, weights: List[float]):
+        count = len(weights)
+        total = sum(weights)
+        if count == 0 or total <= 0:
+            raise ValueError("变体权重之和必须大于0")
+
+        scaled = [weight * count / total for weight in weights]
+        self.probability = [1.0] * count
+        self.alias = list(range(count))
+
+        small = [index for index, value in enumerate(scaled) if value < 1]
+        large = [index for index, value in enumerate(scaled) if value >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+        # 剩余项受浮点误差影响，概率均视为1
+
+    def sample(self, rng) -> int:
+        """抽取一个下标"""
+        point = rng.random() * len(self.probability)
+        index = int(point)
+        if point - index < self.probability[index]:
+            return index
+        return self.alias[index]
+
+
+class VariantSet:
+    """Mock接口的加权变体集合"""
+
+    def __init__(self, mock_config):
+        self.variants = [
+            ResponseVariant(mock_config, index, variant)
+            for index, variant in enumerate(mock_config.response_variants or [])
+        ]
+        self.table = AliasTable([variant.weight for variant in self.variants])
+        seed = mock_config.variant_seed
+        self.rng = random.Random(seed) if seed is not None else random
+        self.uses_body = any(
+            ResponseGenerator.uses_request_body(variant) for variant in self.variants
+        )
+
+    def select(self) -> ResponseVariant:
+        """按权重随机选择一个变体"""
+        return self.variants[self.table.sample(self.rng)]
+
+
+# 构建后的变体集合缓存
+_variant_sets = VersionedCache()
+
+
+def get_variant_set(mock_config) -> Optional[VariantSet]:
+    """
+    获取Mock接口的加权变体集合，按 (mock id, version) 缓存
+
+    未配置变体，或历史数据中的变体无法构建时返回 None（使用接口本身的响应）。
+    """
+    if not mock_config.response_variants:
+        return None
+
+    def build() -> Optional[VariantSet]:
+        try:
+            return VariantSet(mock_config)
+        except (TypeError, ValueError, AttributeError):
+            return None
+
+    return _variant_sets.get(mock_config, "variants", build)
@@ -0,0 +1,270 @@
+"""
+路径匹配基数树
+
+按路径段组织的基数树，每个HTTP方法一棵。支持的路径语法：
+
+- 静态段：``/users/list``
+- 路径参数：``/users/{id}``，匹配任意非空路径段
+- 正则段：``/orders/{order_id:\\d+}``，整段需完全匹配正则
+- 通配符：``/files/*`` 或 ``/files/{rest:*}``，只能出现在末尾，匹配剩余的全部路径，
+  分别捕获为 ``wildcard`` 和 ``rest``
+
+匹配优先级：静态段 > 正则段 > 路径参数 > 通配符，查找代价只与路径深度相关。
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+_PARAM_RE = re.compile(r"^\{(\w+)(?::(.+))?\}$")
+
+WILDCARD = "*"
+# 匿名通配符捕获的路径参数名
+WILDCARD_PARAM = "wildcard"
+
+
+class PathSegment:
+    """编译后的路径段"""
+
+    __slots__ = ("kind", "value", "name", "pattern")
+
+    STATIC = "static"
+    REGEX = "regex"
+    PARAM = "param"
+    WILDCARD = "wildcard"
+
+    def __init__(
+        self,
+        kind: str,
+        value: str,
+        name: Optional[str] = None,
+        pattern: Optional[Pattern] = None,
+    ):
+        self.kind = kind
+        self.value = value
+        self.name = name
+        self.pattern = pattern
+
+
+def is_dynamic_path(path: str) -> bool:
+    """判断路径是否包含参数、正则或通配符"""
+    return any(
+        segment == WILDCARD or _PARAM_RE.match(segment)
+        for segment in path.split("/")
+    )
+
+
+def compile_path(path: str) -> List[PathSegment]:
+    """
+    编译路径模式
+
+    Raises:
+        ValueError: 路径语法不合法（正则错误、通配符不在末尾、参数重名）
+    """
+    segments = []
+    names = set()
+    parts = path.split("/")[1:]
+
+    for index, part in enumerate(parts):
+        match = _PARAM_RE.match(part)
+        if part == WILDCARD:
+            name, regex = WILDCARD_PARAM, WILDCARD
+        elif match:
+            name, regex = match.group(1), match.group(2)
+        else:
+            segments.append(PathSegment(PathSegment.STATIC, part))
+            continue
+
+        if name in names:
+            raise ValueError(f"路径参数重复: {name}")
+        names.add(name)
+
+        if regex == WILDCARD:
+            if index != len(parts) - 1:
+                raise ValueError(f"通配符 * 只能出现在路径末尾: {path}")
+            segments.append(PathSegment(PathSegment.WILDCARD, part, name=name))
+        elif regex is None:
+            segments.append(PathSegment(PathSegment.PARAM, part, name=name))
+        else:
+            try:
+                pattern = re.compile(regex)
+            except re.error as e:
+                raise ValueError(f"路径参数 {name} 的正则表达式无效: {e}")
+            segments.append(
+                PathSegment(PathSegment.REGEX, regex, name=name, pattern=pattern)
+            )
+
+    return segments
+
+
+def route_shape(path: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    路径模式的匹配形状：忽略参数名，只保留段类型与静态值 / 正则
+
+    ``/users/{id}`` 与 ``/users/{userId}`` 的形状相同，在路由树中落在同一节点。
+
+    Raises:
+        ValueError: 路径语法不合法
+    """
+    return tuple(
+        (
+            segment.kind,
+            segment.value
+            if segment.kind in (PathSegment.STATIC, PathSegment.REGEX)
+            else "",
+        )
+        for segment in compile_path(path)
+    )
+
+
+class _Node:
+    """基数树节点"""
+
+    __slots__ = ("static", "regex", "param", "wildcard", "routes")
+
+    def __init__(self):
+        self.static: Dict[str, "_Node"] = {}
+        self.regex: List[Tuple[str, Pattern, "_Node"]] = []
+        self.param: Optional["_Node"] = None
+        self.wildcard: Optional["_Node"] = None
+        # 终止于该节点的路由：(参数名列表, 路由值)，按值的id升序
+        self.routes: List[Tuple[List[str], Any]] = []
+
+    def is_empty(self) -> bool:
+        return not (
+            self.static or self.regex or self.param or self.wildcard or self.routes
+        )
+
+
+class RouteTrie:
+    """
+    单个HTTP方法的路由基数树
+
+    路由值需要提供 ``id`` 属性，同一路径模式下按 ``id`` 升序优先。
+    写操作由调用方加锁，读操作无锁：查找时会遍历的列表均整体替换而非原地修改。
+    """
+
+    def __init__(self):
+        self._root = _Node()
+
+    def insert(self, path: str, value: Any) -> None:
+        """插入路由"""
+        segments = compile_path(path)
+        node = self._root
+        for segment in segments:
+            node = self._child(node, segment, create=True)
+
+        names = [segment.name for segment in segments if segment.name]
+        routes = [*node.routes, (names, value)]
+        routes.sort(key=lambda item: item[1].id)
+        node.routes = routes
+
+    def remove(self, path: str, value_id: int) -> None:
+        """删除路由"""
+        segments = compile_path(path)
+        trail = [self._root]
+        for segment in segments:
+            child = self._child(trail[-1], segment, create=False)
+            if child is None:
+                return
+            trail.append(child)
+
+        node = trail[-1]
+        node.routes = [item for item in node.routes if item[1].id != value_id]
+
+        # 自底向上清理空节点
+        for parent, segment, child in zip(
+            reversed(trail[:-1]), reversed(segments), reversed(trail[1:])
+        ):
+            if not child.is_empty():
+                break
+            self._detach(parent, segment)
+
+    def match(self, path: str) -> Optional[Tuple[Any, Dict[str, str]]]:
+        """查找匹配的路由，返回 (路由值, 路径参数)"""
+        parts = path.split("/")[1:]
+        captured: List[str] = []
+        result = self._match(self._root, parts, 0, captured)
+        if result is None:
+            return None
+
+        names, value = result
+        return value, dict(zip(names, captured))
+
+    def _match(
+        self, node: _Node, parts: List[str], index: int, captured: List[str]
+    ) -> Optional[Tuple[List[str], Any]]:
+        if index == len(parts):
+            if node.routes:
+                return node.routes[0]
+            # 通配符允许匹配空的剩余路径
+            if node.wildcard is not None and node.wildcard.routes:
+                captured.append("")
+                return node.wildcard.routes[0]
+            return None
+
+        part = parts[index]
+
+        child = node.static.get(part)
+        if child is not None:
+            result = self._match(child, parts, index + 1, captured)
+            if result is not None:
+                return result
+
+        if part:
+            for _, pattern, child in node.regex:
+                if pattern.fullmatch(part):
+                    captured.append(part)
+                    result = self._match(child, parts, index + 1, captured)
+                    if result is not None:
+                        return result
+                    captured.pop()
+
+            if node.param is not None:
+                captured.append(part)
+                result = self._match(node.param, parts, index + 1, captured)
+                if result is not None:
+                    return result
+                captured.pop()
+
+        if node.wildcard is not None and node.wildcard.routes:
+            captured.append("/".join(parts[index:]))
+            return node.wildcard.routes[0]
+
+        return None
+
+    @staticmethod
+    def _child(node: _Node, segment: PathSegment, create: bool) -> Optional[_Node]:
+        if segment.kind == PathSegment.STATIC:
+            child = node.static.get(segment.value)
+            if child is None and create:
+                child = _Node()
+                node.static[segment.value] = child
+            return child
+
+        if segment.kind == PathSegment.REGEX:
+            for regex, _, child in node.regex:
+                if regex == segment.value:
+                    return child
+            if not create:
+                return None
+            child = _Node()
+            node.regex = [*node.regex, (segment.value, segment.pattern, child)]
+            return child
+
+        attr = "param" if segment.kind == PathSegment.PARAM else "wildcard"
+        child = getattr(node, attr)
+        if child is None and create:
+            child = _Node()
+            setattr(node, attr, child)
+        return child
+
+    @staticmethod
+    def _detach(node: _Node, segment: PathSegment) -> None:
+        if segment.kind == PathSegment.STATIC:
+            node.static.pop(segment.value, None)
+        elif segment.kind == PathSegment.REGEX:
+            node.regex = [item for item in node.regex if item[0] != segment.value]
+        elif segment.kind == PathSegment.PARAM:
+            node.param = None
+        else:
+            node.wildcard = None
@@ -0,0 +1,114 @@
+"""
+Jinja2模板编译缓存
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from jinja2 import Template, meta, nodes
+from jinja2.sandbox import SandboxedEnvironment
+
+from ..core.config import settings
+
+# 全局共享的沙箱模板环境，禁止模板访问下划线属性等不安全操作
+template_env = SandboxedEnvironment()
+
+
+class TemplateCache:
+    """编译后Jinja2模板的LRU缓存"""
+
+    def __init__(self, environment: SandboxedEnvironment, max_size: int):
+        self.environment = environment
+        self.max_size = max_size
+        self._templates: "OrderedDict[Hashable, Template]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, source: str, key: Optional[Hashable] = None) -> Template:
+        """
+        获取编译后的模板
+
+        Args:
+            source: 模板源码
+            key: 缓存键，如 (mock id, version)；为空时使用源码的内容哈希
+        """
+        if key is None:
+            key = hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+                return template
+            self.misses += 1
+
+        # 编译在锁外进行，编译失败时抛出 TemplateSyntaxError
+        template = self.environment.from_string(source)
+
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.max_size:
+                self._templates.popitem(last=False)
+
+        return template
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._templates.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """获取缓存统计信息"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._templates),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total * 100, 2) if total else 0.0,
+        }
+
+
+def template_uses_request_body(source: str) -> bool:
+    """
+    静态分析模板是否引用请求体
+
+    引用 ``body``、``request.body`` / ``request["body"]``，或把 ``request``
+    整体传递使用时视为引用；模板语法错误时保守地返回 True。
+    """
+    try:
+        ast = template_env.parse(source)
+    except Exception:
+        return True
+
+    if "body" in meta.find_undeclared_variables(ast):
+        return True
+
+    # 只通过非 body 属性访问的 request 不需要请求体
+    safe_names = set()
+    for node in ast.find_all((nodes.Getattr, nodes.Getitem)):
+        target = node.node
+        if not isinstance(target, nodes.Name) or target.name != "request":
+            continue
+        if isinstance(node, nodes.Getattr):
+            key = node.attr
+        elif isinstance(node.arg, nodes.Const):
+            key = node.arg.value
+        else:
+            continue
+        if key != "body":
+            safe_names.add(id(target))
+
+    return any(
+        node.name == "request" and id(node) not in safe_names
+        for node in ast.find_all(nodes.Name)
+    )
+
+
+# 全局模板缓存实例
+template_cache = TemplateCache(template_env, settings.TEMPLATE_CACHE_SIZE)
@@ -0,0 +1,29 @@
+"""
+游标编码与解析测试
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 5, 1, 12, 30)
+    cursor = encode_cursor("mocks", [created_at, 42])
+    assert "=" not in cursor
+    assert decode_cursor("mocks", cursor, 2) == [created_at.isoformat(), 42]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-base64!",
+        encode_cursor("logs", [1]),
+        encode_cursor("mocks", [1, 2, 3]),
+    ],
+)
+def test_invalid_cursor(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor("mocks", cursor, 2)
@@ -0,0 +1,30 @@
+"""
+变体加权抽样（别名表）测试
+"""
+
+import random
+from collections import Counter
+
+import pytest
+
+from app.utils.response_variants import AliasTable
+
+
+def test_alias_table_follows_weights():
+    table = AliasTable([1, 2, 0, 7])
+    rng = random.Random(0)
+    counts = Counter(table.sample(rng) for _ in range(20000))
+    assert counts[2] == 0
+    for index, weight in enumerate([0.1, 0.2, 0.0, 0.7]):
+        assert counts[index] / 20000 == pytest.approx(weight, abs=0.02)
+
+
+def test_alias_table_single_variant():
+    table = AliasTable([3])
+    assert {table.sample(random.Random(seed)) for seed in range(10)} == {0}
+
+
+@pytest.mark.parametrize("weights", [[], [0, 0]])
+def test_alias_table_rejects_zero_total(weights):
+    with pytest.raises(ValueError):
+        AliasTable(weights)
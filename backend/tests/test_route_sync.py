@@ -0,0 +1,137 @@
+"""
+路由表跨进程同步测试：变更序号空洞（事务乱序提交）的跟踪与重读
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.models.mock import HTTPMethod, MockAPI
+from app.services import route_sync
+from app.services.route_table import RouteTable
+
+
+class ChangeLog:
+    """内存中的 route_changes / mock_apis，只包含“已提交”的数据"""
+
+    def __init__(self):
+        self.changes = {}
+        self.mocks = {}
+
+    def commit(self, seq, mock_id, path=None, is_active=True):
+        """提交一条变更（path 为空表示接口已删除）"""
+        self.changes[seq] = SimpleNamespace(id=seq, mock_api_id=mock_id)
+        if path is None:
+            self.mocks.pop(mock_id, None)
+        else:
+            version = self.mocks[mock_id].version + 1 if mock_id in self.mocks else 1
+            self.mocks[mock_id] = MockAPI(
+                id=mock_id,
+                name=f"m{mock_id}",
+                method=HTTPMethod.GET,
+                path=path,
+                is_active=is_active,
+                version=version,
+            )
+
+    async def get_change_seq_range(self, db):
+        if not self.changes:
+            return None, None
+        return min(self.changes), max(self.changes)
+
+    async def get_route_change_seqs(self, db, after_seq):
+        return [seq for seq in self.changes if seq > after_seq]
+
+    async def get_route_changes(self, db, after_seq, missing_seqs=()):
+        missing = set(missing_seqs)
+        return [
+            change
+            for seq, change in sorted(self.changes.items())
+            if seq > after_seq or seq in missing
+        ]
+
+    async def get_mocks_by_ids(self, db, mock_ids):
+        return [self.mocks[mock_id] for mock_id in mock_ids if mock_id in self.mocks]
+
+    async def get_active_mocks(self, db):
+        return [mock for mock in self.mocks.values() if mock.is_active]
+
+
+@pytest.fixture
+def table(monkeypatch):
+    table = RouteTable()
+    monkeypatch.setattr(route_sync, "route_table", table)
+    return table
+
+
+@pytest.fixture
+def changes(monkeypatch):
+    changes = ChangeLog()
+    monkeypatch.setattr(route_sync, "AsyncMockService", changes)
+    return changes
+
+
+def sync():
+    return asyncio.run(route_sync.sync_route_table(None))
+
+
+def test_track_gaps_records_unseen_seqs(table):
+    route_sync._track_gaps(2, 6, [3, 6])
+    assert set(table.seq_gaps) == {4, 5}
+
+    route_sync._track_gaps(6, 6, [4])
+    assert set(table.seq_gaps) == {5}
+
+
+def test_track_gaps_expires_after_timeout(table, monkeypatch):
+    route_sync._track_gaps(0, 3, [3])
+    assert set(table.seq_gaps) == {1, 2}
+
+    monkeypatch.setattr(settings, "ROUTE_SYNC_GAP_TIMEOUT", -1.0)
+    route_sync._track_gaps(3, 3, [])
+    assert table.seq_gaps == {}
+
+
+def test_track_gaps_is_bounded(table, monkeypatch):
+    monkeypatch.setattr(settings, "ROUTE_SYNC_MAX_GAPS", 3)
+    route_sync._track_gaps(0, 100, [100])
+    # 只跟踪最靠近最大序号的空洞
+    assert set(table.seq_gaps) == {97, 98, 99}
+
+
+def test_sync_applies_change_committed_out_of_order(table, changes):
+    changes.commit(1, mock_id=1, path="/a")
+    assert sync() == 1
+    assert table.match("GET", "/a") is not None
+
+    # 序号 2 的事务先分配ID但晚于序号 3 提交
+    changes.commit(3, mock_id=3, path="/c")
+    assert sync() == 1
+    assert table.change_seq == 3
+    assert set(table.seq_gaps) == {2}
+
+    changes.commit(2, mock_id=2, path="/b/{id}")
+    assert sync() == 1
+    assert table.match("GET", "/b/7")[1] == {"id": "7"}
+    assert table.seq_gaps == {}
+
+
+def test_sync_removes_deleted_and_deactivated_mocks(table, changes):
+    changes.commit(1, mock_id=1, path="/a")
+    changes.commit(2, mock_id=2, path="/b")
+    sync()
+
+    changes.commit(3, mock_id=1, path=None)
+    changes.commit(4, mock_id=2, path="/b", is_active=False)
+    assert sync() == 2
+    assert len(table) == 0
+
+
+def test_load_seeds_gaps_below_max_seq(table, changes):
+    changes.commit(1, mock_id=1, path="/a")
+    changes.commit(3, mock_id=3, path="/c")
+    assert sync() == 2
+    assert table.change_seq == 3
+    assert set(table.seq_gaps) == {2}
@@ -0,0 +1,147 @@
+"""
+路径匹配基数树与路由表测试
+"""
+
+import pytest
+
+from app.models.mock import HTTPMethod, MockAPI
+from app.services.route_table import RouteTable
+from app.utils.route_trie import (
+    RouteTrie,
+    compile_path,
+    is_dynamic_path,
+    route_shape,
+)
+
+
+class Route:
+    def __init__(self, id):
+        self.id = id
+
+
+def build(*paths):
+    trie = RouteTrie()
+    for index, path in enumerate(paths, 1):
+        trie.insert(path, Route(index))
+    return trie
+
+
+def matched(trie, path):
+    result = trie.match(path)
+    if result is None:
+        return None
+    return result[0].id, result[1]
+
+
+def test_path_param():
+    trie = build("/users/{id}")
+    assert matched(trie, "/users/42") == (1, {"id": "42"})
+    assert matched(trie, "/users/") is None
+    assert matched(trie, "/users/42/orders") is None
+
+
+def test_regex_segment_must_fully_match():
+    trie = build(r"/orders/{order_id:\d+}")
+    assert matched(trie, "/orders/123") == (1, {"order_id": "123"})
+    assert matched(trie, "/orders/12a") is None
+
+
+def test_wildcard_captures_rest_of_path():
+    trie = build("/files/*", "/docs/{rest:*}")
+    assert matched(trie, "/files/a/b.txt") == (1, {"wildcard": "a/b.txt"})
+    assert matched(trie, "/files") == (1, {"wildcard": ""})
+    assert matched(trie, "/docs/x/y") == (2, {"rest": "x/y"})
+
+
+def test_priority_static_regex_param_wildcard():
+    trie = build("/u/*", "/u/{name}", r"/u/{id:\d+}", "/u/me")
+    assert matched(trie, "/u/me")[0] == 4
+    assert matched(trie, "/u/7")[0] == 3
+    assert matched(trie, "/u/bob")[0] == 2
+    assert matched(trie, "/u/a/b")[0] == 1
+
+
+def test_backtracks_to_less_specific_branch():
+    trie = build("/a/b/c", "/a/{x}/d")
+    assert matched(trie, "/a/b/d") == (2, {"x": "b"})
+
+
+def test_same_pattern_prefers_lowest_id():
+    trie = RouteTrie()
+    trie.insert("/p/{id}", Route(5))
+    trie.insert("/p/{key}", Route(3))
+    assert matched(trie, "/p/1") == (3, {"key": "1"})
+
+
+def test_remove_prunes_empty_nodes():
+    trie = build("/a/{x}/b", "/a/{x}")
+    trie.remove("/a/{x}/b", 1)
+    assert matched(trie, "/a/1/b") is None
+    assert matched(trie, "/a/1") == (2, {"x": "1"})
+    trie.remove("/a/{x}", 2)
+    assert trie._root.is_empty()
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["/x/*/y", "/x/{rest:*}/y", "/x/{id}/{id}", "/x/{id:[}", "/x/{wildcard}/*"],
+)
+def test_invalid_patterns(path):
+    with pytest.raises(ValueError):
+        compile_path(path)
+
+
+def test_is_dynamic_path():
+    assert not is_dynamic_path("/users/list")
+    assert is_dynamic_path("/users/{id}")
+    assert is_dynamic_path("/files/*")
+
+
+def test_route_shape_ignores_param_names():
+    assert route_shape("/users/{id}") == route_shape("/users/{userId}")
+    assert route_shape("/f/*") == route_shape("/f/{rest:*}")
+    assert route_shape(r"/o/{a:\d+}") != route_shape("/o/{a}")
+    assert route_shape("/a") != route_shape("/b")
+
+
+def mock(id, path, method=HTTPMethod.GET, is_active=True, version=1):
+    return MockAPI(
+        id=id,
+        name=f"m{id}",
+        method=method,
+        path=path,
+        is_active=is_active,
+        version=version,
+    )
+
+
+def test_route_table_static_and_dynamic():
+    table = RouteTable()
+    table.replace_all([mock(1, "/s"), mock(2, "/d/{id}")], change_seq=0)
+    assert table.match("GET", "/s")[0].id == 1
+    assert table.match("GET", "/d/9")[1] == {"id": "9"}
+    assert table.match("POST", "/s") is None
+
+
+def test_route_table_upsert_and_remove_notify_listeners():
+    table = RouteTable()
+    removed = []
+    table.add_remove_listener(removed.extend)
+    table.replace_all([mock(1, "/a"), mock(2, "/b/{id}")], change_seq=0)
+
+    table.upsert(mock(1, "/a", is_active=False, version=2))
+    assert table.match("GET", "/a") is None
+    table.remove(2)
+    assert table.match("GET", "/b/1") is None
+    assert removed == [1, 2]
+
+
+def test_route_table_skips_uncompilable_path():
+    table = RouteTable()
+    removed = []
+    table.add_remove_listener(removed.extend)
+    table.upsert(mock(1, "/ok/{id}"))
+    table.upsert(mock(1, "/bad/*/x", version=2))
+    assert len(table) == 0
+    assert table.match("GET", "/ok/1") is None
+    assert removed == [1]
@@ -16,11 +16,18 @@ export function useLogs() {
   const logs = ref<RequestLog[]>([])
   const currentLog = ref<RequestLog | null>(null)
   const stats = ref<LogStats | null>(null)
-  const pagination = reactive({
+  const pagination = reactive<{
+    total: number | null
+    page: number
+    size: number
+    pages: number | null
+    has_more: boolean
+  }>({
     total: 0,
     page: 1,
     size: 20,
-    pages: 0
+    pages: 0,
+    has_more: false
   })
 
   // 查询参数
@@ -46,10 +53,12 @@ export function useLogs() {
       const result = await logApi.list(queryParams)
       
       logs.value = result.items
+      // 不统计总数或游标翻页时 total / pages / page 为 null
       pagination.total = result.total
-      pagination.page = result.page
+      pagination.page = result.page ?? queryParams.page ?? 1
       pagination.size = result.size
       pagination.pages = result.pages
+      pagination.has_more = result.next_cursor !== null
       
       return result
     } catch (err: any) {
@@ -115,6 +124,7 @@ export function useLogs() {
       pagination.total = 0
       pagination.page = 1
       pagination.pages = 0
+      pagination.has_more = false
       
       // 刷新统计信息
       await fetchStats()
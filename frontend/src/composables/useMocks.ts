@@ -17,11 +17,18 @@ export function useMocks() {
   const error = ref<string | null>(null)
   const mocks = ref<MockAPI[]>([])
   const currentMock = ref<MockAPI | null>(null)
-  const pagination = reactive({
+  const pagination = reactive<{
+    total: number | null
+    page: number
+    size: number
+    pages: number | null
+    has_more: boolean
+  }>({
     total: 0,
     page: 1,
     size: 10,
-    pages: 0
+    pages: 0,
+    has_more: false
   })
 
   // 查询参数
@@ -58,10 +65,12 @@ export function useMocks() {
       const result = await mockApi.list(queryParams)
 
       mocks.value = result.items
+      // 不统计总数或游标翻页时 total / pages / page 为 null
       pagination.total = result.total
-      pagination.page = result.page
+      pagination.page = result.page ?? queryParams.page ?? 1
       pagination.size = result.size
       pagination.pages = result.pages
+      pagination.has_more = result.next_cursor !== null
 
       return result
     } catch (err: any) {
@@ -167,7 +176,9 @@ export function useMocks() {
 
       // 从本地数据中移除
       mocks.value = mocks.value.filter(mock => mock.id !== id)
-      pagination.total -= 1
+      if (pagination.total !== null) {
+        pagination.total -= 1
+      }
 
       if (currentMock.value?.id === id) {
         currentMock.value = null
@@ -21,10 +21,12 @@ export interface RequestLog {
 
 export interface RequestLogList {
   items: RequestLog[]
-  total: number
-  page: number
+  total: number | null
+  page: number | null
   size: number
-  pages: number
+  pages: number | null
+  total_estimated: boolean
+  next_cursor: string | null
 }
 
 export interface LogStats {
@@ -44,6 +46,8 @@ export interface LogStats {
 export interface LogQuery {
   page?: number
   size?: number
+  cursor?: string
+  count?: 'exact' | 'estimated' | 'none'
   mock_api_id?: number
   method?: string
   status_code?: number
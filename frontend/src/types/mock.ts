@@ -49,15 +49,19 @@ export interface MockAPIUpdate {
 
 export interface MockAPIList {
   items: MockAPI[]
-  total: number
-  page: number
+  total: number | null
+  page: number | null
   size: number
-  pages: number
+  pages: number | null
+  total_estimated: boolean
+  next_cursor: string | null
 }
 
 export interface MockAPIQuery {
   page?: number
   size?: number
+  cursor?: string
+  count?: 'exact' | 'estimated' | 'none'
   is_active?: boolean
   method?: HTTPMethod
   search?: string